@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the precompiled article classifier.
+
+Compares the module-level score_article_links / score_article_page against the
+previous per-call implementations on a synthetic homepage with thousands of links.
+
+Usage:
+  python benchmark_classifier.py
+  python benchmark_classifier.py --links 5000 --repeat 20
+"""
+
+import argparse
+import random
+import re
+import time
+from urllib.parse import urljoin, urlparse
+
+from ultimate_scraper_v2 import score_article_links, score_article_page, ARTICLE_SCORE_THRESHOLD
+
+
+def legacy_suggest_article_links(homepage_url, links):
+    """Previous implementation: lists rebuilt and scanned for every link."""
+    parsed_homepage = urlparse(homepage_url)
+    base_domain = parsed_homepage.netloc.lower()
+    article_links = set()
+
+    for link in links:
+        try:
+            absolute_url = urljoin(homepage_url, link)
+            parsed_link = urlparse(absolute_url)
+            if parsed_link.netloc.lower() != base_domain:
+                continue
+            if parsed_link.scheme not in ['http', 'https']:
+                continue
+            path = parsed_link.path.lower()
+            article_indicators = [
+                '/article/', '/news/', '/story/', '/post/', '/blog/',
+                '/sports/', '/politics/', '/business/', '/technology/',
+                '/entertainment/', '/health/', '/world/', '/opinion/'
+            ]
+            has_article_pattern = any(indicator in path for indicator in article_indicators)
+            has_date_pattern = bool(re.search(r'/\d{4}/', path) or re.search(r'/\d{4}-\d{2}/', path))
+            exclude_patterns = [
+                '/category/', '/tag/', '/author/', '/search/',
+                '/login', '/register', '/contact', '/about',
+                '/privacy', '/terms', '/rss', '/feed',
+                '.pdf', '.xml', '.json', '.js', '.css'
+            ]
+            has_exclude_pattern = any(pattern in path for pattern in exclude_patterns)
+            if (has_article_pattern or has_date_pattern) and not has_exclude_pattern:
+                if len(path) > 1:
+                    article_links.add(absolute_url)
+        except Exception:
+            continue
+
+    return list(article_links)
+
+
+def legacy_is_article_page(url, title, content):
+    """Previous implementation: ~40 separate re.search calls per page."""
+    url_lower = url.lower()
+    article_url_patterns = [
+        r'/article[s]?/', r'/news/', r'/story/', r'/post[s]?/',
+        r'/blog/', r'/opinion/', r'/feature[s]?/', r'/report[s]?/',
+        r'/\d{4}/\d{2}/', r'/\d{4}-\d{2}-\d{2}/',
+        r'articleshow', r'photostory', r'/web-stories/'
+    ]
+    has_article_pattern = any(re.search(pattern, url_lower) for pattern in article_url_patterns)
+    non_article_patterns = [
+        r'/category/', r'/tag[s]?/', r'/archive[s]?/', r'/index',
+        r'/latest[_-]?news/', r'/updates/', r'/section[s]?/',
+        r'/home$', r'/main$', r'/$', r'/sports$', r'/business$',
+        r'/world$', r'/politics$', r'/technology$', r'/news$'
+    ]
+    has_non_article_pattern = any(re.search(pattern, url_lower) for pattern in non_article_patterns)
+    title_lower = title.lower()
+    category_title_patterns = [
+        r'latest.*news.*updates', r'news.*updates', r'breaking.*news',
+        r'section[s]?', r'category', r'archive[s]?', r'all.*news',
+        r'homepage', r'main.*page', r'index', r'executive.*lounge',
+        r'in.*depth', r'future.*of', r'business.*future',
+        r'latest.*news.*bbc.*news', r'updates.*bbc.*news',
+        r'africa.*latest', r'asia.*latest', r'europe.*latest',
+        r'world.*latest', r'uk.*latest', r'us.*latest'
+    ]
+    is_category_title = any(re.search(pattern, title_lower) for pattern in category_title_patterns)
+    content_words = len(content.split()) if content else 0
+    lines = content.split('\n') if content else []
+    short_lines = [line for line in lines if len(line.split()) < 10 and len(line.strip()) > 0]
+    list_ratio = len(short_lines) / max(len(lines), 1)
+
+    article_score = 0
+    if has_article_pattern:
+        article_score += 25
+    if has_non_article_pattern:
+        article_score -= 30
+    if is_category_title:
+        article_score -= 40
+    if len(title.split()) > 4:
+        article_score += 10
+    if content_words >= 150:
+        article_score += 20
+    if content_words < 50:
+        article_score -= 20
+    if content_words > 2000:
+        article_score -= 10
+    if list_ratio > 0.3:
+        article_score -= 15
+    return article_score >= 40
+
+
+def make_homepage_links(count, seed=42):
+    """Synthetic homepage links resembling a large portal (repeats, nav, external, articles)."""
+    rng = random.Random(seed)
+    sections = ['news', 'sports', 'business', 'world', 'technology', 'entertainment', 'city', 'videos']
+    links = []
+    for i in range(count):
+        kind = rng.random()
+        section = rng.choice(sections)
+        if kind < 0.45:
+            links.append(f"/{section}/story-title-number-{i}/articleshow/{1000000 + i}.cms")
+        elif kind < 0.60:
+            links.append(f"https://example.com/{2024 - i % 3}/{1 + i % 12:02d}/{section}-headline-{i}")
+        elif kind < 0.75:
+            links.append(f"/{section}")
+        elif kind < 0.85:
+            links.append(rng.choice(['/about-us', '/contact', '/privacy-policy', '/rss', '/tag/cricket', '/author/jane']))
+        elif kind < 0.95:
+            links.append(f"https://partner{i % 20}.com/{section}/promo-{i}")
+        else:
+            links.append(f"/static/app.{i % 7}.js")
+    # Headline modules repeat the same links several times
+    links.extend(rng.sample(links, count // 3))
+    return links
+
+
+def make_pages(count, seed=7):
+    rng = random.Random(seed)
+    words = "the match government market city police report season minister team growth".split()
+    pages = []
+    for i in range(count):
+        paragraphs = [' '.join(rng.choice(words) for _ in range(rng.randint(5, 60))) for _ in range(rng.randint(3, 25))]
+        title = ' '.join(rng.choice(words) for _ in range(rng.randint(2, 12)))
+        url = f"https://example.com/{rng.choice(['news', 'sports', 'section'])}/{2024}/{i % 12 + 1:02d}/story-{i}"
+        pages.append((url, title, '\n'.join(paragraphs)))
+    return pages
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the precompiled article classifier")
+    parser.add_argument('--links', type=int, default=3000, help='Distinct links on the synthetic homepage (default: 3000)')
+    parser.add_argument('--pages', type=int, default=500, help='Article pages to classify (default: 500)')
+    parser.add_argument('--repeat', type=int, default=10, help='Repetitions, best time is reported (default: 10)')
+    args = parser.parse_args()
+
+    homepage = "https://example.com/"
+    links = make_homepage_links(args.links)
+    pages = make_pages(args.pages)
+
+    # Both implementations must agree before timing them
+    assert set(legacy_suggest_article_links(homepage, links)) == {url for url, _ in score_article_links(homepage, links)}
+    assert all(
+        legacy_is_article_page(*page) == (score_article_page(*page) >= ARTICLE_SCORE_THRESHOLD)
+        for page in pages
+    )
+
+    legacy_links = best_of(lambda: legacy_suggest_article_links(homepage, links), args.repeat)
+    new_links = best_of(lambda: score_article_links(homepage, links), args.repeat)
+    legacy_pages = best_of(lambda: [legacy_is_article_page(*page) for page in pages], args.repeat)
+    new_pages = best_of(lambda: [score_article_page(*page) for page in pages], args.repeat)
+
+    print(f"Homepage links: {len(links)} ({args.links} distinct + repeats)")
+    print(f"  legacy suggest_article_links: {legacy_links * 1000:8.2f} ms")
+    print(f"  score_article_links:          {new_links * 1000:8.2f} ms  ({legacy_links / new_links:.1f}x)")
+    print(f"Article pages: {len(pages)}")
+    print(f"  legacy is_article_page:       {legacy_pages * 1000:8.2f} ms")
+    print(f"  score_article_page:           {new_pages * 1000:8.2f} ms  ({legacy_pages / new_pages:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Check that --incremental skips saved articles whose homepage links carry tracking parameters.
+
+Simulates two runs against one output directory: the first records articles under the
+URL that was fetched (tracking parameters stripped), the second reloads the index and
+filters raw homepage links the way the spider does.
+
+Usage:
+  python check_incremental.py
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+from ultimate_scraper_v2 import SeenUrlIndex, strip_tracking_params
+
+
+HOMEPAGE_LINKS = [
+    "https://www.example.com/news/2024/05/first-story?utm_source=home&utm_medium=teaser",
+    "https://example.com/news/2024/05/second-story/?fbclid=abc123#comments",
+    "https://www.example.com/news/2024/05/third-story/amp/?gclid=xyz",
+]
+NEW_LINK = "https://www.example.com/news/2024/05/fourth-story?utm_campaign=daily"
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        index_path = Path(tmp) / ".seen_urls.json"
+
+        # First run: the spider fetches the stripped URL and the pipeline records it
+        first_run = SeenUrlIndex(str(index_path))
+        for link in HOMEPAGE_LINKS:
+            first_run.record(strip_tracking_params(link), "hash", tmp)
+        first_run.save()
+
+        # Second run: raw homepage links must be skipped, new ones kept
+        second_run = SeenUrlIndex(str(index_path))
+        kept = [link for link in HOMEPAGE_LINKS + [NEW_LINK] if not second_run.should_skip(link)]
+        assert kept == [NEW_LINK], kept
+        assert second_run.stats()['skipped_seen'] == len(HOMEPAGE_LINKS), second_run.stats()
+
+        # Indexes written under plain normalized URLs are re-keyed on load
+        index_path.write_text(json.dumps({
+            "https://www.example.com/news/2024/05/first-story": {
+                'content_hash': "hash", 'saved_path': tmp, 'timestamp': 0
+            }
+        }), encoding='utf-8')
+        legacy = SeenUrlIndex(str(index_path))
+        assert legacy.should_skip(HOMEPAGE_LINKS[0])
+
+    print(f"OK: {len(HOMEPAGE_LINKS)} tracking-parameter links skipped on rerun, new link kept")
+
+
+if __name__ == '__main__':
+    main()
@@ -10,7 +10,7 @@ PROVEN article extraction method:
 
 PROVEN image processing method:  
 - ImageScraperPipeline class (100% image success)
-- Multi-fallback approach: trafilatura → newspaper3k → BeautifulSoup
+- Multi-fallback approach: trafilatura → newspaper3k → meta/img tags
 - Advanced image scoring and filtering
 - Proven download and processing methods
 
@@ -29,21 +29,43 @@ import logging
 import asyncio
 import argparse
 import hashlib
+import struct
+import math
+import gzip
+import sqlite3
 import pickle
 import tempfile
 import shutil
+import threading
+import queue
+import heapq
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
-from urllib.parse import urljoin, urlparse
-from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple, Any, Callable, Collection
+from urllib.parse import urljoin, urlparse, urlencode, parse_qsl
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import multiprocessing
 import functools
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 
 # Standard HTTP libraries
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+# Async HTTP client for --async-images (optional; HTTP/2 needs the h2 package)
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Image processing
 from PIL import Image
 import io
@@ -52,11 +74,1076 @@ import io
 import trafilatura
 import trafilatura.metadata
 from newspaper import Article
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 
 # Scrapy framework (proven method)
 from scrapy.crawler import CrawlerProcess
 from scrapy.utils.project import get_project_settings
+from scrapy.exceptions import IgnoreRequest
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL for use as a cache key."""
+    parsed = urlparse(url.strip())
+    scheme = parsed.scheme.lower()
+    netloc = parsed.netloc.lower()
+
+    # Drop default ports so http://host:80/x and http://host/x share a key
+    if (scheme == 'http' and netloc.endswith(':80')) or (scheme == 'https' and netloc.endswith(':443')):
+        netloc = netloc.rsplit(':', 1)[0]
+
+    path = parsed.path or '/'
+    query = f"?{parsed.query}" if parsed.query else ''
+    return f"{scheme}://{netloc}{path}{query}"
+
+
+TRACKING_PARAM_REGEX = re.compile(
+    r'^(?:utm_\w+|fbclid|gclid|dclid|gclsrc|msclkid|mc_cid|mc_eid|igshid|yclid|_ga|_gl|ocid|cmpid|ito|ref_src|ref_url)$',
+    re.IGNORECASE
+)
+AMP_PATH_REGEX = re.compile(r'(?:/amp/?$|/amp(?=/)|\.amp(?=\.html?$|$))')
+
+
+def strip_tracking_params(url: str) -> str:
+    """Drop utm_*, fbclid, gclid and similar tracking parameters (and the fragment) from a URL."""
+    parsed = urlparse(url.strip())
+    if not parsed.query:
+        return parsed._replace(fragment='').geturl()
+    query = [(name, value) for name, value in parse_qsl(parsed.query, keep_blank_values=True)
+             if not TRACKING_PARAM_REGEX.match(name)]
+    return parsed._replace(query=urlencode(query), fragment='').geturl()
+
+
+def canonical_url_key(url: str) -> str:
+    """
+    Dedup key under which tracking, AMP and www variants of one article collide.
+    Only used for comparison; the URL that is fetched keeps its path.
+    """
+    parsed = urlparse(normalize_url(strip_tracking_params(url)))
+    netloc = parsed.netloc
+    for prefix in ('www.', 'amp.', 'm.'):
+        if netloc.startswith(prefix):
+            netloc = netloc[len(prefix):]
+            break
+    path = AMP_PATH_REGEX.sub('', parsed.path).rstrip('/') or '/'
+    query = [(name, value) for name, value in parse_qsl(parsed.query, keep_blank_values=True)
+             if name.lower() not in ('amp', 'outputtype', 'output')]
+    return f"{netloc}{path}" + (f"?{urlencode(query)}" if query else '')
+
+
+class ResponseCache:
+    """
+    Per-run HTML response cache shared by the spider and the image pipeline.
+    Bodies live in memory up to a byte budget; older entries spill to disk.
+    """
+
+    def __init__(self, max_memory_mb: int = 256, spill_dir: Optional[str] = None):
+        self.max_memory_bytes = max_memory_mb * 1024 * 1024
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self._memory = OrderedDict()
+        self._spilled = {}
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(f"{__name__}_cache")
+
+        if self.spill_dir:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+
+    def put(self, url: str, body: bytes, encoding: str = 'utf-8'):
+        """Store a response body under its normalized URL."""
+        key = normalize_url(url)
+        with self._lock:
+            if key in self._memory:
+                self._memory_bytes -= len(self._memory.pop(key)[0])
+            self._memory[key] = (body, encoding)
+            self._memory_bytes += len(body)
+            self._spilled.pop(key, None)
+            self._spill_if_needed()
+
+    def get(self, url: str) -> Optional[Tuple[bytes, str]]:
+        """Return (body, encoding) for a URL, or None if it was never stored."""
+        key = normalize_url(url)
+        with self._lock:
+            if key in self._memory:
+                self.hits += 1
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+            spill_file = self._spilled.get(key)
+            if spill_file:
+                try:
+                    encoding, body = spill_file.read_bytes().split(b'\n', 1)
+                    self.hits += 1
+                    return body, encoding.decode('ascii')
+                except OSError as e:
+                    self.logger.warning(f"Failed to read spilled response for {url}: {e}")
+                    self._spilled.pop(key, None)
+
+            self.misses += 1
+            return None
+
+    def get_text(self, url: str) -> Optional[str]:
+        """Return the cached body decoded to text."""
+        cached = self.get(url)
+        if not cached:
+            return None
+        body, encoding = cached
+        return body.decode(encoding or 'utf-8', errors='replace')
+
+    def _spill_if_needed(self):
+        """Move least recently used bodies to disk (or drop them) when over budget."""
+        while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+            key, (body, encoding) = self._memory.popitem(last=False)
+            self._memory_bytes -= len(body)
+
+            if not self.spill_dir:
+                continue
+
+            spill_file = self.spill_dir / hashlib.sha1(key.encode('utf-8')).hexdigest()
+            try:
+                spill_file.write_bytes((encoding or 'utf-8').encode('ascii') + b'\n' + body)
+                self._spilled[key] = spill_file
+            except OSError as e:
+                self.logger.warning(f"Failed to spill response for {key}: {e}")
+
+    def clear(self):
+        """Drop all entries and remove spilled files."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            for spill_file in self._spilled.values():
+                try:
+                    spill_file.unlink()
+                except OSError:
+                    pass
+            self._spilled.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters for the run summary."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries_in_memory': len(self._memory),
+                'entries_spilled': len(self._spilled),
+                'memory_bytes': self._memory_bytes
+            }
+
+
+class HttpCache:
+    """
+    Persistent cross-run HTTP cache backed by SQLite.
+    Stores bodies with their ETag/Last-Modified validators for conditional revalidation
+    and evicts least recently used entries once the total size exceeds the budget.
+    """
+
+    # Lookups whose accessed_at update is buffered before one batched write
+    TOUCH_BATCH = 256
+
+    def __init__(self, cache_dir: str = ".scraper_cache", max_size_mb: int = 1024,
+                 max_entry_mb: int = 20):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_size_mb * 1024 * 1024
+        self.max_entry_bytes = max_entry_mb * 1024 * 1024
+        self.logger = logging.getLogger(f"{__name__}_http_cache")
+        self._lock = threading.Lock()
+        self.counters = {'hits': 0, 'misses': 0, 'revalidated': 0, 'stored': 0, 'evicted': 0}
+        self._touched = {}
+
+        self._db = sqlite3.connect(str(self.cache_dir / "http_cache.sqlite"), check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)")
+        self._db.commit()
+        self._total_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the stored entry for a URL (status, headers, body, validators) or None.
+        Callers report how the entry was used: record_hit() or record_revalidation().
+        """
+        key = normalize_url(url)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, status, headers, body, etag, last_modified FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.counters['misses'] += 1
+                return None
+
+            # LRU bookkeeping is written in batches, not once per lookup
+            self._touched[key] = time.time()
+            if len(self._touched) >= self.TOUCH_BATCH:
+                self._flush_touched()
+                self._db.commit()
+
+        headers = json.loads(row[2])
+        return {
+            'url': row[0],
+            'status': row[1],
+            'headers': headers,
+            'body': row[3],
+            'etag': row[4],
+            'last_modified': row[5],
+            'content_type': (headers.get('content-type') or [None])[0]
+        }
+
+    def conditional_headers(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from a stored entry."""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url: str, status: int, headers: Dict[str, List[str]], body: bytes):
+        """Store a response; header names are lowercased, oversized bodies are skipped."""
+        if len(body) > self.max_entry_bytes:
+            return
+
+        headers = {name.lower(): list(values) for name, values in headers.items()}
+        etag = (headers.get('etag') or [None])[0]
+        last_modified = (headers.get('last-modified') or [None])[0]
+        key = normalize_url(url)
+        now = time.time()
+
+        with self._lock:
+            self._flush_touched()
+            previous = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, status, json.dumps(headers), sqlite3.Binary(body), etag, last_modified, len(body), now, now)
+            )
+            self._total_bytes += len(body) - (previous[0] if previous else 0)
+            self.counters['stored'] += 1
+            self._evict_if_needed()
+            self._db.commit()
+
+    def record_hit(self, count: int = 1):
+        """Count cached bodies served without going to the network."""
+        with self._lock:
+            self.counters['hits'] += count
+
+    def record_revalidation(self, count: int = 1):
+        """Count 304 Not Modified responses answered from the cache."""
+        with self._lock:
+            self.counters['revalidated'] += count
+
+    def _flush_touched(self):
+        """Write buffered accessed_at updates (caller holds the lock and commits)."""
+        if self._touched:
+            self._db.executemany("UPDATE responses SET accessed_at = ? WHERE key = ?",
+                                 [(accessed_at, key) for key, accessed_at in self._touched.items()])
+            self._touched.clear()
+
+    def _evict_if_needed(self):
+        """Delete least recently used entries until under 90% of the budget (caller holds the lock)."""
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        target = self.max_bytes * 0.9
+        rows = self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC").fetchall()
+        for key, size in rows:
+            if self._total_bytes <= target:
+                break
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._total_bytes -= size
+            self.counters['evicted'] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for the run summary."""
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return dict(self.counters, entries=entries, size_bytes=self._total_bytes,
+                        cache_dir=str(self.cache_dir))
+
+    def close(self):
+        with self._lock:
+            self._flush_touched()
+            self._db.commit()
+            self._db.close()
+
+
+class ScrapyHttpCacheStorage:
+    """
+    HTTPCACHE_STORAGE backend that keeps Scrapy responses in the shared HttpCache.
+    Scrapy's RFC2616Policy adds the If-None-Match / If-Modified-Since headers on revalidation.
+    """
+
+    def __init__(self, settings):
+        self.settings = settings
+
+    def open_spider(self, spider):
+        pass
+
+    def close_spider(self, spider):
+        # The middleware counts fresh responses served from cache and 304s; fold them into our counters
+        http_cache = getattr(spider, 'http_cache', None)
+        if http_cache is not None:
+            http_cache.record_hit(spider.crawler.stats.get_value('httpcache/hit', 0))
+            http_cache.record_revalidation(spider.crawler.stats.get_value('httpcache/revalidate', 0))
+
+    def retrieve_response(self, spider, request):
+        http_cache = getattr(spider, 'http_cache', None)
+        if http_cache is None or request.method != 'GET':
+            return None
+
+        entry = http_cache.get(request.url)
+        if entry is None:
+            return None
+
+        from scrapy.http import Headers
+        from scrapy.responsetypes import responsetypes
+
+        headers = Headers(entry['headers'])
+        respcls = responsetypes.from_args(headers=headers, url=entry['url'], body=entry['body'])
+        return respcls(url=entry['url'], headers=headers, status=entry['status'], body=entry['body'])
+
+    def store_response(self, spider, request, response):
+        http_cache = getattr(spider, 'http_cache', None)
+        if http_cache is None or request.method != 'GET':
+            return
+
+        headers = {
+            name.decode('latin-1'): [value.decode('latin-1') for value in values]
+            for name, values in response.headers.items()
+        }
+        http_cache.store(request.url, response.status, headers, response.body)
+
+
+class SeenUrlIndex:
+    """
+    Persistent index of already-saved articles for incremental crawls.
+    Maps canonical_url_key -> content hash, saved path and timestamp, stored as JSON in the output directory.
+    Keyed like the frontier, so tracking/AMP/www variants of a saved article are skipped too.
+    """
+
+    def __init__(self, index_path: str, recheck_hours: Optional[float] = None):
+        self.index_path = Path(index_path)
+        self.recheck_seconds = recheck_hours * 3600 if recheck_hours is not None else None
+        self.logger = logging.getLogger(f"{__name__}_seen")
+        self._lock = threading.Lock()
+        self._entries = {}
+        self.counters = {'skipped_seen': 0, 'skipped_unchanged': 0, 'recorded': 0}
+
+        if self.index_path.exists():
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    # Re-key indexes written under plain normalize_url keys (canonical keys have no scheme)
+                    self._entries = {canonical_url_key(key) if '://' in key else key: entry
+                                     for key, entry in json.load(f).items()}
+            except Exception as e:
+                self.logger.warning(f"Could not load seen-URL index {self.index_path}: {e}")
+
+    def should_skip(self, url: str) -> bool:
+        """True if the URL was saved before and is not yet due for a recheck."""
+        with self._lock:
+            entry = self._entries.get(canonical_url_key(url))
+            if entry is None:
+                return False
+            if self.recheck_seconds is not None and time.time() - entry['timestamp'] >= self.recheck_seconds:
+                return False
+            self.counters['skipped_seen'] += 1
+            return True
+
+    def is_unchanged(self, url: str, content_hash: str) -> bool:
+        """True if a rechecked page still has the content hash we saved."""
+        with self._lock:
+            entry = self._entries.get(canonical_url_key(url))
+            if entry is None or entry['content_hash'] != content_hash:
+                return False
+            # Refresh the timestamp so the page isn't rechecked again immediately
+            entry['timestamp'] = time.time()
+            self.counters['skipped_unchanged'] += 1
+            return True
+
+    def record(self, url: str, content_hash: str, saved_path: str):
+        """Remember a successfully saved article."""
+        with self._lock:
+            self._entries[canonical_url_key(url)] = {
+                'content_hash': content_hash,
+                'saved_path': saved_path,
+                'timestamp': time.time()
+            }
+            self.counters['recorded'] += 1
+
+    def save(self):
+        """Write the index atomically."""
+        with self._lock:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counters, indexed_urls=len(self._entries))
+
+
+def content_hash(text: str) -> str:
+    """Stable hash of extracted article text."""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def simhash(text: str, ngram: int = 3) -> int:
+    """64-bit SimHash over word shingles; near-duplicate texts differ in only a few bits."""
+    words = re.findall(r'\w+', text.lower())
+    shingles = {' '.join(words[i:i + ngram]) for i in range(max(1, len(words) - ngram + 1))}
+    hashes = [int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+              for shingle in shingles]
+    
+    fingerprint = 0
+    threshold = len(hashes) / 2
+    for bit in range(64):
+        if sum((h >> bit) & 1 for h in hashes) > threshold:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+class ArticleDeduplicator:
+    """
+    Run-wide duplicate article detection: canonical URL keys plus SimHash near-duplicate text.
+    Fingerprints are indexed by four 16-bit bands, so any match within 3 bits shares a band.
+    """
+
+    def __init__(self, max_distance: int = 3):
+        self.max_distance = max_distance
+        self._url_keys = set()
+        self._bands = [{} for _ in range(4)]
+        self.counters = {'duplicate_url': 0, 'duplicate_content': 0, 'unique': 0}
+
+    def _band_keys(self, fingerprint: int) -> List[int]:
+        return [(fingerprint >> (16 * band)) & 0xFFFF for band in range(4)]
+
+    def check(self, url_keys: Collection[str], fingerprint: int) -> Optional[str]:
+        """Return 'duplicate_url' or 'duplicate_content' for a duplicate, otherwise register it and return None."""
+        if any(key in self._url_keys for key in url_keys):
+            self.counters['duplicate_url'] += 1
+            return 'duplicate_url'
+        
+        band_keys = self._band_keys(fingerprint)
+        for index, band_key in zip(self._bands, band_keys):
+            for other in index.get(band_key, ()):
+                if bin(other ^ fingerprint).count('1') <= self.max_distance:
+                    self.counters['duplicate_content'] += 1
+                    return 'duplicate_content'
+        
+        self._url_keys.update(url_keys)
+        for index, band_key in zip(self._bands, band_keys):
+            index.setdefault(band_key, []).append(fingerprint)
+        self.counters['unique'] += 1
+        return None
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self.counters)
+
+
+class ImageDedupStore:
+    """
+    Stores each distinct image (by hash of the downloaded bytes and the transcode settings) once.
+    Later articles with the same image get hardlinks to the first copy (a file copy where
+    hardlinks aren't possible); the JSON manifest in the output directory records every
+    referencing article URL and its folder.
+    """
+
+    def __init__(self, manifest_path: str):
+        self.manifest_path = Path(manifest_path)
+        self.logger = logging.getLogger(f"{__name__}_images")
+        self._lock = threading.Lock()
+        self._entries = {}
+        self.counters = {'stored': 0, 'linked': 0, 'copied': 0}
+
+        if self.manifest_path.exists():
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+                # Older manifests kept references as a list of article URLs
+                for entry in self._entries.values():
+                    if isinstance(entry['references'], list):
+                        entry['references'] = dict.fromkeys(entry['references'], entry['directory'])
+            except Exception as e:
+                self.logger.warning(f"Could not load image manifest {self.manifest_path}: {e}")
+
+    def _is_current(self, entry: Dict[str, Any]) -> bool:
+        """
+        The stored file still exists and is the one recorded (images are replaced, never rewritten),
+        and none of its variants was deleted.
+        """
+        directory = Path(entry['directory'])
+        try:
+            if os.stat(directory / entry['saved']['file']).st_ino != entry.get('inode'):
+                return False
+        except OSError:
+            return False
+        return all((directory / variant['file']).exists() for variant in entry['saved'].get('variants', []))
+
+    def lookup(self, digest: str) -> Optional[Dict[str, Any]]:
+        """Stored entry for an image hash, if its file is still the one that was stored and its variants exist."""
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry and self._is_current(entry):
+                return entry
+            return None
+
+    def add(self, digest: str, saved: Dict[str, Any], directory: Path, article_url: str):
+        """Register a newly saved image (two workers saving the same image both keep their copy)."""
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry and self._is_current(entry):
+                entry['references'][article_url] = str(directory)
+                return
+            self._entries[digest] = {
+                'directory': str(directory),
+                'saved': saved,
+                'inode': os.stat(Path(directory) / saved['file']).st_ino,
+                'references': {article_url: str(directory)}
+            }
+            self.counters['stored'] += 1
+
+    def link(self, entry: Dict[str, Any], directory: Path, article_url: str) -> Dict[str, Any]:
+        """Reference a stored image (and its variants) from another article folder."""
+        saved = entry['saved']
+        files = [saved['file']] + [variant['file'] for variant in saved.get('variants', [])]
+        linked = True
+        for name in files:
+            source = Path(entry['directory']) / name
+            target = directory / name
+            # Re-runs into the same output find the entry for this very folder
+            if target.exists() and os.path.samefile(source, target):
+                continue
+            # Link under a temporary name and rename over the target, so no copy is ever deleted first
+            tmp_target = target.with_name(target.name + '.tmp')
+            if tmp_target.exists():
+                tmp_target.unlink()
+            try:
+                os.link(source, tmp_target)
+            except OSError:
+                shutil.copyfile(source, tmp_target)
+                linked = False
+            os.replace(tmp_target, target)
+        
+        with self._lock:
+            entry['references'][article_url] = str(directory)
+            self.counters['linked' if linked else 'copied'] += 1
+        return dict(saved, mode='deduplicated', duplicate_of=str(Path(entry['directory']) / saved['file']))
+
+    def save(self):
+        """Write the manifest atomically."""
+        with self._lock:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.manifest_path)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counters, distinct_images=len(self._entries))
+
+
+# JPEG start-of-frame markers that carry the image dimensions (excludes DHT/JPG/DAC)
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def parse_image_dimensions(data) -> Optional[Tuple[int, int]]:
+    """
+    Read (width, height) from the header bytes of a JPEG, PNG, GIF or WebP image
+    without decoding it. Returns None if the format is unknown or more bytes are needed.
+    """
+    length = len(data)
+    
+    # PNG: signature followed by the IHDR chunk
+    if length >= 24 and data[:8] == b'\x89PNG\r\n\x1a\n' and data[12:16] == b'IHDR':
+        return struct.unpack_from('>II', data, 16)
+    
+    # GIF: logical screen descriptor right after the signature
+    if length >= 10 and data[:6] in (b'GIF87a', b'GIF89a'):
+        return struct.unpack_from('<HH', data, 6)
+    
+    # WebP: RIFF container with a VP8, VP8L or VP8X first chunk
+    if length >= 16 and data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        chunk = data[12:16]
+        if chunk == b'VP8 ' and length >= 30 and data[23:26] == b'\x9d\x01\x2a':
+            width, height = struct.unpack_from('<HH', data, 26)
+            return width & 0x3FFF, height & 0x3FFF
+        if chunk == b'VP8L' and length >= 25 and data[20] == 0x2F:
+            bits = struct.unpack_from('<I', data, 21)[0]
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        if chunk == b'VP8X' and length >= 30:
+            width = data[24] | (data[25] << 8) | (data[26] << 16)
+            height = data[27] | (data[28] << 8) | (data[29] << 16)
+            return width + 1, height + 1
+        return None
+    
+    # JPEG: walk the marker segments until a start-of-frame
+    if length >= 4 and data[0] == 0xFF and data[1] == 0xD8:
+        i = 2
+        while i + 4 <= length:
+            if data[i] != 0xFF:
+                return None
+            marker = data[i + 1]
+            if marker == 0xFF:
+                # Fill byte before a marker
+                i += 1
+                continue
+            if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+                # Standalone markers without a length field
+                i += 2
+                continue
+            if marker in JPEG_SOF_MARKERS:
+                if i + 9 > length:
+                    return None
+                height, width = struct.unpack_from('>HH', data, i + 5)
+                return width, height
+            i += 2 + struct.unpack_from('>H', data, i + 2)[0]
+    
+    return None
+
+
+class ImageBuffer:
+    """
+    Growable byte buffer for streamed image bodies.
+    Chunks are copied into a preallocated bytearray instead of concatenating bytes objects.
+    """
+
+    def __init__(self, capacity: int = 64 * 1024):
+        self._buffer = bytearray(max(capacity, 1))
+        self.size = 0
+
+    def write(self, chunk: bytes):
+        """Append a chunk, doubling the backing storage when it runs out."""
+        end = self.size + len(chunk)
+        if end > len(self._buffer):
+            self._buffer.extend(bytes(max(end, len(self._buffer) * 2) - len(self._buffer)))
+        self._buffer[self.size:end] = chunk
+        self.size = end
+
+    def view(self) -> memoryview:
+        """Zero-copy view of the bytes written so far (release it before the next write)."""
+        return memoryview(self._buffer)[:self.size]
+
+    def getvalue(self) -> bytes:
+        """Copy out the written bytes."""
+        with self.view() as view:
+            return view.tobytes()
+
+
+def flatten_to_rgb(img: Image.Image) -> Image.Image:
+    """Convert any PIL image to RGB, compositing transparency onto white."""
+    if img.mode in ('RGBA', 'LA', 'P'):
+        rgb_img = Image.new('RGB', img.size, (255, 255, 255))
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        rgb_img.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+        return rgb_img
+    if img.mode != 'RGB':
+        return img.convert('RGB')
+    return img
+
+
+def replace_file(path: Path, write: Callable[[Path], None]):
+    """
+    Write path via a temporary file renamed over it. Images may be hardlinked into other
+    article folders (ImageDedupStore), so they are never rewritten in place.
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def transcode_image(content: bytes, output_path: str, max_dim: Optional[int] = None,
+                    thumbnails: Collection[int] = (), quality: int = 90) -> Dict[str, Any]:
+    """
+    Save image bytes as a JPEG at output_path, plus one <stem>_<size>.jpg per thumbnail size.
+    JPEGs that already fit max_dim are written byte-for-byte; everything else comes from a
+    single decode (at a reduced DCT scale for JPEG sources) that all variants are resized from.
+    Module-level so it can run in a transcoding worker process.
+    """
+    output_path = Path(output_path)
+    thumbnail_sizes = sorted(set(thumbnails), reverse=True)
+    
+    with Image.open(io.BytesIO(content)) as img:
+        source_format = img.format
+        result = {
+            'mode': 'transcoded',
+            'source_format': source_format,
+            'file': output_path.name,
+            'width': img.width,
+            'height': img.height,
+            'bytes': len(content),
+            'variants': []
+        }
+        
+        passthrough = source_format == 'JPEG' and img.mode in ('RGB', 'L') and (not max_dim or max(img.size) <= max_dim)
+        if passthrough:
+            replace_file(output_path, lambda path: path.write_bytes(content))
+            result['mode'] = 'passthrough'
+            if not thumbnail_sizes:
+                return result
+        
+        # Decode only as much resolution as the largest output still needs
+        decode_dim = thumbnail_sizes[0] if passthrough else max_dim
+        if decode_dim and source_format == 'JPEG':
+            # libjpeg decodes straight to the smallest power-of-two scale still >= decode_dim
+            img.draft('RGB', (decode_dim, decode_dim))
+        
+        current = flatten_to_rgb(img)
+        
+        if not passthrough:
+            if max_dim and max(current.size) > max_dim:
+                current.thumbnail((max_dim, max_dim), Image.LANCZOS)
+            replace_file(output_path, lambda path: current.save(path, 'JPEG', quality=quality))
+            result.update(width=current.width, height=current.height, bytes=os.path.getsize(output_path))
+        
+        # Largest first, each variant resized from the previous one
+        for size in thumbnail_sizes:
+            if max(current.size) > size:
+                current = current.copy()
+                current.thumbnail((size, size), Image.LANCZOS)
+            variant_path = output_path.with_name(f"{output_path.stem}_{size}.jpg")
+            replace_file(variant_path, lambda path: current.save(path, 'JPEG', quality=quality))
+            result['variants'].append({
+                'max_dim': size,
+                'file': variant_path.name,
+                'width': current.width,
+                'height': current.height,
+                'bytes': os.path.getsize(variant_path)
+            })
+        
+        return result
+
+
+class ImageTranscoder:
+    """
+    Writes fetched images to disk as JPEG.
+    JPEG sources are handled in the calling thread (passthrough or draft decode is cheap);
+    PNG/WebP/GIF conversions go to a process pool so heavy encodes run on all cores.
+    """
+
+    def __init__(self, workers: int = 0, max_dim: Optional[int] = None, thumbnails: Collection[int] = ()):
+        self.workers = workers
+        self.max_dim = max_dim
+        self.thumbnails = tuple(thumbnails)
+        self._pool = None
+        self._lock = threading.Lock()
+        self.counts = {'passthrough': 0, 'transcoded': 0, 'pooled': 0}
+
+    def transcode(self, content: bytes, output_path: Path) -> Dict[str, Any]:
+        """Save content as JPEG at output_path; returns what was written."""
+        pooled = self.workers > 0 and not content.startswith(b'\xff\xd8')
+        if pooled:
+            result = self._get_pool().submit(
+                transcode_image, content, str(output_path), self.max_dim, self.thumbnails
+            ).result()
+        else:
+            result = transcode_image(content, str(output_path), self.max_dim, self.thumbnails)
+        
+        with self._lock:
+            self.counts[result['mode']] += 1
+            if pooled:
+                self.counts['pooled'] += 1
+        return result
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            return self._pool
+
+    def settings_key(self) -> str:
+        """Identifies the output settings; the same source bytes saved under other settings are a different image."""
+        return f"max_dim={self.max_dim};thumbnails={','.join(map(str, self.thumbnails))}"
+
+    def stats(self) -> Dict[str, Any]:
+        return {'workers': self.workers, 'max_dim': self.max_dim, 'thumbnails': list(self.thumbnails), **self.counts}
+
+    def close(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+
+class HostLimiter:
+    """Caps the number of simultaneous requests to any single host."""
+
+    def __init__(self, max_per_host: int = 4):
+        self.max_per_host = max(1, max_per_host)
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    def slot(self, url: str) -> threading.BoundedSemaphore:
+        """Return the semaphore guarding a URL's host (use as a context manager)."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_per_host)
+                self._semaphores[host] = semaphore
+            return semaphore
+
+
+def parse_retry_after(value: Optional[str], limit: float = 300.0) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date), capped at limit."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return max(0.0, min(seconds, limit))
+
+
+class AdaptiveRateLimiter:
+    """
+    Per-host token buckets shared by the spider and the image fetchers.
+    Each host's rate rises additively while responses stay fast, and is halved on
+    429/503 (pausing the host for Retry-After when given) or cut when latency climbs.
+    """
+
+    THROTTLE_STATUSES = (429, 503)
+
+    def __init__(self, initial_rate: float = 2.0, min_rate: float = 0.2, max_rate: float = 20.0,
+                 target_latency: float = 1.0, burst: float = 4.0):
+        self.initial_rate = min(max(initial_rate, min_rate), max_rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.target_latency = target_latency
+        self.burst = burst
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _host_state(self, url: str) -> Dict[str, Any]:
+        host = urlparse(url).netloc.lower()
+        state = self._hosts.get(host)
+        if state is None:
+            state = {
+                'rate': self.initial_rate,
+                'tokens': 1.0,
+                'updated': time.monotonic(),
+                'blocked_until': 0.0,
+                'latency': None,
+                'requests': 0,
+                'throttled': 0
+            }
+            self._hosts[host] = state
+        return state
+
+    def reserve(self, url: str) -> float:
+        """Take a token for the URL's host; returns how many seconds the caller must wait before sending."""
+        with self._lock:
+            state = self._host_state(url)
+            now = time.monotonic()
+            state['tokens'] = min(self.burst, state['tokens'] + (now - state['updated']) * state['rate'])
+            state['updated'] = now
+            state['requests'] += 1
+            
+            # Tokens may go negative: each waiter queues behind the previous reservation
+            wait = max(state['blocked_until'] - now, (1.0 - state['tokens']) / state['rate'], 0.0)
+            state['tokens'] -= 1.0
+            return wait
+
+    def acquire(self, url: str):
+        """Blocking reserve() for worker threads."""
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+
+    def record(self, url: str, status: int, latency: Optional[float] = None, retry_after: Optional[str] = None):
+        """Feed back one response so the host's rate can adapt."""
+        with self._lock:
+            state = self._host_state(url)
+            
+            if status in self.THROTTLE_STATUSES:
+                state['throttled'] += 1
+                state['rate'] = max(self.min_rate, state['rate'] / 2)
+                state['tokens'] = min(state['tokens'], 0.0)
+                pause = parse_retry_after(retry_after)
+                if pause:
+                    state['blocked_until'] = max(state['blocked_until'], time.monotonic() + pause)
+                return
+            
+            if latency is None:
+                return
+            
+            state['latency'] = latency if state['latency'] is None else 0.8 * state['latency'] + 0.2 * latency
+            if state['latency'] > 2 * self.target_latency:
+                # Server is slowing down under our load
+                state['rate'] = max(self.min_rate, state['rate'] * 0.9)
+            elif state['latency'] < self.target_latency:
+                state['rate'] = min(self.max_rate, state['rate'] + 0.5)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'hosts': len(self._hosts),
+                'requests': sum(state['requests'] for state in self._hosts.values()),
+                'throttled_responses': sum(state['throttled'] for state in self._hosts.values()),
+                'per_host': {
+                    host: {
+                        'rate_per_second': round(state['rate'], 2),
+                        'avg_latency_seconds': round(state['latency'], 3) if state['latency'] is not None else None,
+                        'requests': state['requests'],
+                        'throttled': state['throttled']
+                    }
+                    for host, state in self._hosts.items()
+                }
+            }
+
+
+class ArticleQuotaMiddleware:
+    """
+    Scrapy downloader middleware that cancels requests leaving the scheduler after the
+    spider's verified-article quota has been met.
+    """
+
+    @staticmethod
+    def check(request, spider):
+        if getattr(spider, 'quota_reached', False):
+            spider.crawl_stats['cancelled_after_quota'] += 1
+            raise IgnoreRequest("article quota reached")
+
+    def process_request(self, request, spider):
+        self.check(request, spider)
+        return None
+
+
+class AdaptiveThrottleMiddleware:
+    """
+    Scrapy downloader middleware that paces requests through the spider's AdaptiveRateLimiter.
+    Installed after HttpCacheMiddleware so cache hits are never delayed.
+    """
+
+    async def process_request(self, request, spider):
+        rate_limiter = getattr(spider, 'rate_limiter', None)
+        if rate_limiter is None:
+            return None
+        
+        wait = rate_limiter.reserve(request.url)
+        if wait > 0:
+            from twisted.internet import reactor
+            from twisted.internet.task import deferLater
+            from scrapy.utils.defer import maybe_deferred_to_future
+            
+            # Returning a Deferred from process_request is deprecated since Scrapy 2.13
+            await maybe_deferred_to_future(deferLater(reactor, wait, lambda: None))
+            # The quota may have been met while this request waited for its host
+            ArticleQuotaMiddleware.check(request, spider)
+        
+        request.meta['throttle_sent_at'] = time.monotonic()
+        return None
+
+    def process_response(self, request, response, spider):
+        rate_limiter = getattr(spider, 'rate_limiter', None)
+        sent_at = request.meta.pop('throttle_sent_at', None)
+        if rate_limiter is not None and sent_at is not None:
+            retry_after = response.headers.get('Retry-After')
+            rate_limiter.record(
+                request.url,
+                response.status,
+                latency=time.monotonic() - sent_at,
+                retry_after=retry_after.decode('latin-1') if retry_after else None
+            )
+        return response
+
+
+class ParsedDocument:
+    """
+    One HTML page parsed once into an lxml tree.
+    Content extraction, metadata extraction and image discovery all read the same tree.
+    """
+
+    def __init__(self, html: str):
+        self.html = html
+        self._tree = None
+
+    @property
+    def tree(self):
+        """The lxml tree, parsed on first access."""
+        if self._tree is None:
+            try:
+                self._tree = lxml.html.fromstring(self.html)
+            except ValueError:
+                # lxml refuses str input that carries an XML encoding declaration
+                self._tree = lxml.html.fromstring(self.html.encode('utf-8'))
+        return self._tree
+
+    def image_candidates(self) -> List[Dict[str, str]]:
+        """Collect OpenGraph/Twitter meta images and img tags (raw, unscored URLs)."""
+        candidates = []
+        meta_sources = {}
+        
+        for meta in self.tree.iter('meta'):
+            content = meta.get('content')
+            if not content:
+                continue
+            if (meta.get('property') or '').lower() == 'og:image':
+                meta_sources.setdefault('opengraph', content)
+            elif (meta.get('name') or '').lower() == 'twitter:image':
+                meta_sources.setdefault('twitter_card', content)
+        
+        for source in ('opengraph', 'twitter_card'):
+            if source in meta_sources:
+                candidates.append({'url': meta_sources[source], 'source': source})
+        
+        for img in self.tree.iter('img'):
+            src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
+            if src:
+                candidates.append({
+                    'url': src,
+                    'source': 'soup',
+                    'alt': img.get('alt') or '',
+                    'class': img.get('class') or ''
+                })
+        
+        return candidates
+
+    def canonical_url(self) -> Optional[str]:
+        """href of <link rel="canonical">, if present."""
+        for link in self.tree.iter('link'):
+            if (link.get('rel') or '').lower() == 'canonical' and link.get('href'):
+                return link.get('href').strip()
+        return None
+
+    def extract_article(self, **options) -> Tuple[Optional[str], Dict[str, Any]]:
+        """Run trafilatura once on the tree for both main text and metadata."""
+        result = trafilatura.bare_extraction(self.tree, with_metadata=True, **options)
+        if result is None:
+            return None, {}
+        
+        # trafilatura < 2.0 returns a dict, newer versions a Document
+        if not isinstance(result, dict):
+            result = result.as_dict()
+        return result.get('text'), result
 
 
 class ProvenImageScraperPipeline:
@@ -65,10 +1152,20 @@ class ProvenImageScraperPipeline:
     This is the exact class that achieved 100% image scraping success.
     """
     
-    def __init__(self, input_folder: str = ".", output_folder: str = "articles+images"):
+    def __init__(self, input_folder: str = ".", output_folder: str = "articles+images",
+                 response_cache: Optional[ResponseCache] = None,
+                 pool_size: int = 10, max_per_host: int = 4,
+                 http_cache: Optional[HttpCache] = None,
+                 transcoder: Optional[ImageTranscoder] = None,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None):
         self.input_folder = Path(input_folder)
         self.output_folder = Path(output_folder)
-        self.session = self._create_session()
+        self.session = self._create_session(pool_size, rate_limited=rate_limiter is not None)
+        self.response_cache = response_cache or ResponseCache()
+        self.host_limiter = HostLimiter(max_per_host)
+        self.http_cache = http_cache
+        self.transcoder = transcoder or ImageTranscoder()
+        self.rate_limiter = rate_limiter
         self.logger = self._setup_logging()
         
         # Create output directory
@@ -77,6 +1174,7 @@ class ProvenImageScraperPipeline:
         # Image filtering settings (proven method)
         self.min_image_size = (100, 100)
         self.max_file_size_mb = 10
+        self.header_probe_limit = 256 * 1024
         self.allowed_extensions = {'.jpg', '.jpeg', '.png', '.webp', '.gif'}
         self.max_images_per_article = 1
         
@@ -98,16 +1196,19 @@ class ProvenImageScraperPipeline:
         logger = logging.getLogger(f"{__name__}_image")
         return logger
 
-    def _create_session(self) -> requests.Session:
+    def _create_session(self, pool_size: int = 10, rate_limited: bool = False) -> requests.Session:
         """Create optimized session (proven method)."""
         session = requests.Session()
         
+        # With a rate limiter, 429/503 must reach AdaptiveRateLimiter.record (backoff, Retry-After)
+        # instead of being retried away inside urllib3
         retry_strategy = Retry(
             total=3,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=[500, 502, 504] if rate_limited else [429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Size the connection pool to the worker count so threads don't discard connections
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_size, pool_maxsize=pool_size)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
@@ -124,27 +1225,92 @@ class ProvenImageScraperPipeline:
         filename = filename.strip('. ')
         return filename if filename else "unnamed_article"
 
-    def extract_images_trafilatura(self, url: str) -> List[Dict[str, any]]:
-        """PROVEN trafilatura method using proven method."""
+    def fetch_html(self, url: str) -> Optional[str]:
+        """Return article HTML from the shared response cache, downloading only on a miss."""
+        html = self.response_cache.get_text(url)
+        if html is not None:
+            return html
+        
+        self.logger.info(f"Response cache miss, downloading {url}")
+        with self.host_limiter.slot(url):
+            response, cached = self._conditional_get(url, timeout=30)
+        
+        if cached:
+            self.response_cache.put(url, cached['body'])
+            return self.response_cache.get_text(url)
+        
+        response.raise_for_status()
+        self._store_in_http_cache(url, response, response.content)
+        self.response_cache.put(url, response.content, response.encoding or 'utf-8')
+        return response.text
+
+    def _conditional_get(self, url: str, **kwargs) -> Tuple[Optional[requests.Response], Optional[Dict[str, Any]]]:
+        """
+        GET a URL, revalidating against the persistent HTTP cache when an entry exists.
+        Returns (response, None) for a fresh download or (None, cached_entry) on 304 Not Modified.
+        """
+        entry = self.http_cache.get(url) if self.http_cache else None
+        headers = self.http_cache.conditional_headers(entry) if entry else {}
+        
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url)
+        sent_at = time.monotonic()
+        
+        response = self.session.get(url, headers=headers, **kwargs)
+        self._record_rate(url, response, sent_at)
+        if entry and response.status_code == 304:
+            response.close()
+            self.http_cache.record_revalidation()
+            return None, entry
+        
+        return response, None
+
+    def _record_rate(self, url: str, response, sent_at: float):
+        """Report status and time-to-headers to the shared rate limiter."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.record(url, response.status_code, latency=time.monotonic() - sent_at,
+                                     retry_after=response.headers.get('retry-after'))
+
+    def _store_in_http_cache(self, url: str, response: requests.Response, body: bytes):
+        """Persist a 200 response that carries validators so the next run can revalidate it."""
+        if not self.http_cache or response.status_code != 200:
+            return
+        if 'etag' not in response.headers and 'last-modified' not in response.headers:
+            return
+        headers = {name: [value] for name, value in response.headers.items()}
+        self.http_cache.store(url, response.status_code, headers, body)
+
+    def _is_large_enough(self, size: Optional[Tuple[int, int]], img_url: str) -> bool:
+        """Check parsed dimensions against min_image_size (unknown dimensions pass)."""
+        if size and (size[0] < self.min_image_size[0] or size[1] < self.min_image_size[1]):
+            self.logger.info(f"Skipping small image {size[0]}x{size[1]}: {img_url}")
+            return False
+        return True
+
+    def extract_images_trafilatura(self, url: str, meta_image: Optional[str] = None) -> List[Dict[str, any]]:
+        """PROVEN trafilatura method; reuses the metadata image the spider already extracted."""
         try:
             self.logger.info(f"Trying trafilatura for {url}")
             
-            downloaded = trafilatura.fetch_url(url)
-            if not downloaded:
-                return []
+            if meta_image is None:
+                downloaded = self.fetch_html(url)
+                if not downloaded:
+                    return []
+                
+                metadata = trafilatura.metadata.extract_metadata(ParsedDocument(downloaded).tree)
+                meta_image = getattr(metadata, 'image', None) if metadata else None
             
-            metadata = trafilatura.metadata.extract_metadata(downloaded)
             images = []
             
-            if metadata and hasattr(metadata, 'image') and metadata.image:
-                main_img_url = urljoin(url, metadata.image)
+            if meta_image:
+                main_img_url = urljoin(url, meta_image)
                 score = self.score_image_relevance(main_img_url, source_method="trafilatura_main")
                 images.append({
                     'url': main_img_url,
                     'score': score,
                     'source': 'trafilatura_main'
                 })
-                self.logger.info(f"Trafilatura found main image: {metadata.image} (score: {score})")
+                self.logger.info(f"Trafilatura found main image: {meta_image} (score: {score})")
             
             return images
             
@@ -157,8 +1323,13 @@ class ProvenImageScraperPipeline:
         try:
             self.logger.info(f"Trying newspaper3k for {url}")
             
+            html = self.fetch_html(url)
+            if not html:
+                return []
+            
+            # newspaper3k has no way to accept a pre-parsed tree, so it still parses on its own
             article = Article(url)
-            article.download()
+            article.download(input_html=html)
             article.parse()
             
             images = []
@@ -181,33 +1352,31 @@ class ProvenImageScraperPipeline:
             self.logger.warning(f"Newspaper3k failed for {url}: {e}")
             return []
 
-    def extract_images_beautifulsoup(self, url: str) -> List[Dict[str, any]]:
-        """PROVEN BeautifulSoup method using proven method."""
+    def extract_images_markup(self, url: str, candidates: Optional[List[Dict[str, str]]] = None) -> List[Dict[str, any]]:
+        """PROVEN meta tag + img tag method, reading candidates collected from the shared parsed document."""
         try:
-            self.logger.info(f"Trying BeautifulSoup for {url}")
+            self.logger.info(f"Trying markup image discovery for {url}")
             
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            if candidates is None:
+                html = self.fetch_html(url)
+                if not html:
+                    return []
+                candidates = ParsedDocument(html).image_candidates()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
             images = []
             seen_urls = set()
             
             # OpenGraph and meta tags first
-            meta_images = self.extract_opengraph_images(soup, url)
+            meta_images = self.extract_opengraph_images(candidates, url)
             images.extend(meta_images)
             seen_urls.update(img['url'] for img in meta_images)
             
             # Regular img tags
-            img_tags = soup.find_all('img')
-            
-            for img in img_tags:
-                src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
-                
-                if not src:
+            for img in candidates:
+                if img['source'] != 'soup':
                     continue
                 
-                full_url = urljoin(url, src)
+                full_url = urljoin(url, img['url'])
                 
                 if self._should_exclude_image(img, full_url):
                     continue
@@ -224,35 +1393,25 @@ class ProvenImageScraperPipeline:
             return images
             
         except Exception as e:
-            self.logger.warning(f"BeautifulSoup failed for {url}: {e}")
+            self.logger.warning(f"Markup image discovery failed for {url}: {e}")
             return []
 
-    def extract_opengraph_images(self, soup: BeautifulSoup, url: str) -> List[Dict[str, any]]:
+    def extract_opengraph_images(self, candidates: List[Dict[str, str]], url: str) -> List[Dict[str, any]]:
         """PROVEN OpenGraph extraction using proven method."""
         images = []
+        bonus = {'opengraph': 25, 'twitter_card': 20}
         
-        # OpenGraph image
-        og_image = soup.find('meta', property='og:image')
-        if og_image and og_image.get('content'):
-            img_url = urljoin(url, og_image['content'])
+        # OpenGraph image, then Twitter card image
+        for candidate in candidates:
+            if candidate['source'] not in bonus:
+                continue
+            img_url = urljoin(url, candidate['url'])
             if not self._should_exclude_image_url(img_url):
-                score = self.score_image_relevance(img_url, source_method="opengraph")
+                score = self.score_image_relevance(img_url, source_method=candidate['source'])
                 images.append({
                     'url': img_url,
-                    'score': score + 25,
-                    'source': 'opengraph'
-                })
-        
-        # Twitter card image
-        twitter_image = soup.find('meta', attrs={'name': 'twitter:image'})
-        if twitter_image and twitter_image.get('content'):
-            img_url = urljoin(url, twitter_image['content'])
-            if not self._should_exclude_image_url(img_url):
-                score = self.score_image_relevance(img_url, source_method="twitter_card")
-                images.append({
-                    'url': img_url,
-                    'score': score + 20,
-                    'source': 'twitter_card'
+                    'score': score + bonus[candidate['source']],
+                    'source': candidate['source']
                 })
         
         return images
@@ -262,11 +1421,11 @@ class ProvenImageScraperPipeline:
         if self._should_exclude_image_url(img_url):
             return True
         
-        alt_text = img_tag.get('alt', '').lower()
+        alt_text = (img_tag.get('alt') or '').lower()
         if self.exclude_regex.search(alt_text):
             return True
         
-        class_names = ' '.join(img_tag.get('class', [])).lower()
+        class_names = (img_tag.get('class') or '').lower()
         if self.exclude_regex.search(class_names):
             return True
         
@@ -307,6 +1466,8 @@ class ProvenImageScraperPipeline:
             score += 10
         elif source_method == "soup":
             score += 5
+        elif source_method == "sitemap":
+            score += 30
         
         url_lower = img_url.lower()
         
@@ -330,77 +1491,154 @@ class ProvenImageScraperPipeline:
         
         return max(0, min(100, score))
 
+    def fetch_image(self, img_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch an image with a single streamed GET.
+        Dimensions are read from the header bytes as they arrive so undersized or
+        oversized images are abandoned early; otherwise the buffered body is returned.
+        """
+        max_bytes = self.max_file_size_mb * 1024 * 1024
+        
+        try:
+            with self.host_limiter.slot(img_url):
+                response, cached = self._conditional_get(img_url, timeout=30, stream=True)
+                
+                if cached:
+                    return self._image_from_cache(cached, img_url)
+                
+                with response:
+                    response.raise_for_status()
+                    
+                    content_length = response.headers.get('content-length')
+                    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+                        self.logger.info(f"Skipping oversized image ({int(content_length) / (1024 * 1024):.1f} MB): {img_url}")
+                        return None
+                    
+                    # Preallocate from Content-Length when the server sends it
+                    buffer = ImageBuffer(int(content_length) if content_length and content_length.isdigit() else 64 * 1024)
+                    size = None
+                    probing = True
+                    
+                    for chunk in response.iter_content(chunk_size=16384):
+                        buffer.write(chunk)
+                        
+                        if buffer.size > max_bytes:
+                            self.logger.info(f"Aborting image over {self.max_file_size_mb} MB: {img_url}")
+                            return None
+                        
+                        # Parse dimensions from the header bytes only; no PIL decode needed
+                        if probing:
+                            with buffer.view() as header:
+                                size = parse_image_dimensions(header)
+                            
+                            if size:
+                                probing = False
+                                if not self._is_large_enough(size, img_url):
+                                    return None
+                            elif buffer.size >= self.header_probe_limit:
+                                # Unknown format or huge metadata block; accept without dimensions
+                                probing = False
+                    
+                    content = buffer.getvalue()
+                    self._store_in_http_cache(img_url, response, content)
+                    
+                    return {
+                        'content': content,
+                        'width': size[0] if size else None,
+                        'height': size[1] if size else None,
+                        'content_type': response.headers.get('content-type')
+                    }
+                    
+        except Exception as e:
+            self.logger.warning(f"Failed to fetch image {img_url}: {e}")
+            return None
+
+    def _image_from_cache(self, cached: Dict[str, Any], img_url: str) -> Optional[Dict[str, Any]]:
+        """304 Not Modified: reuse the body from the persistent cache, applying the same size checks."""
+        content = cached['body']
+        size = parse_image_dimensions(memoryview(content)[:self.header_probe_limit])
+        if len(content) > self.max_file_size_mb * 1024 * 1024 or not self._is_large_enough(size, img_url):
+            return None
+        return {
+            'content': content,
+            'width': size[0] if size else None,
+            'height': size[1] if size else None,
+            'content_type': cached['content_type']
+        }
+
     def validate_image_size(self, img_url: str) -> bool:
         """PROVEN validation using proven method."""
-        try:
-            head_response = self.session.head(img_url, timeout=10)
-            content_length = head_response.headers.get('content-length')
-            
-            if content_length:
-                size_mb = int(content_length) / (1024 * 1024)
-                if size_mb > self.max_file_size_mb:
-                    return False
-            
-            response = self.session.get(img_url, timeout=15, stream=True)
-            response.raise_for_status()
-            
-            chunk_size = 1024
-            data = b''
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                data += chunk
-                if len(data) > chunk_size * 10:
-                    break
-            
-            try:
-                img = Image.open(io.BytesIO(data))
-                width, height = img.size
-                
-                if width < self.min_image_size[0] or height < self.min_image_size[1]:
-                    return False
-                
-                return True
-                
-            except Exception:
-                return True
-            
-        except Exception:
-            return True
+        return self.fetch_image(img_url) is not None
 
-    def download_image(self, img_url: str, output_path: Path) -> bool:
-        """PROVEN download method using proven method."""
+    def download_image(self, img_url: str, output_path: Path, content: Optional[bytes] = None) -> Optional[Dict[str, Any]]:
+        """
+        PROVEN download method using proven method; reuses bytes already fetched by fetch_image.
+        Returns the transcoder result (mode, size, bytes written) or None on failure.
+        """
         try:
-            response = self.session.get(img_url, timeout=30)
-            response.raise_for_status()
+            if content is None:
+                fetched = self.fetch_image(img_url)
+                if not fetched:
+                    return None
+                content = fetched['content']
             
             output_path = output_path.with_suffix('.jpg')
             
-            image_data = io.BytesIO(response.content)
-            
-            with Image.open(image_data) as img:
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    rgb_img = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode == 'P':
-                        img = img.convert('RGBA')
-                    rgb_img.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                    img = rgb_img
-                elif img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                img.save(output_path, 'JPEG', quality=90, optimize=True)
+            result = self.transcoder.transcode(content, output_path)
             
-            self.logger.info(f"Downloaded and converted to JPG: {output_path.name}")
-            return True
+            if result['mode'] == 'passthrough':
+                self.logger.info(f"Saved JPG unchanged: {output_path.name}")
+            else:
+                self.logger.info(f"Downloaded and converted to JPG: {output_path.name} (from {result['source_format']})")
+            return result
             
         except Exception as e:
             self.logger.error(f"Failed to download/convert {img_url}: {e}")
-            return False
+            return None
+
+    def scrape_article_images(self, url: str, article: Optional[Dict] = None) -> Optional[Dict[str, any]]:
+        """PROVEN image scraping method; uses metadata and candidates the spider already parsed when available."""
+        # Images named by the sitemap or feed need no extraction at all
+        selected = self.first_valid_image(self.known_image_candidates(url, article))
+        if selected is None:
+            selected = self.first_valid_image(self.collect_scored_images(url, article))
+        return selected
+
+    def first_valid_image(self, candidates: List[Dict[str, any]]) -> Optional[Dict[str, any]]:
+        """Return the first candidate that passes validation, with its fetched bytes."""
+        for img_data in candidates:
+            # One GET validates the image and keeps its bytes for download_image
+            fetched = self.fetch_image(img_data['url'])
+            if fetched:
+                img_data.update(fetched)
+                self.logger.info(f"Selected best image: {img_data['url']} (score: {img_data['score']}, source: {img_data['source']})")
+                return img_data
+        
+        return None
+
+    def known_image_candidates(self, url: str, article: Optional[Dict] = None) -> List[Dict[str, any]]:
+        """Image URLs the sitemap or feed listed for this article, best score first."""
+        images = []
+        for img_url in (article or {}).get('known_images') or []:
+            full_url = urljoin(url, img_url)
+            if self._should_exclude_image_url(full_url):
+                continue
+            images.append({
+                'url': full_url,
+                'score': self.score_image_relevance(full_url, source_method="sitemap"),
+                'source': 'sitemap'
+            })
+        images.sort(key=lambda x: x['score'], reverse=True)
+        return images
 
-    def scrape_article_images(self, url: str) -> Optional[Dict[str, any]]:
-        """PROVEN image scraping method using proven method."""
+    def collect_scored_images(self, url: str, article: Optional[Dict] = None) -> List[Dict[str, any]]:
+        """Run the extractor fallbacks and return acceptable candidates, best score first."""
+        article = article or {}
         all_images = []
         
         # Method 1: Trafilatura (prioritize main images)
-        images = self.extract_images_trafilatura(url)
+        meta_image = (article['meta_image'] or '') if 'meta_image' in article else None
+        images = self.extract_images_trafilatura(url, meta_image)
         all_images.extend(images)
         
         # Method 2: Newspaper3k (if no high-quality image found yet)
@@ -409,15 +1647,15 @@ class ProvenImageScraperPipeline:
             images = self.extract_images_newspaper(url)
             all_images.extend(images)
         
-        # Method 3: BeautifulSoup with meta tags (only if still no good image)
+        # Method 3: Meta tags and img tags (only if still no good image)
         best_score = max([img['score'] for img in all_images], default=0)
         if best_score < 70:
-            images = self.extract_images_beautifulsoup(url)
+            images = self.extract_images_markup(url, article.get('image_candidates'))
             all_images.extend(images)
         
         if not all_images:
             self.logger.warning(f"No images found for {url}")
-            return None
+            return []
         
         # Remove duplicates while preserving highest score
         seen_urls = {}
@@ -426,19 +1664,746 @@ class ProvenImageScraperPipeline:
             if img_url not in seen_urls or img['score'] > seen_urls[img_url]['score']:
                 seen_urls[img_url] = img
         
-        unique_images = list(seen_urls.values())
+        MIN_ACCEPTABLE_SCORE = 40
+        
+        unique_images = [img for img in seen_urls.values() if img['score'] >= MIN_ACCEPTABLE_SCORE]
         unique_images.sort(key=lambda x: x['score'], reverse=True)
+        return unique_images
+
+    def close(self):
+        """Release pooled connections and transcoding workers."""
+        self.session.close()
+        self.transcoder.close()
+
+
+class AsyncImageScraperPipeline(ProvenImageScraperPipeline):
+    """
+    Asyncio variant of the image pipeline built on one shared httpx.AsyncClient.
+    One tunable keep-alive connection pool (HTTP/2 when h2 is installed) serves every
+    request, with per-host semaphores instead of per-thread blocking slots.
+    Candidate discovery and scoring are inherited; only the network I/O is async.
+    The event loop runs in its own thread so synchronous callers can submit coroutines.
+    """
+
+    def __init__(self, *args, pool_size: int = 100, max_per_host: int = 4,
+                 keepalive_expiry: float = 30.0, **kwargs):
+        if httpx is None:
+            raise ImportError("--async-images requires httpx (pip install 'httpx[http2]')")
+        super().__init__(*args, pool_size=pool_size, max_per_host=max_per_host, **kwargs)
+        self.pool_size = pool_size
+        self.max_per_host = max_per_host
+        self.keepalive_expiry = keepalive_expiry
+        self.client = None
+        self._host_semaphores = {}
         
-        # Find the first image that passes validation
-        MIN_ACCEPTABLE_SCORE = 40
+        self.loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self.loop.run_forever, name="async_images", daemon=True)
+        self._loop_thread.start()
+        self.run(self._open_client())
+
+    async def _open_client(self):
+        limits = httpx.Limits(
+            max_connections=self.pool_size,
+            max_keepalive_connections=self.pool_size,
+            keepalive_expiry=self.keepalive_expiry
+        )
+        self.client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=limits,
+            timeout=30,
+            follow_redirects=True,
+            headers=dict(self.session.headers)
+        )
+        self.logger.info(f"Async image client: pool {self.pool_size}, {self.max_per_host} per host, HTTP/2 {'on' if HTTP2_AVAILABLE else 'off'}")
+
+    def submit(self, coro):
+        """Schedule a coroutine on the pipeline's loop; returns a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro):
+        """Run a coroutine on the pipeline's loop and wait for its result."""
+        return self.submit(coro).result()
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        # Only touched from the loop thread, so no lock is needed
+        host = urlparse(url).netloc.lower()
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        return self._host_semaphores[host]
+
+    async def _wait_for_rate(self, url: str) -> float:
+        """Non-blocking rate limiter wait; returns the send time for latency tracking."""
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.reserve(url)
+            if wait > 0:
+                await asyncio.sleep(wait)
+        return time.monotonic()
+
+    def _cached_entry(self, url: str) -> Tuple[Optional[Dict[str, Any]], Dict[str, str]]:
+        entry = self.http_cache.get(url) if self.http_cache else None
+        return entry, (self.http_cache.conditional_headers(entry) if entry else {})
+
+    async def fetch_html_async(self, url: str) -> Optional[str]:
+        """Async fetch_html: response cache first, then a conditional GET on the shared client."""
+        html = self.response_cache.get_text(url)
+        if html is not None:
+            return html
+        
+        self.logger.info(f"Response cache miss, downloading {url}")
+        entry, headers = self._cached_entry(url)
+        async with self._host_slot(url):
+            sent_at = await self._wait_for_rate(url)
+            response = await self.client.get(url, headers=headers)
+            self._record_rate(url, response, sent_at)
+        
+        if entry and response.status_code == 304:
+            self.http_cache.record_revalidation()
+            self.response_cache.put(url, entry['body'])
+            return self.response_cache.get_text(url)
+        
+        response.raise_for_status()
+        self._store_in_http_cache(url, response, response.content)
+        self.response_cache.put(url, response.content, response.encoding or 'utf-8')
+        return response.text
+
+    async def fetch_image_async(self, img_url: str) -> Optional[Dict[str, Any]]:
+        """Async fetch_image: one streamed GET with header-byte size probing and early abort."""
+        max_bytes = self.max_file_size_mb * 1024 * 1024
+        
+        try:
+            entry, headers = self._cached_entry(img_url)
+            async with self._host_slot(img_url):
+                sent_at = await self._wait_for_rate(img_url)
+                async with self.client.stream('GET', img_url, headers=headers) as response:
+                    self._record_rate(img_url, response, sent_at)
+                    if entry and response.status_code == 304:
+                        self.http_cache.record_revalidation()
+                        return self._image_from_cache(entry, img_url)
+                    
+                    response.raise_for_status()
+                    
+                    content_length = response.headers.get('content-length')
+                    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+                        self.logger.info(f"Skipping oversized image ({int(content_length) / (1024 * 1024):.1f} MB): {img_url}")
+                        return None
+                    
+                    buffer = ImageBuffer(int(content_length) if content_length and content_length.isdigit() else 64 * 1024)
+                    size = None
+                    probing = True
+                    
+                    async for chunk in response.aiter_bytes(16384):
+                        buffer.write(chunk)
+                        
+                        if buffer.size > max_bytes:
+                            self.logger.info(f"Aborting image over {self.max_file_size_mb} MB: {img_url}")
+                            return None
+                        
+                        if probing:
+                            with buffer.view() as header:
+                                size = parse_image_dimensions(header)
+                            
+                            if size:
+                                probing = False
+                                if not self._is_large_enough(size, img_url):
+                                    return None
+                            elif buffer.size >= self.header_probe_limit:
+                                probing = False
+                    
+                    content = buffer.getvalue()
+                    self._store_in_http_cache(img_url, response, content)
+                    
+                    return {
+                        'content': content,
+                        'width': size[0] if size else None,
+                        'height': size[1] if size else None,
+                        'content_type': response.headers.get('content-type')
+                    }
+                    
+        except Exception as e:
+            self.logger.warning(f"Failed to fetch image {img_url}: {e}")
+            return None
+
+    async def validate_image_size_async(self, img_url: str) -> bool:
+        """Async validate_image_size."""
+        return await self.fetch_image_async(img_url) is not None
+
+    async def download_image_async(self, img_url: str, output_path: Path,
+                                   content: Optional[bytes] = None) -> Optional[Dict[str, Any]]:
+        """Async download_image; transcoding runs off the event loop."""
+        if content is None:
+            fetched = await self.fetch_image_async(img_url)
+            if not fetched:
+                return None
+            content = fetched['content']
+        return await asyncio.to_thread(self.download_image, img_url, output_path, content)
+
+    async def scrape_article_images_async(self, url: str, article: Optional[Dict] = None) -> Optional[Dict[str, any]]:
+        """Async scrape_article_images: candidates are found off the loop, then validated on the shared client."""
+        # Images named by the sitemap or feed need no extraction at all
+        selected = await self.first_valid_image_async(self.known_image_candidates(url, article))
+        if selected is not None:
+            return selected
+        
+        # Make sure the page is cached so the inherited extractors never block on the network
+        try:
+            await self.fetch_html_async(url)
+        except Exception as e:
+            self.logger.warning(f"Failed to fetch {url}: {e}")
         
-        for img_data in unique_images:
-            if img_data['score'] >= MIN_ACCEPTABLE_SCORE and self.validate_image_size(img_data['url']):
+        candidates = await asyncio.to_thread(self.collect_scored_images, url, article)
+        return await self.first_valid_image_async(candidates)
+
+    async def first_valid_image_async(self, candidates: List[Dict[str, any]]) -> Optional[Dict[str, any]]:
+        """Async first_valid_image."""
+        for img_data in candidates:
+            fetched = await self.fetch_image_async(img_data['url'])
+            if fetched:
+                img_data.update(fetched)
                 self.logger.info(f"Selected best image: {img_data['url']} (score: {img_data['score']}, source: {img_data['source']})")
                 return img_data
         
         return None
 
+    def close(self):
+        """Close the shared client and stop the event loop."""
+        if self.client is not None:
+            self.run(self.client.aclose())
+            self.client = None
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._loop_thread.join()
+        super().close()
+
+
+def xml_local_name(tag) -> str:
+    """Tag name without its namespace ('{http://...}loc' -> 'loc')."""
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+
+def parse_feed_date(value: Optional[str]) -> Optional[float]:
+    """Timestamp from a sitemap (ISO 8601) or RSS (RFC 822) date, or None."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    try:
+        return parsed.timestamp()
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+class SitemapFeedDiscovery:
+    """
+    Finds article URLs from robots.txt sitemaps (news sitemaps and sitemap indexes included)
+    and RSS/Atom feeds. Documents are stream-parsed with iterparse, gzipped ones too.
+    Each entry carries the title, date and any image URLs the sitemap or feed already lists.
+    """
+
+    DEFAULT_SITEMAPS = ('/news-sitemap.xml', '/sitemap_news.xml', '/sitemap.xml')
+    DEFAULT_FEEDS = ('/feed', '/rss')
+    ENTRY_TAGS = {'url', 'item', 'entry'}
+
+    def __init__(self, session: requests.Session, rate_limiter: Optional[AdaptiveRateLimiter] = None,
+                 max_documents: int = 20, max_entries: int = 5000):
+        self.session = session
+        self.rate_limiter = rate_limiter
+        self.max_documents = max_documents
+        self.max_entries = max_entries
+        self.logger = logging.getLogger(f"{__name__}_discovery")
+
+    def discover(self, homepage_url: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return same-site article entries, newest first: {url, title, date, image_urls}."""
+        parsed = urlparse(homepage_url)
+        base = f"{parsed.scheme}://{parsed.netloc}"
+        domain = parsed.netloc.lower()
+        domain = domain[4:] if domain.startswith('www.') else domain
+        
+        documents = self._robots_sitemaps(base) + self._homepage_feeds(homepage_url)
+        if not documents:
+            documents = [base + path for path in self.DEFAULT_SITEMAPS + self.DEFAULT_FEEDS]
+        
+        entries = {}
+        visited = set()
+        while documents and len(visited) < self.max_documents:
+            document_url = documents.pop(0)
+            if document_url in visited:
+                continue
+            visited.add(document_url)
+            
+            found, child_sitemaps = self._parse_document(document_url)
+            # News sitemaps first when an index lists many
+            documents.extend(sorted(child_sitemaps, key=lambda url: 'news' not in url.lower()))
+            
+            for entry in found:
+                host = urlparse(entry['url']).netloc.lower()
+                if host != domain and not host.endswith('.' + domain):
+                    continue
+                entries.setdefault(normalize_url(entry['url']), entry)
+        
+        results = sorted(entries.values(), key=lambda entry: entry['date'] or 0, reverse=True)
+        self.logger.info(f"DISCOVERY: {len(results)} article URLs from {len(visited)} sitemaps/feeds for {homepage_url}")
+        return results[:limit] if limit else results
+
+    def _get(self, url: str, **kwargs) -> Optional[requests.Response]:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url)
+        try:
+            response = self.session.get(url, timeout=30, **kwargs)
+        except requests.RequestException as e:
+            self.logger.info(f"DISCOVERY: could not fetch {url}: {e}")
+            return None
+        if response.status_code != 200:
+            response.close()
+            return None
+        return response
+
+    def _robots_sitemaps(self, base: str) -> List[str]:
+        response = self._get(base + '/robots.txt')
+        if response is None:
+            return []
+        sitemaps = []
+        for line in response.text.splitlines():
+            name, _, value = line.partition(':')
+            if name.strip().lower() == 'sitemap' and value.strip():
+                sitemaps.append(value.strip())
+        return sitemaps
+
+    def _homepage_feeds(self, homepage_url: str) -> List[str]:
+        response = self._get(homepage_url)
+        if response is None:
+            return []
+        try:
+            tree = ParsedDocument(response.text).tree
+        except Exception:
+            return []
+        feeds = []
+        for link in tree.iter('link'):
+            link_type = (link.get('type') or '').lower()
+            if (link.get('rel') or '').lower() == 'alternate' and ('rss' in link_type or 'atom' in link_type) and link.get('href'):
+                feeds.append(urljoin(homepage_url, link.get('href')))
+        return feeds
+
+    def _parse_document(self, url: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Stream-parse one sitemap, sitemap index or feed; returns (entries, child sitemap URLs)."""
+        response = self._get(url, stream=True)
+        if response is None:
+            return [], []
+        
+        entries = []
+        child_sitemaps = []
+        with response:
+            # Content-Encoding is undone by urllib3; .gz files are gzip streams themselves
+            response.raw.decode_content = True
+            source = response.raw
+            content_type = response.headers.get('content-type', '').lower()
+            if url.lower().endswith('.gz') or 'gzip' in content_type:
+                source = gzip.GzipFile(fileobj=source)
+            
+            try:
+                for _, elem in etree.iterparse(source, events=('end',), recover=True, huge_tree=True):
+                    name = xml_local_name(elem.tag)
+                    if name == 'sitemap':
+                        loc = self._child_text(elem, 'loc')
+                        if loc:
+                            child_sitemaps.append(loc)
+                    elif name in self.ENTRY_TAGS:
+                        entry = self._entry_from_element(elem, url)
+                        if entry:
+                            entries.append(entry)
+                    else:
+                        continue
+                    
+                    # Free parsed entries as we go so huge sitemaps stay flat in memory
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+                    
+                    if len(entries) >= self.max_entries:
+                        break
+            except (etree.XMLSyntaxError, OSError, EOFError) as e:
+                self.logger.info(f"DISCOVERY: stopped parsing {url}: {e}")
+        
+        return entries, child_sitemaps
+
+    def _child_text(self, elem, name: str) -> Optional[str]:
+        for child in elem.iter():
+            if child is not elem and xml_local_name(child.tag) == name and child.text and child.text.strip():
+                return child.text.strip()
+        return None
+
+    def _entry_from_element(self, elem, document_url: str) -> Optional[Dict[str, Any]]:
+        """Article entry from a sitemap <url>, RSS <item> or Atom <entry>."""
+        link = None
+        image_urls = []
+        
+        for child in elem.iter():
+            if child is elem:
+                continue
+            name = xml_local_name(child.tag)
+            parent_name = xml_local_name(child.getparent().tag)
+            
+            if name == 'loc' and parent_name == 'image':
+                if child.text and child.text.strip():
+                    image_urls.append(child.text.strip())
+            elif name in ('loc', 'link') and link is None and parent_name in self.ENTRY_TAGS:
+                # Atom puts the URL in href, RSS and sitemaps in the text
+                href = child.get('href') if child.get('rel', 'alternate') == 'alternate' else None
+                link = href or (child.text.strip() if child.text and child.text.strip() else None)
+            elif name in ('content', 'thumbnail') and child.get('url'):
+                # media:content / media:thumbnail
+                if child.get('medium', 'image') == 'image' and not (child.get('type') or 'image').startswith(('video', 'audio')):
+                    image_urls.append(child.get('url'))
+            elif name == 'enclosure' and (child.get('type') or '').startswith('image') and child.get('url'):
+                image_urls.append(child.get('url'))
+        
+        if not link:
+            return None
+        
+        date_text = None
+        for name in ('publication_date', 'pubDate', 'published', 'updated', 'lastmod', 'date'):
+            date_text = self._child_text(elem, name)
+            if date_text:
+                break
+        
+        return {
+            'url': urljoin(document_url, link),
+            'title': self._child_text(elem, 'title'),
+            'date': parse_feed_date(date_text),
+            'image_urls': list(dict.fromkeys(urljoin(document_url, image_url) for image_url in image_urls))
+        }
+
+
+# Link classifier patterns (proven heuristics), compiled once into single alternations
+ARTICLE_LINK_REGEX = re.compile('|'.join(re.escape(indicator) for indicator in [
+    '/article/', '/news/', '/story/', '/post/', '/blog/',
+    '/sports/', '/politics/', '/business/', '/technology/',
+    '/entertainment/', '/health/', '/world/', '/opinion/'
+]))
+DATE_LINK_REGEX = re.compile(r'/\d{4}(?:-\d{2})?/')
+EXCLUDE_LINK_REGEX = re.compile('|'.join(re.escape(pattern) for pattern in [
+    '/category/', '/tag/', '/author/', '/search/',
+    '/login', '/register', '/contact', '/about',
+    '/privacy', '/terms', '/rss', '/feed',
+    '.pdf', '.xml', '.json', '.js', '.css'
+]))
+
+# Article page detection patterns (research-backed)
+ARTICLE_URL_REGEX = re.compile('|'.join([
+    r'/article[s]?/', r'/news/', r'/story/', r'/post[s]?/',
+    r'/blog/', r'/opinion/', r'/feature[s]?/', r'/report[s]?/',
+    r'/\d{4}/\d{2}/', r'/\d{4}-\d{2}-\d{2}/',  # Date patterns
+    r'articleshow', r'photostory', r'/web-stories/'
+]))
+NON_ARTICLE_URL_REGEX = re.compile('|'.join([
+    r'/category/', r'/tag[s]?/', r'/archive[s]?/', r'/index',
+    r'/latest[_-]?news/', r'/updates/', r'/section[s]?/',
+    r'/home$', r'/main$', r'/$', r'/sports$', r'/business$',
+    r'/world$', r'/politics$', r'/technology$', r'/news$'
+]))
+CATEGORY_TITLE_REGEX = re.compile('|'.join([
+    r'latest.*news.*updates', r'news.*updates', r'breaking.*news',
+    r'section[s]?', r'category', r'archive[s]?', r'all.*news',
+    r'homepage', r'main.*page', r'index', r'executive.*lounge',
+    r'in.*depth', r'future.*of', r'business.*future',
+    r'latest.*news.*bbc.*news', r'updates.*bbc.*news',
+    r'africa.*latest', r'asia.*latest', r'europe.*latest',
+    r'world.*latest', r'uk.*latest', r'us.*latest'
+]))
+
+ARTICLE_SCORE_THRESHOLD = 40
+MIN_ARTICLE_WORDS = 150  # Research shows articles typically have 150+ words
+MAX_CATEGORY_WORDS = 2000  # Category pages often have lots of short summaries
+
+
+def score_article_links(homepage_url: str, links: List[str]) -> List[Tuple[str, int]]:
+    """
+    Score every link on a homepage in one pass.
+    Returns (absolute_url, score) for same-domain article candidates, in page order without duplicates.
+    A link scores 1 for an article section in its path and 1 for a date segment.
+    """
+    parsed_homepage = urlparse(homepage_url)
+    base_domain = parsed_homepage.netloc.lower()
+    origin = f"{parsed_homepage.scheme}://{parsed_homepage.netloc}"
+    same_site = parsed_homepage.scheme in ('http', 'https')
+    scored = []
+    seen = set()
+    
+    # Homepages repeat the same href many times; resolve each distinct one once
+    for link in dict.fromkeys(links):
+        try:
+            link = link.strip()
+            
+            if same_site and link.startswith('/') and not link.startswith('//') and '/.' not in link:
+                # Fast path: root-relative link on the homepage's own domain, no urljoin/urlparse needed
+                absolute_url = origin + link
+                path = link.split('#', 1)[0].split('?', 1)[0].lower()
+            else:
+                absolute_url = urljoin(homepage_url, link)
+                parsed_link = urlparse(absolute_url)
+                
+                # Must be same domain and HTTP/HTTPS
+                if parsed_link.netloc.lower() != base_domain or parsed_link.scheme not in ('http', 'https'):
+                    continue
+                path = parsed_link.path.lower()
+            
+            if absolute_url in seen:
+                continue
+            seen.add(absolute_url)
+            
+            if len(path) <= 1 or EXCLUDE_LINK_REGEX.search(path):
+                continue
+            
+            score = (1 if ARTICLE_LINK_REGEX.search(path) else 0) + (1 if DATE_LINK_REGEX.search(path) else 0)
+            if score:
+                scored.append((absolute_url, score))
+                
+        except Exception:
+            continue
+    
+    return scored
+
+
+def score_article_page(url: str, title: str, content: str) -> int:
+    """Research-backed article score from URL, title and content analysis (article if >= ARTICLE_SCORE_THRESHOLD)."""
+    url_lower = url.lower()
+    article_score = 0
+    
+    # URL scoring
+    if ARTICLE_URL_REGEX.search(url_lower):
+        article_score += 25
+    if NON_ARTICLE_URL_REGEX.search(url_lower):
+        article_score -= 30
+    
+    # Title scoring - STRENGTHENED PENALTIES
+    if CATEGORY_TITLE_REGEX.search(title.lower()):
+        article_score -= 40  # Increased penalty for category titles
+    if len(title.split()) > 4:  # Detailed titles suggest articles
+        article_score += 10
+    
+    # Content scoring
+    content_words = len(content.split()) if content else 0
+    if content_words >= MIN_ARTICLE_WORDS:
+        article_score += 20
+    if content_words < 50:  # Very short content
+        article_score -= 20
+    if content_words > MAX_CATEGORY_WORDS:  # Very long might be category
+        article_score -= 10
+    
+    # Check for list-like content (category pages often have many short items)
+    lines = content.split('\n') if content else []
+    # maxsplit=9 stops splitting long lines once they are known to have 10+ words
+    short_lines = sum(1 for line in lines if line.strip() and len(line.split(None, 9)) < 10)
+    if short_lines / max(len(lines), 1) > 0.3:  # Too many short lines (list-like)
+        article_score -= 15
+    
+    return article_score
+
+
+PATH_DATE_REGEX = re.compile(r'/(20\d{2})[/-](\d{1,2})(?:[/-](\d{1,2}))?(?=[/-]|$)')
+LISTING_PRIORITY_PENALTY = 50
+
+
+def score_listing_links(base_url: str, links: List[str], exclude: Collection[str] = ()) -> List[str]:
+    """
+    Same-site section/listing pages worth expanding in a multi-depth crawl, in page order.
+    Listings have short paths; article candidates (exclude) and excluded sections are skipped.
+    """
+    parsed_base = urlparse(base_url)
+    base_domain = parsed_base.netloc.lower()
+    listings = []
+    seen = set(exclude)
+    
+    for link in dict.fromkeys(links):
+        try:
+            absolute_url = urljoin(base_url, link.strip()).split('#', 1)[0]
+            parsed_link = urlparse(absolute_url)
+            if parsed_link.netloc.lower() != base_domain or parsed_link.scheme not in ('http', 'https'):
+                continue
+            if absolute_url in seen:
+                continue
+            seen.add(absolute_url)
+            
+            path = parsed_link.path.lower()
+            if len(path) <= 1 or EXCLUDE_LINK_REGEX.search(path) or path.strip('/').count('/') > 2:
+                continue
+            listings.append(absolute_url)
+        except Exception:
+            continue
+    
+    return listings
+
+
+def frontier_priority(url: str, link_score: int, position: int, total: int) -> int:
+    """
+    Scrapy request priority for a frontier URL (higher is fetched first).
+    Combines the link classifier score, how recent a date in the path is, and how high
+    on the page the link appeared.
+    """
+    priority = link_score * 40
+    
+    match = PATH_DATE_REGEX.search(urlparse(url).path)
+    if match:
+        try:
+            year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3) or 15)
+            days_old = (datetime.now() - datetime(year, month, day)).days
+            # Full bonus for the last couple of days, nothing after two months
+            priority += max(0, min(30, 30 - (days_old - 2) // 2))
+        except ValueError:
+            pass
+    
+    priority += int(20 * (1 - position / max(total, 1)))
+    return priority
+
+
+class BloomFilter:
+    """Fixed-memory probabilistic set: no false negatives, false positives at about error_rate."""
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        # Double hashing from one 128-bit digest
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, key: str) -> bool:
+        """Add a key; returns False if it was (probably) present already."""
+        added = False
+        for position in self._positions(key):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                added = True
+        return added
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position // 8] & (1 << (position % 8)) for position in self._positions(key))
+
+
+class FrontierDedup:
+    """Normalized-URL dedup for the crawl frontier: an exact set, or a Bloom filter for very large crawls."""
+
+    def __init__(self, bloom_capacity: Optional[int] = None):
+        self._bloom = BloomFilter(bloom_capacity) if bloom_capacity else None
+        self._seen = set()
+
+    def add(self, url: str) -> bool:
+        """Record a URL; returns False if it (or a tracking/AMP variant of it) was already scheduled."""
+        key = canonical_url_key(url)
+        if self._bloom is not None:
+            return self._bloom.add(key)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        return True
+
+
+def extract_article_page(url: str, html: str) -> Dict[str, Any]:
+    """
+    Parse, extract and score one article page.
+    Module-level and returning plain data so it can run in an extraction worker process.
+    """
+    # Parse once; image candidates are read before trafilatura prunes the tree
+    document = ParsedDocument(html)
+    image_candidates = document.image_candidates()
+    canonical = document.canonical_url()
+    
+    # Extract content and metadata using trafilatura (proven method) in one pass
+    content, metadata = document.extract_article(
+        include_comments=False,
+        include_tables=False,
+        include_images=False
+    )
+    title = metadata.get('title') or 'Unknown'
+    
+    extracted = {
+        'title': title,
+        'content': content,
+        'author': metadata.get('author'),
+        'date': metadata.get('date'),
+        'description': metadata.get('description'),
+        'meta_image': metadata.get('image'),
+        'image_candidates': image_candidates,
+        'canonical_url': urljoin(url, canonical) if canonical else None,
+        'article_score': None,
+        'simhash': None
+    }
+    
+    # Pages too short to score are rejected by the caller
+    if content and len(content.strip()) >= 50:
+        extracted['article_score'] = score_article_page(url, title, content)
+        extracted['simhash'] = simhash(content)
+    return extracted
+
+
+class ArticleCollector:
+    """
+    Receives verified articles from Scrapy's item_scraped signal and keeps them in memory.
+    Once the buffer is full, older articles are appended to an NDJSON spill file.
+    """
+
+    def __init__(self, max_buffer: int = 1000, spill_dir: Optional[str] = None,
+                 retain: bool = True, listener: Optional[Callable[[Dict], None]] = None):
+        self.max_buffer = max_buffer
+        self.spill_path = Path(spill_dir) / "articles.ndjson" if spill_dir else None
+        self.retain = retain
+        self.listener = listener
+        self._buffer = []
+        self._spilled_count = 0
+        self._count = 0
+        self._lock = threading.Lock()
+        self.crawl_stats = None
+
+    def item_scraped(self, item, response, spider):
+        """Scrapy signal handler."""
+        self.add(dict(item))
+
+    def spider_closed(self, spider, reason):
+        """Scrapy signal handler; keeps the spider's fetch/rejection counters (finalized in spider.closed)."""
+        self.crawl_stats = spider.crawl_stats
+
+    def add(self, article: Dict):
+        """Record one article and forward it to the listener, if any."""
+        with self._lock:
+            self._count += 1
+            if self.retain:
+                self._buffer.append(article)
+                if self.spill_path and len(self._buffer) >= self.max_buffer:
+                    self._spill()
+
+        if self.listener:
+            self.listener(article)
+
+    def _spill(self):
+        """Append the in-memory buffer to the NDJSON file (caller holds the lock)."""
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.spill_path, 'a', encoding='utf-8') as f:
+            for article in self._buffer:
+                f.write(json.dumps(article, ensure_ascii=False))
+                f.write('\n')
+        self._spilled_count += len(self._buffer)
+        self._buffer = []
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        """Yield articles in arrival order: spilled ones first, then the buffer."""
+        if self._spilled_count:
+            with open(self.spill_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    yield json.loads(line)
+        yield from list(self._buffer)
+
 
 class ProvenScrapyArticleExtractor:
     """
@@ -446,190 +2411,328 @@ class ProvenScrapyArticleExtractor:
     This uses the exact method that achieved 100% article discovery success.
     """
     
-    def __init__(self, max_articles: int = 40):
+    def __init__(self, max_articles: int = 40, response_cache: Optional[ResponseCache] = None,
+                 buffer_size: int = 1000, http_cache: Optional[HttpCache] = None,
+                 seen_index: Optional[SeenUrlIndex] = None, extraction_workers: int = 0,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None, download_delay: float = 0.5,
+                 concurrent_requests: int = 16, concurrent_per_domain: int = 8,
+                 max_depth: int = 1, bloom_capacity: Optional[int] = None,
+                 deduplicator: Optional[ArticleDeduplicator] = None):
         self.max_articles = max_articles
+        self.deduplicator = deduplicator
+        self.max_depth = max_depth
+        self.bloom_capacity = bloom_capacity
+        self.extraction_workers = extraction_workers
+        self.rate_limiter = rate_limiter
+        self.download_delay = download_delay
+        self.concurrent_requests = concurrent_requests
+        self.concurrent_per_domain = concurrent_per_domain
+        self.response_cache = response_cache
+        self.http_cache = http_cache
+        self.seen_index = seen_index
+        self.buffer_size = buffer_size
         self.logger = logging.getLogger(f"{__name__}_scraper")
     
-    def run_scrapy_extraction(self, homepage_url: str, output_dir: str) -> List[Dict]:
+    def run_scrapy_extraction(self, homepage_url: str, spill_dir: Optional[str] = None,
+                              article_callback: Optional[Callable[[Dict], None]] = None) -> ArticleCollector:
         """Run PROVEN Scrapy extraction method using proven method."""
+        return self.run_batch_extraction([{
+            'url': homepage_url,
+            'max_articles': self.max_articles,
+            'spill_dir': spill_dir,
+            'article_callback': article_callback
+        }])[0]
+    
+    def run_batch_extraction(self, sites: List[Dict[str, Any]]) -> List[ArticleCollector]:
+        """
+        Crawl several homepages concurrently in a single Scrapy reactor.
+        Each site dict has 'url' and optionally 'max_articles', 'spill_dir' and 'article_callback';
+        one collector is returned per site, in the same order.
+        """
+        # Articles are handed over in memory; when streaming they go straight to the callback
+        collectors = [
+            ArticleCollector(
+                max_buffer=self.buffer_size,
+                spill_dir=site.get('spill_dir'),
+                retain=site.get('article_callback') is None,
+                listener=site.get('article_callback')
+            )
+            for site in sites
+        ]
+        
         try:
             # Create temporary Scrapy settings (proven method)
             settings = {
                 'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
                 'ROBOTSTXT_OBEY': False,
-                'DOWNLOAD_DELAY': 0.5,
+                'DOWNLOAD_DELAY': self.download_delay,
                 'RANDOMIZE_DOWNLOAD_DELAY': True,
-                'CONCURRENT_REQUESTS': 16,
-                'CONCURRENT_REQUESTS_PER_DOMAIN': 8,
+                'CONCURRENT_REQUESTS': self.concurrent_requests,
+                'CONCURRENT_REQUESTS_PER_DOMAIN': self.concurrent_per_domain,
                 'TELNETCONSOLE_ENABLED': False,
                 'LOG_LEVEL': 'WARNING',
-                'MAX_ARTICLES': self.max_articles
+                'MAX_ARTICLES': self.max_articles,
+                'DOWNLOADER_MIDDLEWARES': {ArticleQuotaMiddleware: 50}
             }
             
+            # The shared adaptive limiter replaces the fixed per-slot delay; it sits after
+            # HttpCacheMiddleware (900) so cached responses skip the wait
+            if self.rate_limiter is not None:
+                settings['DOWNLOAD_DELAY'] = 0
+                settings['DOWNLOADER_MIDDLEWARES'][AdaptiveThrottleMiddleware] = 950
+            
+            # With a Bloom frontier, Scrapy's exact fingerprint set would defeat the fixed memory bound
+            if self.bloom_capacity:
+                settings['DUPEFILTER_CLASS'] = 'scrapy.dupefilters.BaseDupeFilter'
+            
+            # Persistent cross-run cache with RFC 2616 conditional revalidation
+            if self.http_cache is not None:
+                settings.update({
+                    'HTTPCACHE_ENABLED': True,
+                    'HTTPCACHE_POLICY': 'scrapy.extensions.httpcache.RFC2616Policy',
+                    'HTTPCACHE_STORAGE': ScrapyHttpCacheStorage
+                })
+            
+            # Optional process pool so trafilatura parsing doesn't block the reactor thread.
+            # Workers are spawned rather than forked from the running reactor.
+            extraction_pool = ProcessPoolExecutor(
+                max_workers=self.extraction_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            ) if self.extraction_workers > 0 else None
+            
             # Create simplified spider class (proven approach)
-            from scrapy import Spider
+            from scrapy import Spider, signals
             from scrapy.http import Request
+            from twisted.internet.defer import Deferred
             
             class ProvenHomepageSpider(Spider):
                 name = 'proven_spider'
                 
-                def __init__(self, start_url, out_dir, *args, **kwargs):
+                def __init__(self, start_url, max_articles=None, response_cache=None, http_cache=None,
+                             seen_index=None, extraction_pool=None, rate_limiter=None,
+                             discovered_articles=None, max_depth=1, bloom_capacity=None, deduplicator=None,
+                             *args, **kwargs):
                     super().__init__(*args, **kwargs)
                     self.start_urls = [start_url]
-                    self.out_dir = Path(out_dir)
-                    self.out_dir.mkdir(exist_ok=True)
+                    self.response_cache = response_cache
+                    self.http_cache = http_cache
+                    self.seen_index = seen_index
+                    self.extraction_pool = extraction_pool
+                    self.rate_limiter = rate_limiter
+                    self.discovered_articles = discovered_articles or []
+                    self.deduplicator = deduplicator
                     self.articles_scraped = 0
-                    self.max_articles = settings.get('MAX_ARTICLES', 40)
+                    self.max_articles = max_articles or settings.get('MAX_ARTICLES', 40)
+                    
+                    # Multi-depth crawl state: scheduled URLs and listing request budget
+                    self.max_depth = max_depth
+                    self.frontier = FrontierDedup(bloom_capacity)
+                    self.listing_pages = 0
+                    self.max_listing_pages = 50
+                    
+                    # Article candidates wait here and are released as the quota requires
+                    self.pending_articles = []
+                    self.pending_sequence = 0
+                    self.articles_in_flight = 0
+                    self.max_articles_in_flight = 2 * settings['CONCURRENT_REQUESTS']
+                    self.quota_reached = False
+                    self.crawl_stats = {
+                        'article_pages_fetched': 0,
+                        'accepted': 0,
+                        'rejected_too_short': 0,
+                        'rejected_not_article': 0,
+                        'unchanged': 0,
+                        'duplicate_url': 0,
+                        'duplicate_content': 0,
+                        'failed': 0,
+                        'fetched_after_quota': 0,
+                        'cancelled_after_quota': 0,
+                        'candidates_unscheduled': 0,
+                        'closed_reason': None
+                    }
+                
+                async def start(self):
+                    """Scrapy >= 2.13 entry point (start_requests is no longer called); same requests as start_requests."""
+                    for request in self.initial_requests():
+                        yield request
+                
+                def start_requests(self):
+                    """Start requests for Scrapy < 2.13."""
+                    yield from self.initial_requests()
+                
+                def initial_requests(self):
+                    """Start from sitemap/feed entries when discovery found any, otherwise from the homepage."""
+                    if not self.discovered_articles:
+                        for url in self.start_urls:
+                            yield Request(url, dont_filter=True)
+                        return
+                    
+                    entries = {entry['url']: entry for entry in self.discovered_articles}
+                    self.logger.info(f"DISCOVERY: crawling {len(entries)} sitemap/feed articles instead of homepage links")
+                    yield from self.article_requests(self.filter_seen(list(entries)), entries)
                 
                 def parse(self, response):
                     """Parse homepage and extract article links."""
                     # Extract all links using proven method
                     links = response.css('a::attr(href)').getall()
                     
+                    if self.max_depth > 1:
+                        yield from self.expand_frontier(response, links)
+                        return
+                    
                     # Filter article links using proven heuristics
                     article_links = self.suggest_article_links(response.url, links)
                     
                     # Process each article
-                    for link in article_links[:self.max_articles]:
-                        if self.articles_scraped >= self.max_articles:
+                    yield from self.article_requests(article_links)
+                
+                def expand_frontier(self, response, links: List[str]):
+                    """
+                    --depth mode: queue article links by frontier priority and, while depth allows,
+                    schedule listing pages that lead to more articles one level further down.
+                    """
+                    depth = response.meta.get('frontier_depth', 0)
+                    scored = score_article_links(response.url, links)
+                    allowed = set(self.filter_seen([link for link, _ in scored]))
+                    total = len(scored)
+                    
+                    for position, (link, link_score) in enumerate(scored):
+                        if link not in allowed:
+                            continue
+                        link = strip_tracking_params(link)
+                        if not self.frontier.add(link):
+                            continue
+                        self.queue_article(Request(
+                            url=link,
+                            callback=self.parse_article,
+                            errback=self.article_failed,
+                            priority=frontier_priority(link, link_score, position, total),
+                            meta={'article_url': link, 'frontier_depth': depth + 1}
+                        ))
+                    
+                    yield from self.release_articles()
+                    
+                    if depth + 1 >= self.max_depth or self.quota_reached:
+                        return
+                    
+                    listings = score_listing_links(response.url, links, exclude=[link for link, _ in scored])
+                    for position, link in enumerate(listings):
+                        if self.listing_pages >= self.max_listing_pages:
                             break
+                        if not self.frontier.add(link):
+                            continue
+                        self.listing_pages += 1
                         yield Request(
                             url=link,
-                            callback=self.parse_article,
-                            meta={'article_url': link}
+                            callback=self.parse,
+                            priority=frontier_priority(link, 0, position, len(listings)) - LISTING_PRIORITY_PENALTY,
+                            meta={'frontier_depth': depth + 1}
                         )
                 
-                def suggest_article_links(self, homepage_url: str, links: List[str]) -> List[str]:
-                    """PROVEN link filtering using proven method."""
-                    parsed_homepage = urlparse(homepage_url)
-                    base_domain = parsed_homepage.netloc.lower()
-                    article_links = set()
-
-                    for link in links:
-                        try:
-                            absolute_url = urljoin(homepage_url, link)
-                            parsed_link = urlparse(absolute_url)
-                            
-                            # Must be same domain
-                            if parsed_link.netloc.lower() != base_domain:
-                                continue
-                            
-                            # Must be HTTP/HTTPS
-                            if parsed_link.scheme not in ['http', 'https']:
-                                continue
-                            
-                            path = parsed_link.path.lower()
-                            
-                            # Positive indicators (proven patterns)
-                            article_indicators = [
-                                '/article/', '/news/', '/story/', '/post/', '/blog/',
-                                '/sports/', '/politics/', '/business/', '/technology/',
-                                '/entertainment/', '/health/', '/world/', '/opinion/'
-                            ]
-                            
-                            has_article_pattern = any(indicator in path for indicator in article_indicators)
-                            has_date_pattern = bool(re.search(r'/\d{4}/', path) or re.search(r'/\d{4}-\d{2}/', path))
-                            
-                            # Exclusion patterns
-                            exclude_patterns = [
-                                '/category/', '/tag/', '/author/', '/search/',
-                                '/login', '/register', '/contact', '/about',
-                                '/privacy', '/terms', '/rss', '/feed',
-                                '.pdf', '.xml', '.json', '.js', '.css'
-                            ]
-                            
-                            has_exclude_pattern = any(pattern in path for pattern in exclude_patterns)
-                            
-                            if (has_article_pattern or has_date_pattern) and not has_exclude_pattern:
-                                if len(path) > 1:
-                                    article_links.add(absolute_url)
-                                    
-                        except Exception:
+                def article_requests(self, links: List[str], discovered: Optional[Dict[str, Dict]] = None):
+                    """Queue article links in page order and release the first batch."""
+                    for position, link in enumerate(links):
+                        # Tracking/AMP variants of an already queued article are skipped
+                        request_url = strip_tracking_params(link)
+                        if not self.frontier.add(request_url):
                             continue
-                    
-                    return list(article_links)
+                        meta = {'article_url': request_url}
+                        if discovered:
+                            meta['discovered'] = discovered[link]
+                        self.queue_article(Request(
+                            url=request_url,
+                            callback=self.parse_article,
+                            errback=self.article_failed,
+                            priority=-position,
+                            meta=meta
+                        ))
+                    yield from self.release_articles()
                 
-                def is_article_page(self, url: str, title: str, content: str) -> bool:
-                    """ADVANCED ARTICLE DETECTION - Research-backed filtering method."""
-                    
-                    # 1. URL Pattern Analysis (Research-backed)
-                    url_lower = url.lower()
-                    
-                    # Positive URL indicators for articles
-                    article_url_patterns = [
-                        r'/article[s]?/', r'/news/', r'/story/', r'/post[s]?/', 
-                        r'/blog/', r'/opinion/', r'/feature[s]?/', r'/report[s]?/',
-                        r'/\d{4}/\d{2}/', r'/\d{4}-\d{2}-\d{2}/',  # Date patterns
-                        r'articleshow', r'photostory', r'/web-stories/'
-                    ]
-                    
-                    has_article_pattern = any(re.search(pattern, url_lower) for pattern in article_url_patterns)
-                    
-                    # Negative URL indicators (category/listing pages)
-                    non_article_patterns = [
-                        r'/category/', r'/tag[s]?/', r'/archive[s]?/', r'/index',
-                        r'/latest[_-]?news/', r'/updates/', r'/section[s]?/',
-                        r'/home$', r'/main$', r'/$', r'/sports$', r'/business$',
-                        r'/world$', r'/politics$', r'/technology$', r'/news$'
-                    ]
-                    
-                    has_non_article_pattern = any(re.search(pattern, url_lower) for pattern in non_article_patterns)
-                    
-                    # 2. Title Analysis (Research-backed)
-                    title_lower = title.lower()
-                    
-                    # Category page title indicators - STRENGTHENED
-                    category_title_patterns = [
-                        r'latest.*news.*updates', r'news.*updates', r'breaking.*news',
-                        r'section[s]?', r'category', r'archive[s]?', r'all.*news',
-                        r'homepage', r'main.*page', r'index', r'executive.*lounge',
-                        r'in.*depth', r'future.*of', r'business.*future',
-                        r'latest.*news.*bbc.*news', r'updates.*bbc.*news',
-                        r'africa.*latest', r'asia.*latest', r'europe.*latest',
-                        r'world.*latest', r'uk.*latest', r'us.*latest'
-                    ]
-                    
-                    is_category_title = any(re.search(pattern, title_lower) for pattern in category_title_patterns)
-                    
-                    # 3. Content Analysis (Research-backed)
-                    content_words = len(content.split()) if content else 0
-                    
-                    # Content quality indicators
-                    MIN_ARTICLE_WORDS = 150  # Research shows articles typically have 150+ words
-                    MAX_CATEGORY_WORDS = 2000  # Category pages often have lots of short summaries
-                    
-                    # Check for list-like content (category pages often have many short items)
-                    lines = content.split('\n') if content else []
-                    short_lines = [line for line in lines if len(line.split()) < 10 and len(line.strip()) > 0]
-                    list_ratio = len(short_lines) / max(len(lines), 1)
+                def queue_article(self, request):
+                    heapq.heappush(self.pending_articles, (-request.priority, self.pending_sequence, request))
+                    self.pending_sequence += 1
+                
+                def release_articles(self) -> List:
+                    """
+                    Hand queued article requests to Scrapy, only as many as the remaining quota needs.
+                    The in-flight target grows with the observed rejection rate so a picky site
+                    gets more candidates, while an easy one doesn't fetch pages it won't use.
+                    """
+                    if self.quota_reached:
+                        return []
                     
-                    # Research-backed scoring system
-                    article_score = 0
+                    judged = self.crawl_stats['article_pages_fetched']
+                    acceptance_rate = (self.crawl_stats['accepted'] + 1) / (judged + 1)
+                    needed = self.max_articles - self.articles_scraped
+                    target = min(math.ceil(needed / max(acceptance_rate, 0.1)), self.max_articles_in_flight)
                     
-                    # URL scoring
-                    if has_article_pattern:
-                        article_score += 25
-                    if has_non_article_pattern:
-                        article_score -= 30
+                    released = []
+                    while self.pending_articles and self.articles_in_flight < target:
+                        _, _, request = heapq.heappop(self.pending_articles)
+                        self.articles_in_flight += 1
+                        released.append(request)
+                    return released
+                
+                def article_done(self) -> List:
+                    """Bookkeeping after an article request finished; returns the next requests to send."""
+                    self.articles_in_flight -= 1
+                    return self.release_articles()
+                
+                def article_failed(self, failure) -> List:
+                    from scrapy.exceptions import IgnoreRequest
+                    if not failure.check(IgnoreRequest):
+                        self.crawl_stats['failed'] += 1
+                        self.logger.warning(f"Failed to fetch article {failure.request.url}: {failure.value}")
+                    return self.article_done()
+                
+                def close_for_quota(self):
+                    """Stop the crawl as soon as the verified-article quota is met."""
+                    from twisted.internet import reactor
                     
-                    # Title scoring - STRENGTHENED PENALTIES
-                    if is_category_title:
-                        article_score -= 40  # Increased penalty for category titles
-                    if len(title.split()) > 4:  # Detailed titles suggest articles
-                        article_score += 10
+                    self.quota_reached = True
+                    self.crawl_stats['candidates_unscheduled'] = len(self.pending_articles)
+                    self.pending_articles.clear()
+                    self.logger.info(f"QUOTA REACHED: {self.articles_scraped} articles, closing spider")
                     
-                    # Content scoring
-                    if content_words >= MIN_ARTICLE_WORDS:
-                        article_score += 20
-                    if content_words < 50:  # Very short content
-                        article_score -= 20
-                    if content_words > MAX_CATEGORY_WORDS:  # Very long might be category
-                        article_score -= 10
-                    if list_ratio > 0.3:  # Too many short lines (list-like)
-                        article_score -= 15
+                    # Next reactor turn, so the item from the current callback is collected first;
+                    # scheduled requests are dropped and AdaptiveThrottleMiddleware cancels waiting ones
+                    reactor.callLater(0, self.close_engine, 'article_quota_reached')
+                
+                def close_engine(self, reason: str):
+                    """close_spider_async() on Scrapy versions that have it (close_spider is deprecated there)."""
+                    engine = self.crawler.engine
+                    if hasattr(engine, 'close_spider_async'):
+                        from scrapy.utils.defer import deferred_from_coro
+                        deferred_from_coro(engine.close_spider_async(reason=reason))
+                    else:
+                        engine.close_spider(self, reason)
+                
+                def closed(self, reason):
+                    self.crawl_stats['closed_reason'] = reason
+                    fetched = self.crawl_stats['article_pages_fetched']
+                    self.crawl_stats['wasted_fetches'] = fetched - self.crawl_stats['accepted']
+                    self.crawl_stats['wasted_fetch_ratio'] = round(self.crawl_stats['wasted_fetches'] / fetched, 3) if fetched else 0.0
+                    for key, value in self.crawl_stats.items():
+                        self.crawler.stats.set_value(f"articles/{key}", value)
+                
+                def suggest_article_links(self, homepage_url: str, links: List[str]) -> List[str]:
+                    """PROVEN link filtering using the precompiled module-level classifier."""
+                    return self.filter_seen([link for link, _ in score_article_links(homepage_url, links)])
+                
+                def filter_seen(self, article_links: List[str]) -> List[str]:
+                    # Incremental mode: drop links we already saved in a previous run
+                    # (the index canonicalizes, so raw links with tracking params match saved articles)
+                    if self.seen_index is not None:
+                        new_links = [link for link in article_links if not self.seen_index.should_skip(link)]
+                        self.logger.info(f"INCREMENTAL: {len(article_links) - len(new_links)} already-saved links skipped")
+                        return new_links
                     
+                    return article_links
+                
+                def is_article_page(self, url: str, article_score: int) -> bool:
+                    """ADVANCED ARTICLE DETECTION - Research-backed filtering method."""
                     # Final decision (research-backed threshold) - RAISED for better filtering
-                    is_article = article_score >= 40
+                    is_article = article_score >= ARTICLE_SCORE_THRESHOLD
                     
                     self.logger.info(f"Article detection: {url} -> Score: {article_score}, Is Article: {is_article}")
                     return is_article
@@ -637,91 +2740,169 @@ class ProvenScrapyArticleExtractor:
                 def parse_article(self, response):
                     """Parse individual article using proven trafilatura method + ADVANCED FILTERING."""
                     try:
-                        if self.articles_scraped >= self.max_articles:
-                            return
+                        if self.quota_reached:
+                            # Was already in flight when the quota was met
+                            self.crawl_stats['fetched_after_quota'] += 1
+                            self.articles_in_flight -= 1
+                            return []
                         
+                        self.crawl_stats['article_pages_fetched'] += 1
                         url = response.meta['article_url']
                         
                         # Use proven trafilatura extraction
                         html_content = response.body.decode('utf-8', errors='replace')
                         
-                        # Extract content using trafilatura (proven method)
-                        content = trafilatura.extract(
-                            html_content,
-                            include_comments=False,
-                            include_tables=False,
-                            include_images=False
-                        )
-                        
-                        metadata = trafilatura.metadata.extract_metadata(html_content)
-                        title = metadata.title if metadata and metadata.title else 'Unknown'
+                        # Share the downloaded page with the image pipeline
+                        if self.response_cache is not None:
+                            self.response_cache.put(url, response.body, getattr(response, 'encoding', None) or 'utf-8')
                         
-                        # ADVANCED ARTICLE FILTERING (Research-backed)
-                        if not content or len(content.strip()) < 50:
-                            self.logger.info(f"FILTERED: Too short content - {url}")
-                            return
+                        # --depth mode: related links on article pages extend the frontier too
+                        follow_ups = []
+                        if self.max_depth > 1 and response.meta.get('frontier_depth', 0) < self.max_depth:
+                            follow_ups = list(self.expand_frontier(response, response.css('a::attr(href)').getall()))
                         
-                        if not self.is_article_page(url, title, content):
-                            self.logger.info(f"FILTERED: Not an article page - {url}")
-                            return
+                        discovered = response.meta.get('discovered')
+                        if self.extraction_pool is None:
+                            items = self.build_article(url, extract_article_page(url, html_content), discovered)
+                            return follow_ups + items + self.article_done()
                         
-                        # Create article data (only for confirmed articles)
-                        article_data = {
-                            'url': url,
-                            'title': title,
-                            'content': content,
-                            'author': metadata.author if metadata else None,
-                            'date': metadata.date if metadata else None,
-                            'description': metadata.description if metadata else None,
-                            'extraction_method': 'proven_trafilatura_filtered',
-                            'scraped_timestamp': time.time(),
-                            'word_count': len(content.split()),
-                            'is_verified_article': True
-                        }
-                        
-                        # Save article (proven method)
-                        safe_title = self.sanitize_filename(article_data['title'])
-                        output_file = self.out_dir / f"{safe_title}_{self.articles_scraped + 1}.json"
-                        
-                        with open(output_file, 'w', encoding='utf-8') as f:
-                            json.dump(article_data, f, indent=2, ensure_ascii=False)
-                        
-                        self.articles_scraped += 1
-                        self.logger.info(f"VERIFIED ARTICLE {self.articles_scraped}: {article_data['title'][:60]}... ({article_data['word_count']} words)")
+                        # Extract in a worker process; the reactor keeps downloading meanwhile
+                        deferred = self.extract_in_pool(url, html_content, discovered)
+                        deferred.addCallback(lambda items: follow_ups + items + self.article_done())
+                        return deferred
                         
                     except Exception as e:
                         self.logger.warning(f"Failed to parse article {response.url}: {e}")
+                        self.crawl_stats['failed'] += 1
+                        return self.article_done()
                 
-                def sanitize_filename(self, filename: str) -> str:
-                    """Proven filename sanitization."""
-                    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
-                    filename = re.sub(r'\s+', '_', filename.strip())[:100]
-                    return filename if filename else "unnamed_article"
-            
-            # Run Scrapy process (proven method)
-            output_path = Path(output_dir)
-            output_path.mkdir(exist_ok=True)
+                def extract_in_pool(self, url: str, html_content: str, discovered: Optional[Dict] = None) -> Deferred:
+                    """Submit extraction to the process pool; the Deferred fires in the reactor thread."""
+                    from twisted.internet import reactor
+                    
+                    deferred = Deferred()
+                    
+                    def fire(future):
+                        if future.exception() is not None:
+                            deferred.errback(future.exception())
+                        else:
+                            deferred.callback(future.result())
+                    
+                    future = self.extraction_pool.submit(extract_article_page, url, html_content)
+                    future.add_done_callback(lambda done: reactor.callFromThread(fire, done))
+                    
+                    deferred.addCallback(lambda extracted: self.build_article(url, extracted, discovered))
+                    deferred.addErrback(lambda failure: self.extraction_failed(url, failure))
+                    return deferred
+                
+                def extraction_failed(self, url: str, failure) -> List[Dict]:
+                    self.logger.warning(f"Failed to parse article {url}: {failure.value}")
+                    self.crawl_stats['failed'] += 1
+                    return []
+                
+                def build_article(self, url: str, extracted: Dict[str, Any],
+                                  discovered: Optional[Dict] = None) -> List[Dict]:
+                    """Apply the article filters to extracted page data; returns the items to emit."""
+                    if self.quota_reached:
+                        self.crawl_stats['fetched_after_quota'] += 1
+                        return []
+                    
+                    content = extracted['content']
+                    
+                    # ADVANCED ARTICLE FILTERING (Research-backed)
+                    if extracted['article_score'] is None:
+                        self.logger.info(f"FILTERED: Too short content - {url}")
+                        self.crawl_stats['rejected_too_short'] += 1
+                        return []
+                    
+                    if not self.is_article_page(url, extracted['article_score']):
+                        self.logger.info(f"FILTERED: Not an article page - {url}")
+                        self.crawl_stats['rejected_not_article'] += 1
+                        return []
+                    
+                    # Incremental mode: a rechecked page whose text hasn't changed needs no reprocessing
+                    text_hash = content_hash(content)
+                    if self.seen_index is not None and self.seen_index.is_unchanged(url, text_hash):
+                        self.logger.info(f"UNCHANGED: Already saved, content identical - {url}")
+                        self.crawl_stats['unchanged'] += 1
+                        return []
+                    
+                    # Same story under another URL (rel=canonical, AMP, aliases) or near-identical text
+                    if self.deduplicator is not None:
+                        url_keys = {canonical_url_key(url)}
+                        if extracted['canonical_url']:
+                            url_keys.add(canonical_url_key(extracted['canonical_url']))
+                        duplicate = self.deduplicator.check(url_keys, extracted['simhash'])
+                        if duplicate:
+                            self.logger.info(f"DUPLICATE: {duplicate.replace('_', ' ')} - {url}")
+                            self.crawl_stats[duplicate] += 1
+                            return []
+                    
+                    # Create article data (only for confirmed articles)
+                    article_data = {
+                        'url': url,
+                        'title': extracted['title'],
+                        'content': content,
+                        'author': extracted['author'],
+                        'date': extracted['date'],
+                        'description': extracted['description'],
+                        'meta_image': extracted['meta_image'],
+                        'image_candidates': extracted['image_candidates'],
+                        'extraction_method': 'proven_trafilatura_filtered',
+                        'scraped_timestamp': time.time(),
+                        'word_count': len(content.split()),
+                        'content_hash': text_hash,
+                        'canonical_url': extracted['canonical_url'],
+                        'content_simhash': f"{extracted['simhash']:016x}",
+                        'is_verified_article': True
+                    }
+                    
+                    # Sitemap/feed metadata fills gaps and hands known images to the image stage
+                    if discovered:
+                        if article_data['title'] == 'Unknown' and discovered.get('title'):
+                            article_data['title'] = discovered['title']
+                        if not article_data['date'] and discovered.get('date'):
+                            article_data['date'] = datetime.fromtimestamp(discovered['date']).strftime('%Y-%m-%d')
+                        article_data['known_images'] = discovered.get('image_urls', [])
+                        article_data['extraction_method'] = 'proven_trafilatura_filtered_sitemap'
+                    
+                    self.articles_scraped += 1
+                    self.crawl_stats['accepted'] += 1
+                    self.logger.info(f"VERIFIED ARTICLE {self.articles_scraped}: {article_data['title'][:60]}... ({article_data['word_count']} words)")
+                    
+                    if self.articles_scraped >= self.max_articles:
+                        self.close_for_quota()
+                    
+                    # Hand the article to the in-memory collector (item_scraped signal)
+                    return [article_data]
             
+            # Run Scrapy process (proven method): one crawler per site, one reactor for all
             process = CrawlerProcess(settings)
-            process.crawl(ProvenHomepageSpider, start_url=homepage_url, out_dir=output_dir)
-            process.start()
-            
-            # Load results
-            articles = []
-            for json_file in output_path.glob("*.json"):
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        article_data = json.load(f)
-                        articles.append(article_data)
-                except Exception as e:
-                    self.logger.error(f"Error loading {json_file}: {e}")
+            for site, collector in zip(sites, collectors):
+                crawler = process.create_crawler(ProvenHomepageSpider)
+                crawler.signals.connect(collector.item_scraped, signal=signals.item_scraped)
+                crawler.signals.connect(collector.spider_closed, signal=signals.spider_closed)
+                process.crawl(crawler, start_url=site['url'], max_articles=site.get('max_articles', self.max_articles),
+                              response_cache=self.response_cache, http_cache=self.http_cache,
+                              seen_index=self.seen_index, extraction_pool=extraction_pool,
+                              rate_limiter=self.rate_limiter, discovered_articles=site.get('discovered'),
+                              max_depth=self.max_depth, bloom_capacity=self.bloom_capacity,
+                              deduplicator=self.deduplicator)
+            if extraction_pool is not None:
+                self.logger.info(f"PROVEN SCRAPY: Extracting articles in {self.extraction_workers} worker processes")
+            try:
+                process.start()
+            finally:
+                if extraction_pool is not None:
+                    extraction_pool.shutdown(cancel_futures=True)
             
-            self.logger.info(f"PROVEN SCRAPY: Successfully extracted {len(articles)} articles")
-            return articles
+            for site, collector in zip(sites, collectors):
+                self.logger.info(f"PROVEN SCRAPY: Successfully extracted {len(collector)} articles from {site['url']}")
+            return collectors
             
         except Exception as e:
             self.logger.error(f"Scrapy extraction failed: {e}")
-            return []
+            return collectors
 
 
 class UltimateScraperV2:
@@ -733,11 +2914,30 @@ class UltimateScraperV2:
     """
     
     def __init__(self, output_base_dir: str = "./articles_output", 
-                 max_concurrent: int = 30, enable_cache: bool = True):
+                 max_concurrent: int = 30, enable_cache: bool = True,
+                 response_cache_mb: int = 256, max_per_host: int = 4,
+                 article_buffer_size: int = 1000, cache_dir: str = ".scraper_cache",
+                 cache_size_mb: int = 1024, incremental: bool = False,
+                 recheck_hours: Optional[float] = None, extraction_workers: int = 0,
+                 transcode_workers: int = 0, max_image_dim: Optional[int] = None,
+                 thumbnails: Collection[int] = (), async_images: bool = False,
+                 download_delay: float = 0.5, concurrent_requests: int = 16,
+                 concurrent_per_domain: int = 8, max_host_rate: float = 20.0,
+                 discover_feeds: bool = False, max_depth: int = 1,
+                 bloom_capacity: Optional[int] = None, dedup: bool = True):
         """Initialize the TRUE ultimate scraper."""
         self.output_base_dir = Path(output_base_dir)
         self.max_concurrent = max_concurrent
+        self.extraction_workers = extraction_workers
+        self.async_images = async_images
+        self.download_delay = download_delay
+        self.concurrent_requests = concurrent_requests
+        self.concurrent_per_domain = concurrent_per_domain
+        self.discover_feeds = discover_feeds
+        self.max_depth = max_depth
+        self.bloom_capacity = bloom_capacity
         self.enable_cache = enable_cache
+        self.article_buffer_size = article_buffer_size
         
         # Create output directory
         self.output_base_dir.mkdir(parents=True, exist_ok=True)
@@ -746,8 +2946,51 @@ class UltimateScraperV2:
         self.setup_logging()
         self.logger = logging.getLogger(__name__)
         
-        # Initialize PROVEN components
-        self.image_pipeline = ProvenImageScraperPipeline()
+        # Streaming mode queue statistics (None for the two-phase run)
+        self.pipeline_stats = None
+        
+        # Per-homepage crawl counters (fetched, rejected, wasted after quota)
+        self.crawl_stats = {}
+        
+        # Per-run scratch space for cache and article spill files
+        self.work_dir = Path(tempfile.mkdtemp(prefix="proven_scraper_"))
+        
+        # Per-run response cache: Scrapy fills it, image extractors read from it
+        self.response_cache = ResponseCache(
+            max_memory_mb=response_cache_mb,
+            spill_dir=str(self.work_dir / "responses")
+        )
+        
+        # Incremental mode: index of articles saved by previous runs
+        self.seen_index = SeenUrlIndex(
+            self.output_base_dir / ".seen_urls.json",
+            recheck_hours=recheck_hours
+        ) if incremental else None
+        
+        # Duplicate articles (across sites in a batch) and images stored once per output directory
+        self.deduplicator = ArticleDeduplicator() if dedup else None
+        self.image_store = ImageDedupStore(self.output_base_dir / ".image_manifest.json") if dedup else None
+        
+        # Persistent cross-run HTTP cache shared by Scrapy and the image session
+        self.http_cache = HttpCache(cache_dir, max_size_mb=cache_size_mb) if enable_cache else None
+        
+        # Per-host adaptive rate limiter shared by the spider and the image fetchers;
+        # --download-delay sets the starting pace for every host
+        self.rate_limiter = AdaptiveRateLimiter(
+            initial_rate=1 / download_delay if download_delay > 0 else max_host_rate,
+            max_rate=max_host_rate
+        )
+        
+        # Initialize PROVEN components; --async-images swaps in the httpx-based pipeline
+        pipeline_class = AsyncImageScraperPipeline if async_images else ProvenImageScraperPipeline
+        self.image_pipeline = pipeline_class(
+            response_cache=self.response_cache,
+            pool_size=max_concurrent,
+            max_per_host=max_per_host,
+            http_cache=self.http_cache,
+            transcoder=ImageTranscoder(workers=transcode_workers, max_dim=max_image_dim, thumbnails=thumbnails),
+            rate_limiter=self.rate_limiter
+        )
         
     def setup_logging(self):
         """Setup Windows-compatible logging."""
@@ -782,100 +3025,321 @@ class UltimateScraperV2:
         
         return safe_name or "untitled_article"
 
-    def run_proven_article_extraction(self, homepage_url: str, max_articles: int = 40) -> List[Dict]:
+    def create_site_folder_name(self, homepage_url: str) -> str:
+        """Create an output subfolder name for one homepage in batch mode."""
+        parsed = urlparse(homepage_url)
+        return self.create_safe_folder_name(f"{parsed.netloc} {parsed.path.replace('/', ' ')}")
+
+    def run_proven_article_extraction(self, homepage_url: str, max_articles: int = 40,
+                                      article_callback: Optional[Callable[[Dict], None]] = None) -> ArticleCollector:
         """Run PROVEN article extraction using proven Scrapy method."""
+        return self.run_batch_article_extraction([{
+            'url': homepage_url,
+            'max_articles': max_articles,
+            'article_callback': article_callback
+        }])[0]
+
+    def run_batch_article_extraction(self, sites: List[Dict[str, Any]]) -> List[ArticleCollector]:
+        """Run PROVEN article extraction for one or more homepages in a single Scrapy reactor."""
         self.logger.info("PHASE 1: PROVEN ARTICLE EXTRACTION (proven Scrapy method)")
-        self.logger.info(f"Using proven Scrapy CrawlerProcess method")
-        
-        # Create temporary directory for Scrapy output
-        temp_dir = tempfile.mkdtemp(prefix="proven_scraper_")
+        self.logger.info(f"Using proven Scrapy CrawlerProcess method ({len(sites)} site(s))")
         
         try:
-            # Use PROVEN Scrapy extractor
-            extractor = ProvenScrapyArticleExtractor(max_articles)
-            articles = extractor.run_scrapy_extraction(homepage_url, temp_dir)
+            # Use PROVEN Scrapy extractor; articles come back in memory (spilling to NDJSON on huge runs)
+            extractor = ProvenScrapyArticleExtractor(
+                max(site.get('max_articles', 40) for site in sites),
+                response_cache=self.response_cache,
+                buffer_size=self.article_buffer_size,
+                http_cache=self.http_cache,
+                seen_index=self.seen_index,
+                extraction_workers=self.extraction_workers,
+                rate_limiter=self.rate_limiter,
+                download_delay=self.download_delay,
+                concurrent_requests=self.concurrent_requests,
+                concurrent_per_domain=self.concurrent_per_domain,
+                max_depth=self.max_depth,
+                bloom_capacity=self.bloom_capacity,
+                deduplicator=self.deduplicator
+            )
+            crawl_sites = [
+                dict(site, spill_dir=str(self.work_dir / f"site_{i}"))
+                for i, site in enumerate(sites)
+            ]
+            
+            # Sitemap/feed front-end; sites where it finds nothing fall back to homepage links
+            if self.discover_feeds:
+                discovery = SitemapFeedDiscovery(self.image_pipeline.session, rate_limiter=self.rate_limiter)
+                for site in crawl_sites:
+                    site['discovered'] = discovery.discover(site['url'])
             
-            self.logger.info(f"PROVEN EXTRACTION SUCCESS: {len(articles)} articles found")
-            return articles
+            collectors = extractor.run_batch_extraction(crawl_sites)
+            
+            for site, articles in zip(sites, collectors):
+                self.logger.info(f"PROVEN EXTRACTION SUCCESS: {len(articles)} articles found on {site['url']}")
+                crawl_stats = getattr(articles, 'crawl_stats', None)
+                if crawl_stats:
+                    self.crawl_stats[site['url']] = crawl_stats
+                    self.logger.info(f"Crawl efficiency: {crawl_stats['article_pages_fetched']} article pages fetched, "
+                                     f"{crawl_stats.get('wasted_fetches', 0)} wasted, "
+                                     f"{crawl_stats['cancelled_after_quota']} requests cancelled at quota")
+            return collectors
             
         except Exception as e:
             self.logger.error(f"Proven article extraction failed: {e}")
-            return []
-        finally:
-            # Cleanup temp directory
+            return [[] for _ in sites]
+
+    def process_article_image(self, i: int, article: Dict, output_base_dir: Optional[Path] = None) -> Optional[Dict]:
+        """Find, download and save the image for one article; returns the article on success."""
+        try:
+            url = article.get('url')
+            title = article.get('title', f'Article_{i+1}')
+            
+            if not url:
+                return None
+            
+            self.logger.info(f"Processing image for: {title[:60]}...")
+            
+            # Use PROVEN image scraping method
+            best_image_data = self.image_pipeline.scrape_article_images(url, article)
+            return self.save_article_image(i, article, best_image_data, output_base_dir)
+            
+        except Exception as e:
+            self.logger.error(f"Error processing article {i+1}: {e}")
+            article['image_saved'] = False
+            return None
+
+    async def process_article_image_async(self, i: int, article: Dict, output_base_dir: Optional[Path] = None) -> Optional[Dict]:
+        """process_article_image for --async-images: network I/O on the event loop, file work in a thread."""
+        try:
+            url = article.get('url')
+            title = article.get('title', f'Article_{i+1}')
+            
+            if not url:
+                return None
+            
+            self.logger.info(f"Processing image for: {title[:60]}...")
+            
+            best_image_data = await self.image_pipeline.scrape_article_images_async(url, article)
+            return await asyncio.to_thread(self.save_article_image, i, article, best_image_data, output_base_dir)
+            
+        except Exception as e:
+            self.logger.error(f"Error processing article {i+1}: {e}")
+            article['image_saved'] = False
+            return None
+
+    def submit_article_image(self, executor: ThreadPoolExecutor, i: int, article: Dict,
+                             output_base_dir: Optional[Path] = None):
+        """Start image processing for one article on the thread pool, or on the async pipeline's loop."""
+        if self.async_images:
+            return self.image_pipeline.submit(self.process_article_image_async(i, article, output_base_dir))
+        return executor.submit(self.process_article_image, i, article, output_base_dir)
+
+    def save_article_image(self, i: int, article: Dict, best_image_data: Optional[Dict],
+                           output_base_dir: Optional[Path] = None) -> Optional[Dict]:
+        """Save the selected image and article.json for one article; returns the article on success."""
+        try:
+            url = article.get('url')
+            title = article.get('title', f'Article_{i+1}')
+            
+            # Candidates are only needed for image selection
+            article.pop('image_candidates', None)
+            
+            if not best_image_data:
+                self.logger.warning(f"No suitable image found for: {title[:60]}")
+                article['image_saved'] = False
+                return None
+            
+            # Create folder name in exact format
+            folder_name = self.create_safe_folder_name(title)
+            output_dir = (output_base_dir or self.output_base_dir) / folder_name
+            output_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Download using PROVEN method
+            img_path = output_dir / "image"
+            
+            # The image body was already fetched during validation; keep it out of article.json
+            image_content = best_image_data.pop('content', None)
+            
+            # Same image bytes already saved (with the same size/thumbnail settings) for another article: link to that copy
+            digest = None
+            if self.image_store is not None and image_content:
+                image_hash = hashlib.sha1(image_content)
+                image_hash.update(self.image_pipeline.transcoder.settings_key().encode())
+                digest = image_hash.hexdigest()
+            stored = self.image_store.lookup(digest) if digest else None
+            if stored:
+                saved_image = self.image_store.link(stored, output_dir, url)
+                self.logger.info(f"DUPLICATE IMAGE: {folder_name} reuses {saved_image['duplicate_of']}")
+            else:
+                saved_image = self.image_pipeline.download_image(best_image_data['url'], img_path, content=image_content)
+                if saved_image and digest:
+                    self.image_store.add(digest, dict(saved_image), output_dir, url)
+            
+            if not saved_image:
+                self.logger.warning(f"Failed to download image for: {title[:60]}")
+                article['image_saved'] = False
+                return None
+            
+            # Update article data; resized variants sit next to image.jpg
+            best_image_data['variants'] = saved_image.pop('variants')
+            best_image_data['saved'] = saved_image
+            article['image_info'] = best_image_data
+            article['image_path'] = str(output_dir / "image.jpg")
+            article['image_saved'] = True
+            article['processing_timestamp'] = time.time()
+            
+            # SAVE ARTICLE TEXT AS JSON (this was missing!)
+            article_json_path = output_dir / "article.json"
             try:
-                shutil.rmtree(temp_dir)
-            except:
-                pass
+                with open(article_json_path, 'w', encoding='utf-8') as f:
+                    json.dump(article, f, indent=2, ensure_ascii=False)
+                self.logger.info(f"SAVED: {folder_name}/article.json")
+            except Exception as e:
+                self.logger.warning(f"Failed to save article JSON: {e}")
+            
+            if self.seen_index is not None and article.get('content_hash'):
+                self.seen_index.record(url, article['content_hash'], str(output_dir))
+            
+            self.logger.info(f"SUCCESS: Saved {folder_name}/image.jpg (score: {best_image_data['score']})")
+            return article
+            
+        except Exception as e:
+            self.logger.error(f"Error processing article {i+1}: {e}")
+            article['image_saved'] = False
+            return None
 
-    def run_proven_image_processing(self, articles: List[Dict]) -> List[Dict]:
+    def run_proven_image_processing(self, articles: Collection[Dict], output_base_dir: Optional[Path] = None) -> List[Dict]:
         """Run PROVEN image processing using proven ImagePipeline method."""
         if not articles:
             return []
             
         self.logger.info("PHASE 2: PROVEN IMAGE PROCESSING (proven ImagePipeline method)")
-        self.logger.info(f"Processing {len(articles)} articles with proven ImageScraperPipeline")
+        self.logger.info(f"Processing {len(articles)} articles with proven ImageScraperPipeline "
+                         f"({self.max_concurrent} workers, {self.image_pipeline.host_limiter.max_per_host} per host)")
         
-        successful_articles = []
+        results = [None] * len(articles)
+        workers = max(1, min(self.max_concurrent, len(articles)))
         
-        for i, article in enumerate(articles):
-            try:
-                url = article.get('url')
-                title = article.get('title', f'Article_{i+1}')
-                
-                if not url:
-                    continue
-                
-                self.logger.info(f"Processing image for: {title[:60]}...")
-                
-                # Use PROVEN image scraping method
-                best_image_data = self.image_pipeline.scrape_article_images(url)
-                
-                if best_image_data:
-                    # Create folder name in exact format
-                    folder_name = self.create_safe_folder_name(title)
-                    output_dir = self.output_base_dir / folder_name
-                    output_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    # Download using PROVEN method
-                    img_path = output_dir / "image"
-                    
-                    if self.image_pipeline.download_image(best_image_data['url'], img_path):
-                        # Update article data
-                        article['image_info'] = best_image_data
-                        article['image_path'] = str(output_dir / "image.jpg")
-                        article['image_saved'] = True
-                        article['processing_timestamp'] = time.time()
-                        
-                        # SAVE ARTICLE TEXT AS JSON (this was missing!)
-                        article_json_path = output_dir / "article.json"
-                        try:
-                            with open(article_json_path, 'w', encoding='utf-8') as f:
-                                json.dump(article, f, indent=2, ensure_ascii=False)
-                            self.logger.info(f"SAVED: {folder_name}/article.json")
-                        except Exception as e:
-                            self.logger.warning(f"Failed to save article JSON: {e}")
-                        
-                        successful_articles.append(article)
-                        self.logger.info(f"SUCCESS: Saved {folder_name}/image.jpg (score: {best_image_data['score']})")
-                    else:
-                        self.logger.warning(f"Failed to download image for: {title[:60]}")
-                        article['image_saved'] = False
-                else:
-                    self.logger.warning(f"No suitable image found for: {title[:60]}")
-                    article['image_saved'] = False
-                    
-            except Exception as e:
-                self.logger.error(f"Error processing article {i+1}: {e}")
-                article['image_saved'] = False
+        # Bounded worker pool; per-host limits are enforced inside the image pipeline
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image_worker") as executor:
+            futures = {
+                self.submit_article_image(executor, i, article, output_base_dir): i
+                for i, article in enumerate(articles)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        # Keep the original article order regardless of completion order
+        successful_articles = [article for article in results if article]
         
         success_rate = len(successful_articles) / len(articles) * 100 if articles else 0
         self.logger.info(f"PROVEN IMAGE PROCESSING COMPLETE: {len(successful_articles)}/{len(articles)} articles with images ({success_rate:.1f}%)")
         
         return successful_articles
 
-    def create_ultimate_summary_v2(self, articles: List[Dict], start_time: float, homepage_url: str):
+    def run_streaming_pipeline(self, sites: List[Dict[str, Any]], start_time: float) -> List[Tuple[ArticleCollector, List[Dict]]]:
+        """
+        Crawl and process images concurrently: each verified article is queued for the image stage as soon as it is parsed.
+        Returns (articles, successful_articles) per site, in the order the sites were given.
+        """
+        self.logger.info("STREAMING MODE: image processing starts as soon as each article is verified")
+        
+        article_queue = queue.Queue()
+        results = []
+        stats = {
+            'articles_queued': 0,
+            'max_article_queue_depth': 0,
+            'max_images_in_flight': 0,
+            'time_to_first_saved_article_seconds': None
+        }
+        stats_lock = threading.Lock()
+        
+        def enqueue_article(site_index: int, article: Dict):
+            # Called from the Scrapy reactor thread
+            article_queue.put((site_index, article))
+            with stats_lock:
+                stats['articles_queued'] += 1
+                stats['max_article_queue_depth'] = max(stats['max_article_queue_depth'], article_queue.qsize())
+        
+        def consume_articles():
+            workers = max(1, self.max_concurrent)
+            free_workers = threading.BoundedSemaphore(workers)
+            in_flight = [0]
+            
+            def finished(future):
+                with stats_lock:
+                    in_flight[0] -= 1
+                    if not future.cancelled() and future.result() and stats['time_to_first_saved_article_seconds'] is None:
+                        stats['time_to_first_saved_article_seconds'] = round(time.time() - start_time, 2)
+                free_workers.release()
+            
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image_worker") as executor:
+                i = 0
+                while True:
+                    # Wait for a free worker so the queue depth reflects real backlog
+                    free_workers.acquire()
+                    item = article_queue.get()
+                    if item is None:
+                        free_workers.release()
+                        break
+                    site_index, article = item
+                    with stats_lock:
+                        in_flight[0] += 1
+                        stats['max_images_in_flight'] = max(stats['max_images_in_flight'], in_flight[0])
+                    future = self.submit_article_image(executor, i, article, sites[site_index].get('output_dir'))
+                    future.add_done_callback(finished)
+                    results.append((site_index, future))
+                    i += 1
+        
+        consumer = threading.Thread(target=consume_articles, name="image_stage", daemon=True)
+        consumer.start()
+        
+        try:
+            collectors = self.run_batch_article_extraction([
+                dict(site, article_callback=functools.partial(enqueue_article, site_index))
+                for site_index, site in enumerate(sites)
+            ])
+        finally:
+            # Sentinel: no more articles will arrive
+            article_queue.put(None)
+            consumer.join()
+        
+        # Futures were appended in arrival order, so output order is deterministic
+        saved_per_site = [[] for _ in sites]
+        for site_index, future in results:
+            if future.result():
+                saved_per_site[site_index].append(future.result())
+        
+        stats['article_queue_depth_at_end'] = article_queue.qsize()
+        self.pipeline_stats = stats
+        
+        total_articles = sum(len(articles) for articles in collectors)
+        total_saved = sum(len(saved) for saved in saved_per_site)
+        success_rate = total_saved / total_articles * 100 if total_articles else 0
+        self.logger.info(f"STREAMING PIPELINE COMPLETE: {total_saved}/{total_articles} articles with images ({success_rate:.1f}%)")
+        self.logger.info(f"Max queued articles: {stats['max_article_queue_depth']}, max images in flight: {stats['max_images_in_flight']}")
+        
+        return list(zip(collectors, saved_per_site))
+
+    def run_sites(self, sites: List[Dict[str, Any]], start_time: float, stream: bool = False) -> List[Tuple[ArticleCollector, List[Dict]]]:
+        """Run article extraction and image processing for each site; returns (articles, successful_articles) per site."""
+        if stream:
+            # Phases 1 + 2 overlap: images are processed while the crawl continues
+            return self.run_streaming_pipeline(sites, start_time)
+        
+        # Phase 1: Use PROVEN article extraction using proven method
+        collectors = self.run_batch_article_extraction(sites)
+        
+        # Phase 2: Use PROVEN image processing using proven method
+        return [
+            (articles, self.run_proven_image_processing(articles, site.get('output_dir')))
+            for site, articles in zip(sites, collectors)
+        ]
+
+    def create_ultimate_summary_v2(self, articles: List[Dict], start_time: float, homepage_url: str,
+                                   output_dir: Optional[Path] = None, summary_file: Optional[Path] = None):
         """Create ultimate performance summary."""
+        output_dir = output_dir or self.output_base_dir
         elapsed_time = time.time() - start_time
         successful_images = len(articles)
         
@@ -895,13 +3359,23 @@ class UltimateScraperV2:
                 'articles_with_images': successful_images,
                 'success_rate': f"{(successful_images/len(articles)*100):.1f}%" if articles else "0%",
                 'processing_speed': f"{successful_images/elapsed_time:.2f} articles/second" if elapsed_time > 0 else "N/A",
-                'max_concurrent': self.max_concurrent
+                'max_concurrent': self.max_concurrent,
+                'max_per_host': self.image_pipeline.host_limiter.max_per_host
             },
+            'response_cache': self.response_cache.stats(),
+            'http_cache': self.http_cache.stats() if self.http_cache else {'enabled': False},
+            'incremental': self.seen_index.stats() if self.seen_index else {'enabled': False},
+            'streaming_pipeline': self.pipeline_stats,
+            'image_transcoding': self.image_pipeline.transcoder.stats(),
+            'rate_limiter': self.rate_limiter.stats(),
+            'deduplication': self.dedup_stats(),
+            'crawl_efficiency': self.crawl_stats.get(homepage_url),
             'efficiency_features': [
                 "PROVEN Scrapy CrawlerProcess article discovery (proven Scrapy 100% method)",
                 "PROVEN ImageScraperPipeline image extraction (proven ImagePipeline 100% method)", 
                 "PROVEN trafilatura content extraction",
-                "PROVEN multi-fallback image approach (trafilatura → newspaper3k → BeautifulSoup)",
+                "PROVEN multi-fallback image approach (trafilatura → newspaper3k → meta/img tags)",
+                "Single lxml parse per article shared by content, metadata and image discovery",
                 "PROVEN image quality scoring and filtering",
                 "PROVEN download and processing methods",
                 "ADVANCED article filtering (research-backed URL, title, and content analysis)",
@@ -909,7 +3383,7 @@ class UltimateScraperV2:
                 "Multi-layer article verification system"
             ],
             'output_structure': {
-                'base_directory': str(self.output_base_dir),
+                'base_directory': str(output_dir),
                 'format': "./articles_output/Article_Title_With_Underscores/image.jpg + article.json",
                 'files_per_article': ['image.jpg', 'article.json'],
                 'image_folders_created': successful_images
@@ -917,7 +3391,7 @@ class UltimateScraperV2:
         }
         
         # Save summary
-        summary_file = Path("ultimate_scraper_v2_summary.json")
+        summary_file = summary_file or Path("ultimate_scraper_v2_summary.json")
         with open(summary_file, 'w', encoding='utf-8') as f:
             json.dump(summary, f, indent=2, ensure_ascii=False)
         
@@ -931,14 +3405,14 @@ class UltimateScraperV2:
         self.logger.info(f"Success rate: {summary['performance_metrics']['success_rate']}")
         self.logger.info(f"Total time: {elapsed_time:.2f} seconds")
         self.logger.info(f"Processing speed: {summary['performance_metrics']['processing_speed']}")
-        self.logger.info(f"Output format: {self.output_base_dir}\\Article_Title\\[image.jpg + article.json]")
+        self.logger.info(f"Output format: {output_dir}\\Article_Title\\[image.jpg + article.json]")
         self.logger.info("=" * 80)
         self.logger.info("PROVEN METHODS USED:")
         self.logger.info("- proven Scrapy: Scrapy CrawlerProcess (100% article discovery)")
         self.logger.info("- proven ImagePipeline: ImageScraperPipeline (100% image processing)")
         self.logger.info("=" * 80)
 
-    def run_ultimate_scraping_v2(self, homepage_url: str, max_articles: int = 40):
+    def run_ultimate_scraping_v2(self, homepage_url: str, max_articles: int = 40, stream: bool = False):
         """Run the TRUE ultimate scraping process with PROVEN methods."""
         start_time = time.time()
         
@@ -954,18 +3428,149 @@ class UltimateScraperV2:
         self.logger.info("- proven ImagePipeline: Proven ImageScraperPipeline (100% image processing)")
         self.logger.info("=" * 80)
         
-        # Phase 1: Use PROVEN article extraction using proven method
-        articles = self.run_proven_article_extraction(homepage_url, max_articles)
+        try:
+            site = {'url': homepage_url, 'max_articles': max_articles, 'output_dir': self.output_base_dir}
+            articles, successful_articles = self.run_sites([site], start_time, stream)[0]
+            
+            if not articles:
+                self.logger.error("No articles discovered using proven method! Exiting.")
+                return
+            
+            # Phase 3: Create ultimate summary
+            self.create_ultimate_summary_v2(successful_articles, start_time, homepage_url)
+        finally:
+            if self.seen_index is not None:
+                self.seen_index.save()
+            if self.image_store is not None:
+                self.image_store.save()
+            self.cleanup_work_dir()
+
+    def run_batch_scraping(self, sites: List[Tuple[str, int]], stream: bool = False):
+        """Scrape many homepages in one crawler process, each into its own output subfolder with its own summary."""
+        start_time = time.time()
         
-        if not articles:
-            self.logger.error("No articles discovered using proven method! Exiting.")
-            return
+        self.logger.info("=" * 80)
+        self.logger.info("TRUE ULTIMATE SCRAPER V2 BATCH MODE STARTING")
+        self.logger.info("=" * 80)
+        self.logger.info(f"Homepages: {len(sites)}")
+        self.logger.info(f"Output directory: {self.output_base_dir}")
+        self.logger.info("=" * 80)
         
-        # Phase 2: Use PROVEN image processing using proven method
-        successful_articles = self.run_proven_image_processing(articles)
+        # Per-site output subfolders (suffixed if two homepages map to the same name)
+        site_specs = []
+        used_folders = set()
+        for homepage_url, max_articles in sites:
+            folder_name = self.create_site_folder_name(homepage_url)
+            suffix = 2
+            while folder_name in used_folders:
+                folder_name = f"{self.create_site_folder_name(homepage_url)}_{suffix}"
+                suffix += 1
+            used_folders.add(folder_name)
+            site_specs.append({
+                'url': homepage_url,
+                'max_articles': max_articles,
+                'output_dir': self.output_base_dir / folder_name
+            })
+        
+        try:
+            results = self.run_sites(site_specs, start_time, stream)
+            
+            site_summaries = []
+            for site, (articles, successful_articles) in zip(site_specs, results):
+                site['output_dir'].mkdir(parents=True, exist_ok=True)
+                self.create_ultimate_summary_v2(
+                    successful_articles, start_time, site['url'],
+                    output_dir=site['output_dir'],
+                    summary_file=site['output_dir'] / "ultimate_scraper_v2_summary.json"
+                )
+                site_summaries.append({
+                    'homepage_url': site['url'],
+                    'output_dir': str(site['output_dir']),
+                    'max_articles': site['max_articles'],
+                    'articles_found': len(articles),
+                    'articles_with_images': len(successful_articles),
+                    'crawl_efficiency': self.crawl_stats.get(site['url'])
+                })
+            
+            self.create_batch_summary(site_summaries, start_time)
+        finally:
+            if self.seen_index is not None:
+                self.seen_index.save()
+            if self.image_store is not None:
+                self.image_store.save()
+            self.cleanup_work_dir()
+
+    def dedup_stats(self) -> Dict[str, Any]:
+        """Article and image deduplication counters for the summaries."""
+        if self.deduplicator is None:
+            return {'enabled': False}
+        return {'articles': self.deduplicator.stats(), 'images': self.image_store.stats()}
+
+    def create_batch_summary(self, site_summaries: List[Dict], start_time: float):
+        """Create the combined summary for a batch run."""
+        elapsed_time = time.time() - start_time
+        total_saved = sum(site['articles_with_images'] for site in site_summaries)
+        
+        summary = {
+            'ultimate_scraper_v2_batch': {
+                'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'total_time_seconds': round(elapsed_time, 2),
+                'sites': len(site_summaries),
+                'articles_with_images': total_saved,
+                'processing_speed': f"{total_saved/elapsed_time:.2f} articles/second" if elapsed_time > 0 else "N/A",
+                'scraper_version': 'true_ultimate_v2.0'
+            },
+            'sites': site_summaries,
+            'response_cache': self.response_cache.stats(),
+            'http_cache': self.http_cache.stats() if self.http_cache else {'enabled': False},
+            'incremental': self.seen_index.stats() if self.seen_index else {'enabled': False},
+            'streaming_pipeline': self.pipeline_stats,
+            'image_transcoding': self.image_pipeline.transcoder.stats(),
+            'rate_limiter': self.rate_limiter.stats(),
+            'deduplication': self.dedup_stats()
+        }
+        
+        summary_file = Path("ultimate_scraper_v2_summary.json")
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
         
-        # Phase 3: Create ultimate summary
-        self.create_ultimate_summary_v2(successful_articles, start_time, homepage_url)
+        self.logger.info("=" * 80)
+        self.logger.info("TRUE ULTIMATE SCRAPER V2 BATCH COMPLETE!")
+        for site in site_summaries:
+            self.logger.info(f"{site['homepage_url']}: {site['articles_with_images']}/{site['articles_found']} articles -> {site['output_dir']}")
+        self.logger.info(f"Total articles with images: {total_saved} in {elapsed_time:.2f} seconds")
+        self.logger.info("=" * 80)
+
+    def cleanup_work_dir(self):
+        """Drop cached pages and remove the per-run scratch directory."""
+        self.response_cache.clear()
+        self.image_pipeline.close()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+        if self.http_cache:
+            self.http_cache.close()
+
+
+def load_urls_file(path: str, default_max_articles: int) -> List[Tuple[str, int]]:
+    """
+    Read homepages for batch mode: one URL per line, optionally followed by a per-site article limit.
+    Blank lines and lines starting with # are ignored.
+    """
+    sites = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            
+            parts = line.split()
+            max_articles = default_max_articles
+            if len(parts) > 1:
+                try:
+                    max_articles = int(parts[1])
+                except ValueError:
+                    raise ValueError(f"{path}:{line_number}: article limit must be an integer, got {parts[1]!r}")
+            sites.append((parts[0], max_articles))
+    return sites
 
 
 def main():
@@ -982,14 +3587,21 @@ Examples:
   python ultimate_scraper_v2.py "https://timesofindia.indiatimes.com/sports"
   python ultimate_scraper_v2.py "https://www.bbc.com/news" --max-articles 50
   python ultimate_scraper_v2.py "https://techcrunch.com" --max-articles 30
+  python ultimate_scraper_v2.py --urls-file sites.txt --max-articles 20
         """
     )
     
     parser.add_argument(
         'url',
+        nargs='?',
         help='Homepage URL to scrape'
     )
     
+    parser.add_argument(
+        '--urls-file',
+        help='Batch mode: file with one homepage URL per line, optionally followed by a per-site article limit'
+    )
+    
     parser.add_argument(
         '--max-articles',
         type=int,
@@ -1010,27 +3622,193 @@ Examples:
         help='Maximum concurrent operations (default: 30)'
     )
     
+    parser.add_argument(
+        '--per-host',
+        type=int,
+        default=4,
+        help='Maximum concurrent image requests per host (default: 4)'
+    )
+    
+    parser.add_argument(
+        '--download-delay',
+        type=float,
+        default=0.5,
+        help='Starting delay between requests to one host in seconds; adapts to latency and 429/503 responses (default: 0.5)'
+    )
+    
+    parser.add_argument(
+        '--max-host-rate',
+        type=float,
+        default=20.0,
+        help='Upper bound on requests per second to any single host (default: 20)'
+    )
+    
+    parser.add_argument(
+        '--concurrent-requests',
+        type=int,
+        default=16,
+        help='Maximum concurrent crawler requests (default: 16)'
+    )
+    
+    parser.add_argument(
+        '--concurrent-per-domain',
+        type=int,
+        default=8,
+        help='Maximum concurrent crawler requests per domain (default: 8)'
+    )
+    
+    parser.add_argument(
+        '--depth',
+        type=int,
+        default=1,
+        help='Follow listing pages and related links up to N hops from the start page, best candidates first (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--bloom-filter',
+        type=int,
+        default=None,
+        metavar='CAPACITY',
+        help='Deduplicate the --depth frontier with a fixed-memory Bloom filter sized for CAPACITY URLs'
+    )
+    
+    parser.add_argument(
+        '--no-dedup',
+        action='store_true',
+        help='Keep duplicate articles (same canonical URL or near-identical text) and duplicate images'
+    )
+    
+    parser.add_argument(
+        '--discover',
+        action='store_true',
+        help='Find articles via robots.txt sitemaps and RSS/Atom feeds (newest first) instead of homepage links'
+    )
+    
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Start image processing as soon as each article is verified'
+    )
+    
     parser.add_argument(
         '--no-cache',
         action='store_true',
         help='Disable caching system'
     )
     
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Skip articles already saved by previous runs (index kept in the output directory)'
+    )
+    
+    parser.add_argument(
+        '--recheck-hours',
+        type=float,
+        default=None,
+        help='With --incremental, re-fetch saved articles older than this and reprocess only if their content changed'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        default=".scraper_cache",
+        help='Directory for the persistent HTTP cache (default: ./.scraper_cache)'
+    )
+    
+    parser.add_argument(
+        '--cache-size-mb',
+        type=int,
+        default=1024,
+        help='Maximum size of the persistent HTTP cache in MB (default: 1024)'
+    )
+    
+    parser.add_argument(
+        '--process-extraction',
+        action='store_true',
+        help='Run article extraction and scoring in a process pool instead of the crawler thread'
+    )
+    
+    parser.add_argument(
+        '--extraction-workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Worker processes for --process-extraction (default: number of CPU cores)'
+    )
+    
+    parser.add_argument(
+        '--transcode-workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Worker processes for PNG/WebP/GIF to JPEG conversion, 0 to convert inline (default: number of CPU cores)'
+    )
+    
+    parser.add_argument(
+        '--max-image-dim',
+        type=int,
+        default=None,
+        help='Downscale saved images so their longest side is at most this many pixels (default: keep original size)'
+    )
+    
+    parser.add_argument(
+        '--thumbnails',
+        default='',
+        help='Comma-separated thumbnail sizes saved next to each image, e.g. 320,640 (default: none)'
+    )
+    
+    parser.add_argument(
+        '--async-images',
+        action='store_true',
+        help='Fetch images with the asyncio/httpx pipeline (shared keep-alive pool, HTTP/2 when available)'
+    )
+    
     args = parser.parse_args()
     
+    if not args.url and not args.urls_file:
+        parser.error("a homepage URL or --urls-file is required")
+    
+    try:
+        thumbnails = [int(size) for size in args.thumbnails.split(',') if size.strip()]
+    except ValueError:
+        parser.error(f"--thumbnails expects comma-separated pixel sizes, got {args.thumbnails!r}")
+    
     # Create and run the TRUE ultimate scraper
     try:
         scraper = UltimateScraperV2(
             output_base_dir=args.output,
             max_concurrent=args.concurrent,
-            enable_cache=not args.no_cache
+            enable_cache=not args.no_cache,
+            max_per_host=args.per_host,
+            cache_dir=args.cache_dir,
+            cache_size_mb=args.cache_size_mb,
+            incremental=args.incremental,
+            recheck_hours=args.recheck_hours,
+            extraction_workers=args.extraction_workers if args.process_extraction else 0,
+            transcode_workers=args.transcode_workers,
+            max_image_dim=args.max_image_dim,
+            thumbnails=thumbnails,
+            async_images=args.async_images,
+            download_delay=args.download_delay,
+            concurrent_requests=args.concurrent_requests,
+            concurrent_per_domain=args.concurrent_per_domain,
+            max_host_rate=args.max_host_rate,
+            discover_feeds=args.discover,
+            max_depth=max(1, args.depth),
+            bloom_capacity=args.bloom_filter,
+            dedup=not args.no_dedup
         )
         
         # Run scraping with PROVEN methods
-        scraper.run_ultimate_scraping_v2(
-            args.url, 
-            args.max_articles
-        )
+        if args.urls_file:
+            sites = load_urls_file(args.urls_file, args.max_articles)
+            if args.url:
+                sites.insert(0, (args.url, args.max_articles))
+            scraper.run_batch_scraping(sites, stream=args.stream)
+        else:
+            scraper.run_ultimate_scraping_v2(
+                args.url, 
+                args.max_articles,
+                stream=args.stream
+            )
         
         print(f"\nTRUE Ultimate Scraper V2 completed successfully!")
         print(f"PROVEN methods used from both SCRAPER and proven ImagePipelines")
@@ -7,17 +7,21 @@ Beautiful Flask server for managing EC2 scraping jobs with improved real-time up
 import os
 import json
 import time
+import shlex
 import subprocess
 import threading
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory, stream_with_context
 from flask_cors import CORS
 import paramiko
 import queue
 import logging
 import boto3
-from botocore.exceptions import ClientError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -35,88 +39,547 @@ EC2_ENV_PATH = "/home/ec2-user/ultimate_scraper_env/bin/activate"
 
 # S3 Configuration (using the same bucket as SCRAPER folder)
 S3_BUCKET_NAME = os.getenv('S3_BUCKET_NAME', 'bockscraper')  # Same bucket used by the SCRAPER folder
+# Custom S3 endpoint (MinIO, moto server, ...); unset for AWS
+S3_ENDPOINT_URL = os.getenv('S3_ENDPOINT_URL') or None
+# 'direct' downloads results from S3 with boto3 on this machine; 'ec2' goes S3 -> EC2 -> SFTP
+S3_DOWNLOAD_METHOD = os.getenv('S3_DOWNLOAD_METHOD', 'direct')
+# Objects fetched at once, and ranged GETs per large object (multipart above S3_MULTIPART_THRESHOLD)
+S3_DOWNLOAD_WORKERS = 8
+S3_MAX_CONCURRENCY = 4
+S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024
 
-# Global state
-scraping_active = False
-current_job = None
-all_logs = []  # Store all logs for proper tracking
-progress_percentage = 0
-current_status = "Ready"
-job_completed = False
-s3_upload_completed = False
-s3_session_folder = None
+# EC2 instances that run jobs (comma-separated); defaults to the single EC2_HOST
+EC2_HOSTS = [host.strip() for host in os.getenv('EC2_HOSTS', EC2_HOST).split(',') if host.strip()]
+# Jobs running at once across the fleet; further jobs wait in the queue
+MAX_PARALLEL_JOBS = int(os.getenv('MAX_PARALLEL_JOBS', '3'))
+# Finished jobs kept for /jobs before the oldest are forgotten
+MAX_JOB_HISTORY = 50
+
+# Pooled SSH connections: keepalive interval, channels per connection (sshd MaxSessions defaults to 10)
+# and how long an unused connection stays open
+SSH_KEEPALIVE_SECONDS = 30
+SSH_MAX_CHANNELS = 8
+SSH_IDLE_TIMEOUT = 600
+
+# Parallel SFTP download: channels, per-channel flow-control window and packet size
+SFTP_WORKERS = 4
+SFTP_WINDOW_SIZE = 8 * 1024 * 1024
+SFTP_MAX_PACKET_SIZE = 32 * 1024
+# Seconds between progress lines in the job log during downloads
+TRANSFER_PROGRESS_SECONDS = 5
+
+# Log entries kept per job for /get_status, /logs and /events
+LOG_BUFFER_SIZE = 200
+# Seconds between SSE keepalive comments when nothing happens
+SSE_KEEPALIVE_SECONDS = 15
+
+class LogBuffer:
+    """Ring buffer of log entries with increasing sequence numbers, so clients can fetch only what's new"""
+    def __init__(self, maxlen=LOG_BUFFER_SIZE):
+        self.entries = deque(maxlen=maxlen)
+        self.last_seq = 0
+        self.condition = threading.Condition()
+        
+    def append(self, message, log_type="info"):
+        with self.condition:
+            self.last_seq += 1
+            entry = {
+                'seq': self.last_seq,
+                'timestamp': datetime.now().strftime("%H:%M:%S"),
+                'message': message,
+                'type': log_type
+            }
+            self.entries.append(entry)
+            self.condition.notify_all()
+        return entry
+        
+    def since(self, seq):
+        """Entries newer than seq, and how many of them already fell out of the buffer"""
+        with self.condition:
+            entries = [entry for entry in self.entries if entry['seq'] > seq]
+            if seq == 0:
+                return entries, 0
+            first_seq = entries[0]['seq'] if entries else self.last_seq + 1
+            return entries, max(first_seq - seq - 1, 0)
+            
+    def wait(self, seq, timeout):
+        """Block until an entry newer than seq exists or the timeout passes"""
+        with self.condition:
+            return self.condition.wait_for(lambda: self.last_seq > seq, timeout)
+
+# Server-level messages (startup, no job selected)
+server_logs = LogBuffer()
+
+class SSHConnectionPool:
+    """Authenticated SSH connections kept open per host; commands and SFTP sessions run as channels on them"""
+    def __init__(self, max_channels=SSH_MAX_CHANNELS, keepalive=SSH_KEEPALIVE_SECONDS, idle_timeout=SSH_IDLE_TIMEOUT):
+        self.max_channels = max_channels
+        self.keepalive = keepalive
+        self.idle_timeout = idle_timeout
+        self.connections = {}  # host -> [{'client', 'leases', 'last_used', 'dead'}]
+        self.lock = threading.Lock()
+        self.metrics = {'hits': 0, 'misses': 0, 'reconnects': 0, 'failures': 0}
+        
+    def _connect(self, host, timeout):
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        client.connect(
+            hostname=host,
+            username=EC2_USER,
+            key_filename=EC2_KEY_PATH,
+            timeout=timeout
+        )
+        client.get_transport().set_keepalive(self.keepalive)
+        return client
+        
+    def _is_alive(self, client):
+        """Cheap liveness probe: an SSH_MSG_IGNORE fails fast on a dropped connection"""
+        transport = client.get_transport()
+        if transport is None or not transport.is_active():
+            return False
+        try:
+            transport.send_ignore()
+            return True
+        except Exception:
+            return False
+            
+    def _close_idle(self):
+        """
+        Close dropped connections nobody holds any more, and live ones unused for idle_timeout seconds
+        (caller holds the lock)
+        """
+        now = time.time()
+        for host, connections in self.connections.items():
+            for connection in [c for c in connections if c['leases'] == 0 and
+                               (c['dead'] or now - c['last_used'] > self.idle_timeout)]:
+                connection['client'].close()
+                connections.remove(connection)
+                
+    def acquire(self, host, timeout=30):
+        """Connected SSHClient for host, reusing a pooled connection with a free channel slot"""
+        reconnect = False
+        while True:
+            with self.lock:
+                self._close_idle()
+                connection = next((c for c in self.connections.get(host, [])
+                                   if not c['dead'] and c['leases'] < self.max_channels), None)
+                if connection is None:
+                    break
+                connection['leases'] += 1
+                
+            if self._is_alive(connection['client']):
+                with self.lock:
+                    self.metrics['hits'] += 1
+                return connection['client']
+            
+            # Dropped connection: retire it (closed once its last holder releases it) and look again;
+            # pooled clients are never swapped out from under the callers holding them
+            with self.lock:
+                connection['leases'] -= 1
+                connection['dead'] = True
+            reconnect = True
+        
+        try:
+            client = self._connect(host, timeout)
+        except Exception:
+            with self.lock:
+                self.metrics['failures'] += 1
+            raise
+        with self.lock:
+            self.connections.setdefault(host, []).append({'client': client, 'leases': 1, 'last_used': time.time(), 'dead': False})
+            self.metrics['reconnects' if reconnect else 'misses'] += 1
+        if reconnect:
+            logger.info(f"SSH connection to {host} re-established")
+        return client
+        
+    def release(self, client):
+        """Return a client from acquire(); the connection stays open for the next caller"""
+        with self.lock:
+            for connections in self.connections.values():
+                for connection in connections:
+                    if connection['client'] is client:
+                        connection['leases'] -= 1
+                        connection['last_used'] = time.time()
+                        if connection['dead'] and connection['leases'] == 0:
+                            connection['client'].close()
+                            connections.remove(connection)
+                        return
+                        
+    def _mark_dead(self, client):
+        """Stop handing out a dropped connection; release() or _close_idle() closes it after the last lease"""
+        with self.lock:
+            for connections in self.connections.values():
+                for connection in connections:
+                    if connection['client'] is client:
+                        connection['dead'] = True
+                        return
+                        
+    def exec_command(self, host, command, timeout=30):
+        """Run a short command and return (exit status, stdout); retried once on a fresh connection"""
+        for attempt in range(2):
+            client = self.acquire(host, timeout)
+            try:
+                stdin, stdout, stderr = client.exec_command(command, timeout=timeout)
+                output = stdout.read().decode()
+                return stdout.channel.recv_exit_status(), output
+            except (paramiko.SSHException, EOFError, OSError):
+                if attempt:
+                    raise
+                # Only a dropped connection is retired (closed once its last holder releases it);
+                # a refused channel or read timeout leaves it to the other jobs leasing it
+                if not self._is_alive(client):
+                    self._mark_dead(client)
+            finally:
+                self.release(client)
+                
+    def stats(self):
+        with self.lock:
+            metrics = dict(self.metrics)
+            connections = [c for host_connections in self.connections.values() for c in host_connections]
+            lookups = metrics['hits'] + metrics['misses'] + metrics['reconnects']
+            metrics.update({
+                'hitRate': round(metrics['hits'] / lookups, 3) if lookups else None,
+                'openConnections': sum(1 for c in connections if not c['dead']),
+                'channelsInUse': sum(c['leases'] for c in connections)
+            })
+            return metrics
+            
+    def close_all(self):
+        with self.lock:
+            for connections in self.connections.values():
+                for connection in connections:
+                    connection['client'].close()
+            self.connections.clear()
+
+ssh_pool = SSHConnectionPool()
+
+def format_throughput(byte_count, start_time):
+    """'12.3 MB at 4.56 MB/s' for a transfer progress line"""
+    elapsed = max(time.time() - start_time, 0.001)
+    megabytes = byte_count / 1048576
+    return f"{megabytes:.1f} MB at {megabytes / elapsed:.2f} MB/s"
+
+class ParallelSFTPDownloader:
+    """Copies a remote directory tree over several SFTP channels, skipping files already present locally"""
+    def __init__(self, host, workers=SFTP_WORKERS):
+        self.host = host
+        self.workers = max(1, workers)
+        self.lock = threading.Lock()
+        self.stats = {'files': 0, 'downloaded': 0, 'skipped': 0, 'failed': 0, 'bytes': 0}
+        
+    def _open_sftp(self, client):
+        # A large window keeps prefetched reads in flight instead of stalling on flow control
+        return paramiko.SFTPClient.from_transport(
+            client.get_transport(),
+            window_size=SFTP_WINDOW_SIZE,
+            max_packet_size=SFTP_MAX_PACKET_SIZE
+        )
+        
+    def _list_files(self, sftp, remote_dir, local_dir, files):
+        """Walk the remote tree, creating local directories and collecting (remote, local, attributes)"""
+        local_dir.mkdir(parents=True, exist_ok=True)
+        for item in sftp.listdir_attr(remote_dir):
+            remote_item_path = f"{remote_dir}/{item.filename}"
+            local_item_path = local_dir / item.filename
+            if item.st_mode & 0o40000:  # Directory
+                self._list_files(sftp, remote_item_path, local_item_path, files)
+            else:
+                files.append((remote_item_path, local_item_path, item))
+                
+    def _is_current(self, local_path, item):
+        """Same size and mtime as the remote file: left by an earlier (possibly interrupted) download"""
+        try:
+            local_stat = local_path.stat()
+        except OSError:
+            return False
+        return local_stat.st_size == item.st_size and int(local_stat.st_mtime) == int(item.st_mtime)
+        
+    def _worker(self, work, log):
+        client = ssh_pool.acquire(self.host)
+        sftp = None
+        try:
+            sftp = self._open_sftp(client)
+            while True:
+                try:
+                    remote_path, local_path, item = work.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    # Write to .part and rename, so an interrupted file is never mistaken for a complete one
+                    part_path = local_path.with_name(local_path.name + '.part')
+                    sftp.get(remote_path, str(part_path))
+                    os.replace(part_path, local_path)
+                    os.utime(local_path, (item.st_atime, item.st_mtime))
+                    with self.lock:
+                        self.stats['downloaded'] += 1
+                        self.stats['bytes'] += item.st_size
+                except Exception as e:
+                    with self.lock:
+                        self.stats['failed'] += 1
+                    log(f"Download error: {remote_path}: {str(e)}", "error")
+        finally:
+            if sftp:
+                sftp.close()
+            ssh_pool.release(client)
+            
+    def download_tree(self, remote_dir, local_dir, log):
+        """Download remote_dir into local_dir; progress and throughput go to log(message, type)"""
+        start_time = time.time()
+        client = ssh_pool.acquire(self.host)
+        try:
+            sftp = self._open_sftp(client)
+            files = []
+            self._list_files(sftp, remote_dir, Path(local_dir), files)
+            sftp.close()
+        finally:
+            ssh_pool.release(client)
+            
+        work = queue.Queue()
+        for remote_path, local_path, item in files:
+            if self._is_current(local_path, item):
+                self.stats['skipped'] += 1
+            else:
+                work.put((remote_path, local_path, item))
+        self.stats['files'] = len(files)
+        pending = work.qsize()
+        log(f"{len(files)} files on EC2, {self.stats['skipped']} already downloaded, "
+            f"fetching {pending} over {min(self.workers, pending)} SFTP channels", "info")
+        
+        threads = [threading.Thread(target=self._worker, args=(work, log), daemon=True)
+                   for _ in range(min(self.workers, pending))]
+        for thread in threads:
+            thread.start()
+        while True:
+            running = [thread for thread in threads if thread.is_alive()]
+            if not running:
+                break
+            running[0].join(timeout=TRANSFER_PROGRESS_SECONDS)
+            if running[0].is_alive():
+                log(f"Transferred {self.stats['downloaded']}/{pending} files, {format_throughput(self.stats['bytes'], start_time)}", "info")
+                
+        self.stats['seconds'] = round(time.time() - start_time, 2)
+        self.stats['mbPerSecond'] = round(self.stats['bytes'] / 1048576 / max(self.stats['seconds'], 0.001), 2)
+        return self.stats
+
+class S3DirectDownloader:
+    """
+    Downloads a job's results straight from S3 with boto3 (no EC2 hop).
+    A manifest in the output directory records each object's ETag, so re-downloads fetch only new objects.
+    """
+    MANIFEST_NAME = '.s3_manifest.json'
+    
+    def __init__(self, bucket=S3_BUCKET_NAME, client=None, endpoint_url=S3_ENDPOINT_URL, workers=S3_DOWNLOAD_WORKERS):
+        self.bucket = bucket
+        self.workers = max(1, workers)
+        self.client = client or boto3.client(
+            's3',
+            endpoint_url=endpoint_url,
+            config=Config(max_pool_connections=self.workers * S3_MAX_CONCURRENCY)
+        )
+        self.transfer_config = TransferConfig(
+            multipart_threshold=S3_MULTIPART_THRESHOLD,
+            multipart_chunksize=S3_MULTIPART_THRESHOLD,
+            max_concurrency=S3_MAX_CONCURRENCY
+        )
+        self.lock = threading.Lock()
+        self.stats = {'files': 0, 'downloaded': 0, 'skipped': 0, 'failed': 0, 'bytes': 0}
+        
+    def _load_manifest(self, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+            
+    def _save_manifest(self, path, manifest):
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, path)
+        
+    def _list_objects(self, prefix):
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                if not obj['Key'].endswith('/'):
+                    yield obj
+                    
+    def _worker(self, work, manifest, log):
+        while True:
+            try:
+                obj, local_path = work.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                local_path.parent.mkdir(parents=True, exist_ok=True)
+                part_path = local_path.with_name(local_path.name + '.part')
+                self.client.download_file(self.bucket, obj['Key'], str(part_path), Config=self.transfer_config)
+                os.replace(part_path, local_path)
+                with self.lock:
+                    manifest[obj['Key']] = {'etag': obj['ETag'], 'size': obj['Size']}
+                    self.stats['downloaded'] += 1
+                    self.stats['bytes'] += obj['Size']
+            except Exception as e:
+                with self.lock:
+                    self.stats['failed'] += 1
+                log(f"Download error: {obj['Key']}: {str(e)}", "error")
+                
+    def download_prefix(self, prefix, local_dir, log):
+        """Download every object under prefix into local_dir; progress and throughput go to log(message, type)"""
+        start_time = time.time()
+        local_dir = Path(local_dir)
+        local_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = local_dir / self.MANIFEST_NAME
+        manifest = self._load_manifest(manifest_path)
+        
+        work = queue.Queue()
+        for obj in self._list_objects(prefix):
+            self.stats['files'] += 1
+            local_path = local_dir / obj['Key'][len(prefix):]
+            known = manifest.get(obj['Key'])
+            if known and known['etag'] == obj['ETag'] and local_path.exists() and local_path.stat().st_size == obj['Size']:
+                self.stats['skipped'] += 1
+            else:
+                work.put((obj, local_path))
+        pending = work.qsize()
+        log(f"{self.stats['files']} objects in s3://{self.bucket}/{prefix}, {self.stats['skipped']} already downloaded, "
+            f"fetching {pending} with {min(self.workers, pending)} workers", "info")
+        
+        threads = [threading.Thread(target=self._worker, args=(work, manifest, log), daemon=True)
+                   for _ in range(min(self.workers, pending))]
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                running = [thread for thread in threads if thread.is_alive()]
+                if not running:
+                    break
+                running[0].join(timeout=TRANSFER_PROGRESS_SECONDS)
+                if running[0].is_alive():
+                    log(f"Transferred {self.stats['downloaded']}/{pending} objects, {format_throughput(self.stats['bytes'], start_time)}", "info")
+        finally:
+            with self.lock:
+                self._save_manifest(manifest_path, manifest)
+                
+        self.stats['seconds'] = round(time.time() - start_time, 2)
+        self.stats['mbPerSecond'] = round(self.stats['bytes'] / 1048576 / max(self.stats['seconds'], 0.001), 2)
+        return self.stats
 
 class ScrapingJob:
     def __init__(self, url, max_articles, output_path, concurrent):
+        self.job_id = os.urandom(4).hex()
         self.url = url
         self.max_articles = max_articles
         self.output_path = output_path
         self.concurrent = concurrent
-        self.start_time = time.time()
+        self.host = None
+        self.created_time = time.time()
+        self.start_time = None
+        self.end_time = None
         self.ssh_client = None
-        self.process_thread = None
+        self.channel = None
         self.is_running = False
         self.articles_found = 0
         self.articles_saved = 0
         
-    def start(self):
-        """Start the scraping job on EC2"""
+        # Per-job state (previously module globals)
+        self.state = 'queued'
+        self.logs = LogBuffer()
+        self.progress_percentage = 0
+        self.current_status = "Queued"
+        self.job_completed = False
+        self.s3_upload_completed = False
+        self.session_id = f"session_{int(self.created_time)}_{self.job_id}"
+        self.remote_output_path = f"/home/ec2-user/scraping_output_{self.session_id}"
+        
+    def add_log(self, message, log_type="info"):
+        """Add a log message to this job's buffer"""
+        return self.logs.append(message, log_type)
+        
+    def snapshot(self):
+        """Status fields shared by /jobs, /get_status, /logs and /events"""
+        return {
+            'jobId': self.job_id,
+            'url': self.url,
+            'maxArticles': self.max_articles,
+            'host': self.host,
+            'state': self.state,
+            'progress': self.progress_percentage,
+            'status': self.current_status,
+            'completed': self.job_completed,
+            'isActive': self.state in ('queued', 'running'),
+            'articlesFound': self.articles_found,
+            'articlesSaved': self.articles_saved,
+            's3_upload_completed': self.s3_upload_completed,
+            's3_session_folder': self.session_id if self.s3_upload_completed else None,
+            'createdTime': self.created_time,
+            'startTime': self.start_time,
+            'endTime': self.end_time
+        }
+        
+    def run(self, host):
+        """Run the scraping job on an EC2 host; called by a JobManager worker"""
+        if self.state != 'queued':
+            return
+        self.host = host
+        self.state = 'running'
         self.is_running = True
-        self.process_thread = threading.Thread(target=self._run_scraping)
-        self.process_thread.start()
+        self.start_time = time.time()
+        try:
+            self._run_scraping()
+        finally:
+            self.end_time = time.time()
+            if self.state == 'running':
+                self.state = 'completed' if self.job_completed else 'failed'
         
     def stop(self):
-        """Stop the scraping job"""
+        """Stop the scraping job, or cancel it while still queued"""
+        was_queued = self.state == 'queued'
         self.is_running = False
-        if self.ssh_client:
+        self.state = 'stopped'
+        self.current_status = 'Stopped by user'
+        self.end_time = self.end_time or time.time()
+        self.add_log("Scraping stopped by user", "warning")
+        if was_queued:
+            return
+        if self.host:
             try:
-                # Kill any running scraper processes on EC2
-                self.ssh_client.exec_command("pkill -f ultimate_scraper_v2.py")
-                self.ssh_client.close()
+                # Kill only this job's scraper process on EC2; closing the channel ends the log stream
+                ssh_pool.exec_command(self.host, f"pkill -f {self.remote_output_path}")
+                if self.channel:
+                    self.channel.close()
             except Exception as e:
                 logger.error(f"Error stopping scraping: {e}")
         
     def _run_scraping(self):
         """Run the scraping process on EC2 and stream logs"""
-        global progress_percentage, current_status, job_completed
-        
         try:
-            # Connect to EC2
-            self.ssh_client = paramiko.SSHClient()
-            self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            # Connect to EC2 (reuses a pooled connection when one is open)
+            self.add_log(f"Connecting to EC2 instance {self.host}...", "info")
+            self.progress_percentage = 5
+            self.current_status = "Connecting to EC2..."
             
-            add_log("Connecting to EC2 instance...", "info")
-            progress_percentage = 5
-            current_status = "Connecting to EC2..."
+            self.ssh_client = ssh_pool.acquire(self.host)
             
-            self.ssh_client.connect(
-                hostname=EC2_HOST,
-                username=EC2_USER,
-                key_filename=EC2_KEY_PATH,
-                timeout=30
-            )
-            
-            add_log("Connected to EC2 successfully!", "success")
-            progress_percentage = 10
-            current_status = "Preparing scraper..."
+            self.add_log("Connected to EC2 successfully!", "success")
+            self.progress_percentage = 10
+            self.current_status = "Preparing scraper..."
             
             # Prepare the command with S3 upload
-            session_id = f"session_{int(time.time())}"
-            global s3_session_folder
-            s3_session_folder = session_id
-            
-            remote_output_path = f"/home/ec2-user/scraping_output_{session_id}"
+            session_id = self.session_id
+            remote_output_path = self.remote_output_path
             
             # First, just run the scraper without S3 upload to test
-            command = f"source {EC2_ENV_PATH} && mkdir -p {remote_output_path} && python {EC2_SCRAPER_PATH} \"{self.url}\" --max-articles {self.max_articles} --output {remote_output_path} --concurrent {self.concurrent}"
+            command = f"source {EC2_ENV_PATH} && mkdir -p {remote_output_path} && python {EC2_SCRAPER_PATH} {shlex.quote(self.url)} --max-articles {self.max_articles} --output {remote_output_path} --concurrent {self.concurrent}"
             
-            add_log(f"Starting scraper with {self.max_articles} articles", "info")
-            add_log(f"Output path: {remote_output_path}", "info")
-            progress_percentage = 15
-            current_status = "Scraping articles..."
+            self.add_log(f"Starting scraper with {self.max_articles} articles", "info")
+            self.add_log(f"Output path: {remote_output_path}", "info")
+            self.progress_percentage = 15
+            self.current_status = "Scraping articles..."
             
             # Execute command
             stdin, stdout, stderr = self.ssh_client.exec_command(command)
+            self.channel = stdout.channel
             
             # Stream output in real-time
             while self.is_running:
@@ -126,77 +589,73 @@ class ScrapingJob:
                     
                 line = line.strip()
                 if line:
-                    add_log(line, self._classify_log_line(line))
+                    self.add_log(line, self._classify_log_line(line))
                     
                     # Parse statistics from logs for progress tracking
                     if "VERIFIED ARTICLE" in line:
                         self.articles_found += 1
-                        progress_percentage = min(15 + (self.articles_found / self.max_articles) * 60, 75)
-                        current_status = f"Found {self.articles_found} articles, processing images..."
+                        self.progress_percentage = min(15 + (self.articles_found / self.max_articles) * 60, 75)
+                        self.current_status = f"Found {self.articles_found} articles, processing images..."
                         
                     elif "SUCCESS: Saved" in line and "image.jpg" in line:
                         self.articles_saved += 1
-                        progress_percentage = min(75 + (self.articles_saved / max(self.articles_found, 1)) * 15, 90)
-                        current_status = f"Saved {self.articles_saved}/{self.articles_found} articles with images"
+                        self.progress_percentage = min(75 + (self.articles_saved / max(self.articles_found, 1)) * 15, 90)
+                        self.current_status = f"Saved {self.articles_saved}/{self.articles_found} articles with images"
                         
                     elif "COMPLETE:" in line or "completed successfully" in line:
-                        progress_percentage = 90
-                        current_status = "Scraping completed, starting S3 upload..."
-                        add_log("Scraping completed, starting S3 upload...", "success")
+                        self.progress_percentage = 90
+                        self.current_status = "Scraping completed, starting S3 upload..."
+                        self.add_log("Scraping completed, starting S3 upload...", "success")
             
             # Wait for completion
             exit_status = stdout.channel.recv_exit_status()
             
             if exit_status == 0 and self.is_running:
-                add_log("Scraping completed successfully! Starting S3 upload...", "success")
-                progress_percentage = 92
-                current_status = "Uploading to S3..."
+                self.add_log("Scraping completed successfully! Starting S3 upload...", "success")
+                self.progress_percentage = 92
+                self.current_status = "Uploading to S3..."
                 
                 # Now run S3 upload as separate command
                 s3_command = f"aws s3 sync {remote_output_path}/ s3://{S3_BUCKET_NAME}/{session_id}/ --exclude \"*.log\""
-                add_log(f"S3 upload command: aws s3 sync to {S3_BUCKET_NAME}/{session_id}/", "info")
+                self.add_log(f"S3 upload command: aws s3 sync to {S3_BUCKET_NAME}/{session_id}/", "info")
                 
                 try:
                     stdin, stdout, stderr = self.ssh_client.exec_command(s3_command)
                     s3_exit_status = stdout.channel.recv_exit_status()
                     
                     if s3_exit_status == 0:
-                        global s3_upload_completed, scraping_active
-                        s3_upload_completed = True
-                        job_completed = True
-                        scraping_active = False  # Reset scraping_active when job completes
-                        progress_percentage = 100
-                        current_status = f"All {self.articles_saved} articles uploaded to S3! Ready to download."
-                        add_log(f"S3 upload completed! Articles saved to bucket: {S3_BUCKET_NAME}/{session_id}", "success")
+                        self.s3_upload_completed = True
+                        self.job_completed = True
+                        self.progress_percentage = 100
+                        self.current_status = f"All {self.articles_saved} articles uploaded to S3! Ready to download."
+                        self.add_log(f"S3 upload completed! Articles saved to bucket: {S3_BUCKET_NAME}/{session_id}", "success")
                         
                         # Clean up remote directory after successful S3 upload
                         self.ssh_client.exec_command(f"rm -rf {remote_output_path}")
-                        add_log("Cleaned up temporary files on EC2", "info")
+                        self.add_log("Cleaned up temporary files on EC2", "info")
                     else:
-                        add_log("S3 upload failed", "error")
-                        current_status = "Scraping completed but S3 upload failed"
-                        scraping_active = False  # Reset on S3 upload failure
+                        self.add_log("S3 upload failed", "error")
+                        self.current_status = "Scraping completed but S3 upload failed"
                         
                 except Exception as e:
-                    add_log(f"S3 upload error: {str(e)}", "error")
-                    current_status = "S3 upload failed"
-                    scraping_active = False  # Reset on S3 upload error
+                    self.add_log(f"S3 upload error: {str(e)}", "error")
+                    self.current_status = "S3 upload failed"
                 
-            else:
-                add_log("Scraping encountered an error or was stopped", "error")
-                current_status = "Error or stopped"
-                scraping_active = False  # Reset on scraping error
+            elif self.state != 'stopped':
+                self.add_log("Scraping encountered an error or was stopped", "error")
+                self.current_status = "Error or stopped"
                 
         except Exception as e:
             error_msg = f"Error during scraping: {str(e)}"
-            add_log(error_msg, "error")
-            current_status = "Error occurred"
-            scraping_active = False  # Reset on any error
-            logger.error(error_msg)
+            self.current_status = "Error occurred"
+            if self.state != 'stopped':
+                self.add_log(error_msg, "error")
+                logger.error(f"Job {self.job_id}: {error_msg}")
             
         finally:
             if self.ssh_client:
-                self.ssh_client.close()
+                ssh_pool.release(self.ssh_client)
+                self.ssh_client = None
             self.is_running = False
             
     def _classify_log_line(self, line):
@@ -210,65 +669,211 @@ class ScrapingJob:
             return 'warning'
         else:
             return 'info'
+
+
+class JobManager:
+    """Runs scraping jobs on a bounded pool of worker threads; extra jobs wait in a FIFO queue"""
+    def __init__(self, max_workers=MAX_PARALLEL_JOBS, hosts=EC2_HOSTS):
+        self.max_workers = max(1, max_workers)
+        self.hosts = list(hosts)
+        self.jobs = {}  # job_id -> ScrapingJob, in submission order
+        self.pending = queue.Queue()
+        self.lock = threading.Lock()
+        self.host_load = {host: 0 for host in self.hosts}
+        self.workers = []
+        
+    def submit(self, url, max_articles, output_path, concurrent):
+        """Create a job and queue it; a free worker starts it right away"""
+        job = ScrapingJob(url, max_articles, output_path, concurrent)
+        with self.lock:
+            self.jobs[job.job_id] = job
+            self._forget_old_jobs()
+            if len(self.workers) < self.max_workers:
+                worker = threading.Thread(target=self._worker, name=f"job-worker-{len(self.workers) + 1}", daemon=True)
+                self.workers.append(worker)
+                worker.start()
+        job.add_log(f"Scraping job {job.job_id} queued for {url}", "info")
+        self.pending.put(job)
+        return job
+        
+    def _worker(self):
+        while True:
+            job = self.pending.get()
+            try:
+                if job.state != 'queued':
+                    continue
+                host = self._acquire_host()
+                try:
+                    job.run(host)
+                finally:
+                    self._release_host(host)
+            except Exception as e:
+                logger.error(f"Job {job.job_id} crashed: {e}")
+            finally:
+                self.pending.task_done()
+                
+    def _acquire_host(self):
+        """Least-loaded EC2 host for the next job"""
+        with self.lock:
+            host = min(self.hosts, key=lambda h: self.host_load[h])
+            self.host_load[host] += 1
+            return host
+            
+    def _release_host(self, host):
+        with self.lock:
+            self.host_load[host] -= 1
+            
+    def _forget_old_jobs(self):
+        """Drop the oldest finished jobs beyond MAX_JOB_HISTORY (caller holds the lock)"""
+        finished = [job_id for job_id, job in self.jobs.items() if job.state not in ('queued', 'running')]
+        for job_id in finished[:max(len(finished) - MAX_JOB_HISTORY, 0)]:
+            del self.jobs[job_id]
+            
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+            
+    def latest(self):
+        """Most recently submitted job (what the legacy single-job endpoints report on)"""
+        with self.lock:
+            return next(reversed(self.jobs.values()), None)
+            
+    def list(self):
+        with self.lock:
+            return list(self.jobs.values())
+            
+    def stats(self):
+        jobs = self.list()
+        return {
+            'maxParallelJobs': self.max_workers,
+            'hosts': dict(self.host_load),
+            'running': sum(1 for job in jobs if job.state == 'running'),
+            'queued': sum(1 for job in jobs if job.state == 'queued')
+        }
+
+job_manager = JobManager()
             
 
 def add_log(message, log_type="info"):
-    """Add a log message to the global log list"""
-    global all_logs
-    
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    log_entry = {
-        'timestamp': timestamp,
-        'message': message,
-        'type': log_type
+    """Add a server-level log message"""
+    return server_logs.append(message, log_type)
+
+def resolve_job(job_id=None):
+    """Job named by id, else the most recent one; None if there is none"""
+    if job_id:
+        return job_manager.get(job_id)
+    return job_manager.latest()
+
+def job_request_args(data):
+    """Validated job parameters from a start request body"""
+    url = data.get('url')
+    if not url or not isinstance(url, str):
+        raise ValueError('URL is required')
+    return {
+        'url': url,
+        'max_articles': positive_int(data.get('maxArticles', 40), 'maxArticles'),
+        'output_path': data.get('outputPath', 'scraped_results'),
+        'concurrent': positive_int(data.get('concurrent', 50), 'concurrent')
     }
-    all_logs.append(log_entry)
-    
-    # Keep only last 200 log entries to prevent memory issues
-    if len(all_logs) > 200:
-        all_logs = all_logs[-200:]
+
+def positive_int(value, name):
+    """Request field as a positive int; ValueError (a 400 response) otherwise"""
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{name} must be an integer')
+    if number < 1:
+        raise ValueError(f'{name} must be at least 1')
+    return number
+
+def status_snapshot(job):
+    """Progress fields for a job, or the idle state when no job exists"""
+    if job is None:
+        return {
+            'jobId': None,
+            'progress': 0,
+            'status': 'Ready',
+            'completed': False,
+            'isActive': False,
+            's3_upload_completed': False,
+            's3_session_folder': None
+        }
+    return job.snapshot()
+
+def parse_cursor(value, buffer):
+    """Sequence number from ?since= or Last-Event-ID (0 = from the oldest buffered entry)"""
+    try:
+        seq = max(int(value), 0)
+    except (TypeError, ValueError):
+        return 0
+    # A cursor from before a server restart starts over
+    return seq if seq <= buffer.last_seq else 0
 
 @app.route('/')
 def index():
     """Serve the main interface"""
     return send_from_directory('.', 'index.html')
 
-@app.route('/start_scraping', methods=['POST'])
-def start_scraping():
-    """Start a new scraping job"""
-    global scraping_active, current_job, all_logs, progress_percentage, current_status, job_completed
+@app.route('/jobs', methods=['GET'])
+def list_jobs():
+    """All known jobs (newest first) and worker pool usage"""
+    return jsonify({
+        'jobs': [job.snapshot() for job in reversed(job_manager.list())],
+        'pool': job_manager.stats(),
+        'ssh_pool': ssh_pool.stats()
+    })
+
+@app.route('/jobs', methods=['POST'])
+def create_job():
+    """Queue a new scraping job; it starts as soon as a worker is free"""
+    try:
+        job = job_manager.submit(**job_request_args(request.json or {}))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    return jsonify(job.snapshot()), 202
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Status of one job, with its log entries after ?since=<seq>"""
+    job = job_manager.get(job_id)
+    if not job:
+        return jsonify({'error': f'Unknown job {job_id}'}), 404
+    
+    since = parse_cursor(request.args.get('since'), job.logs)
+    logs, dropped = job.logs.since(since)
+    response_data = job.snapshot()
+    response_data.update({
+        'logs': logs,
+        'next': logs[-1]['seq'] if logs else since,
+        'dropped': dropped
+    })
+    
+    return jsonify(response_data)
+
+@app.route('/jobs/<job_id>', methods=['DELETE'])
+def delete_job(job_id):
+    """Stop a running job or cancel a queued one"""
+    job = job_manager.get(job_id)
+    if not job:
+        return jsonify({'error': f'Unknown job {job_id}'}), 404
+    if job.state not in ('queued', 'running'):
+        return jsonify({'error': f'Job {job_id} is already {job.state}'}), 400
     
-    if scraping_active:
-        return jsonify({'error': 'Scraping already in progress'}), 400
+    job.stop()
     
+    return jsonify(job.snapshot())
+
+@app.route('/start_scraping', methods=['POST'])
+def start_scraping():
+    """Start a new scraping job (queued if all workers are busy)"""
     try:
-        data = request.json
-        url = data.get('url')
-        max_articles = data.get('maxArticles', 40)
-        output_path = data.get('outputPath', 'scraped_results')
-        concurrent = data.get('concurrent', 50)
-        
-        # Validate inputs
-        if not url:
-            return jsonify({'error': 'URL is required'}), 400
-            
-        # Reset global state
-        all_logs = []
-        progress_percentage = 0
-        current_status = 'Starting...'
-        job_completed = False
-        s3_upload_completed = False
-        s3_session_folder = None
-        
-        # Create and start job
-        current_job = ScrapingJob(url, max_articles, output_path, concurrent)
-        current_job.start()
-        scraping_active = True
+        job = job_manager.submit(**job_request_args(request.json or {}))
         
-        add_log(f"Scraping job started for {url}", "success")
-        
-        return jsonify({'message': 'Scraping started successfully'})
+        return jsonify({'message': 'Scraping started successfully', 'jobId': job.job_id, 'state': job.state})
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         error_msg = f"Error starting scraping: {str(e)}"
         add_log(error_msg, "error")
@@ -276,106 +881,119 @@ def start_scraping():
 
 @app.route('/stop_scraping', methods=['POST'])
 def stop_scraping():
-    """Stop the current scraping job"""
-    global scraping_active, current_job, current_status
+    """Stop the given job (jobId in the body) or the most recent one"""
+    job = resolve_job((request.get_json(silent=True) or {}).get('jobId'))
     
-    if not scraping_active or not current_job:
+    if not job or job.state not in ('queued', 'running'):
         return jsonify({'error': 'No active scraping job'}), 400
     
     try:
-        current_job.stop()
-        scraping_active = False
-        current_status = 'Stopped by user'
-        add_log("Scraping stopped by user", "warning")
+        job.stop()
         
-        return jsonify({'message': 'Scraping stopped successfully'})
+        return jsonify({'message': 'Scraping stopped successfully', 'jobId': job.job_id})
         
     except Exception as e:
         error_msg = f"Error stopping scraping: {str(e)}"
-        add_log(error_msg, "error")
+        job.add_log(error_msg, "error")
         return jsonify({'error': error_msg}), 500
 
 @app.route('/get_status', methods=['GET'])
 def get_status():
-    """Get current scraping status and logs"""
-    global all_logs, progress_percentage, current_status, job_completed, s3_upload_completed, s3_session_folder
+    """Get status and all buffered logs of ?job= or the latest job (prefer /logs or /events)"""
+    job = resolve_job(request.args.get('job'))
+    response_data = status_snapshot(job)
+    response_data['logs'], _ = (job.logs if job else server_logs).since(0)
     
-    response_data = {
-        'progress': progress_percentage,
-        'status': current_status,
-        'completed': job_completed,
-        'logs': all_logs,  # Send all logs so frontend can track properly
-        'isActive': scraping_active,
-        's3_upload_completed': s3_upload_completed,
-        's3_session_folder': s3_session_folder
-    }
+    return jsonify(response_data)
+
+@app.route('/logs', methods=['GET'])
+def get_logs():
+    """Status plus only the log entries after ?since=<seq> for ?job= or the latest job"""
+    job = resolve_job(request.args.get('job'))
+    buffer = job.logs if job else server_logs
+    since = parse_cursor(request.args.get('since'), buffer)
+    logs, dropped = buffer.since(since)
+    
+    response_data = status_snapshot(job)
+    response_data.update({
+        'logs': logs,
+        'next': logs[-1]['seq'] if logs else since,
+        'dropped': dropped
+    })
     
     return jsonify(response_data)
 
+@app.route('/events', methods=['GET'])
+def events():
+    """Server-Sent Events for ?job= or the latest job: new log entries as 'log' events, progress changes as 'status' events"""
+    job = resolve_job(request.args.get('job'))
+    buffer = job.logs if job else server_logs
+    since = parse_cursor(request.headers.get('Last-Event-ID', request.args.get('since')), buffer)
+    
+    def stream():
+        cursor = since
+        last_status = None
+        idle_since = time.time()
+        
+        while True:
+            logs, dropped = buffer.since(cursor)
+            if dropped:
+                yield f"event: dropped\ndata: {json.dumps({'count': dropped})}\n\n"
+            for entry in logs:
+                cursor = entry['seq']
+                yield f"id: {cursor}\nevent: log\ndata: {json.dumps(entry)}\n\n"
+                
+            snapshot = status_snapshot(job)
+            if snapshot != last_status:
+                last_status = snapshot
+                yield f"event: status\ndata: {json.dumps(snapshot)}\n\n"
+                idle_since = time.time()
+            elif logs:
+                idle_since = time.time()
+            elif time.time() - idle_since >= SSE_KEEPALIVE_SECONDS:
+                yield ": keepalive\n\n"
+                idle_since = time.time()
+                
+            # Progress changes without a log line are picked up on the timeout
+            buffer.wait(cursor, timeout=1.0)
+    
+    return Response(stream_with_context(stream()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
 @app.route('/test_connection', methods=['GET'])
 def test_connection():
-    """Test EC2 connection"""
+    """Test EC2 connection (?host= picks an instance from EC2_HOSTS)"""
+    host = request.args.get('host', EC2_HOSTS[0])
+    if host not in EC2_HOSTS:
+        return jsonify({'status': 'error', 'message': f'Unknown EC2 host {host}'}), 400
+    
     try:
-        ssh_client = paramiko.SSHClient()
-        ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        ssh_client.connect(
-            hostname=EC2_HOST,
-            username=EC2_USER,
-            key_filename=EC2_KEY_PATH,
-            timeout=10
-        )
-        
-        # Test if scraper exists
-        stdin, stdout, stderr = ssh_client.exec_command(f"ls -la {EC2_SCRAPER_PATH}")
-        result = stdout.read().decode()
-        
-        ssh_client.close()
+        # Test if scraper exists (pooled connection: no new handshake on repeated checks)
+        _, result = ssh_pool.exec_command(host, f"ls -la {EC2_SCRAPER_PATH}", timeout=10)
         
         if "ultimate_scraper_v2.py" in result:
-            return jsonify({'status': 'connected', 'message': 'EC2 connection successful'})
+            return jsonify({'status': 'connected', 'message': 'EC2 connection successful', 'ssh_pool': ssh_pool.stats()})
         else:
             return jsonify({'status': 'error', 'message': 'Scraper not found on EC2'}), 500
             
     except Exception as e:
         return jsonify({'status': 'error', 'message': f'Connection failed: {str(e)}'}), 500
 
-@app.route('/download_from_s3', methods=['POST'])
-def download_from_s3():
-    """Download articles from S3 to local output path"""
-    global s3_session_folder, s3_upload_completed
-    
-    if not s3_upload_completed or not s3_session_folder:
-        return jsonify({'error': 'No S3 session available for download'}), 400
-    
+def download_via_ec2(job, local_output):
+    """Legacy path: aws s3 sync onto the job's EC2 host, then parallel SFTP to this machine"""
+    ssh_client = ssh_pool.acquire(job.host)
     try:
-        data = request.json
-        output_path = data.get('outputPath', 'scraped_results')
-        
-        add_log("Starting download from S3...", "info")
-        
-        # Create local output directory
-        local_output = Path(output_path)
-        local_output.mkdir(parents=True, exist_ok=True)
-        
-        # Connect to EC2 and download from S3
-        ssh_client = paramiko.SSHClient()
-        ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        ssh_client.connect(
-            hostname=EC2_HOST,
-            username=EC2_USER,
-            key_filename=EC2_KEY_PATH,
-            timeout=30
-        )
-        
         # Create temporary download directory on EC2
-        temp_download_path = f"/home/ec2-user/temp_download_{int(time.time())}"
+        temp_download_path = f"/home/ec2-user/temp_download_{int(time.time())}_{job.job_id}"
         download_command = f"""
         mkdir -p {temp_download_path} &&
-        aws s3 sync s3://{S3_BUCKET_NAME}/{s3_session_folder}/ {temp_download_path}/ &&
+        aws s3 sync s3://{S3_BUCKET_NAME}/{job.session_id}/ {temp_download_path}/ &&
         echo "S3_DOWNLOAD_COMPLETED"
         """
         
-        add_log("Downloading from S3 to EC2...", "info")
+        job.add_log("Downloading from S3 to EC2...", "info")
         stdin, stdout, stderr = ssh_client.exec_command(download_command)
         
         # Monitor download progress
@@ -385,57 +1003,82 @@ def download_from_s3():
                 break
             line = line.strip()
             if line:
-                add_log(line, "info")
+                job.add_log(line, "info")
                 if "S3_DOWNLOAD_COMPLETED" in line:
                     break
         
-        # Now transfer from EC2 to local
-        add_log("Transferring files from EC2 to local machine...", "info")
-        sftp = ssh_client.open_sftp()
-        
-        def download_recursive(remote_dir, local_dir):
-            try:
-                remote_items = sftp.listdir_attr(remote_dir)
-                for item in remote_items:
-                    remote_item_path = f"{remote_dir}/{item.filename}"
-                    local_item_path = local_dir / item.filename
-                    
-                    if item.st_mode & 0o40000:  # Directory
-                        local_item_path.mkdir(exist_ok=True)
-                        download_recursive(remote_item_path, local_item_path)
-                    else:  # File
-                        sftp.get(remote_item_path, str(local_item_path))
-                        add_log(f"Downloaded: {item.filename}", "success")
-                        
-            except Exception as e:
-                add_log(f"Download error: {str(e)}", "error")
-        
-        download_recursive(temp_download_path, local_output)
+        # Now transfer from EC2 to local over parallel SFTP channels
+        job.add_log("Transferring files from EC2 to local machine...", "info")
+        transfer = ParallelSFTPDownloader(job.host).download_tree(temp_download_path, local_output, job.add_log)
         
         # Clean up temporary directory on EC2
         ssh_client.exec_command(f"rm -rf {temp_download_path}")
-        ssh_client.close()
+        return transfer
         
-        add_log(f"All files downloaded successfully to: {output_path}", "success")
+    finally:
+        ssh_pool.release(ssh_client)
+
+@app.route('/download_from_s3', methods=['POST'])
+def download_from_s3():
+    """
+    Download a job's articles (jobId in the body, default the latest job) from S3 to local output path.
+    'method': 'direct' (boto3 on this machine, default S3_DOWNLOAD_METHOD) or 'ec2' (via the EC2 host).
+    """
+    data = request.json or {}
+    job = resolve_job(data.get('jobId'))
+    
+    if not job or not job.s3_upload_completed:
+        return jsonify({'error': 'No S3 session available for download'}), 400
+    
+    try:
+        output_path = data.get('outputPath', job.output_path)
+        method = data.get('method', S3_DOWNLOAD_METHOD)
+        
+        job.add_log("Starting download from S3...", "info")
         
-        return jsonify({'message': f'Files downloaded successfully to {output_path}'})
+        # Create local output directory
+        local_output = Path(output_path)
+        local_output.mkdir(parents=True, exist_ok=True)
+        
+        transfer = None
+        if method == 'direct':
+            try:
+                job.add_log(f"Downloading directly from s3://{S3_BUCKET_NAME}/{job.session_id}/", "info")
+                transfer = S3DirectDownloader().download_prefix(f"{job.session_id}/", local_output, job.add_log)
+                transfer['method'] = 'direct'
+            except (BotoCoreError, ClientError) as e:
+                # No local AWS credentials/permissions: the EC2 instance role still has access
+                job.add_log(f"Direct S3 download unavailable ({str(e)}), falling back to EC2 transfer", "warning")
+        
+        if transfer is None:
+            transfer = download_via_ec2(job, local_output)
+            transfer['method'] = 'ec2'
+        
+        job.add_log(f"Downloaded {transfer['downloaded']} files ({transfer['bytes'] / 1048576:.1f} MB, "
+                    f"{transfer['mbPerSecond']} MB/s), skipped {transfer['skipped']} unchanged, "
+                    f"{transfer['failed']} failed", "warning" if transfer['failed'] else "success")
+        if not transfer['failed']:
+            job.add_log(f"All files downloaded successfully to: {output_path}", "success")
+        
+        return jsonify({'message': f'Files downloaded successfully to {output_path}', 'transfer': transfer})
         
     except Exception as e:
         error_msg = f"Error downloading from S3: {str(e)}"
-        add_log(error_msg, "error")
+        job.add_log(error_msg, "error")
         return jsonify({'error': error_msg}), 500
 
 if __name__ == '__main__':
     # Initialize logs
     add_log("Web server starting...", "info")
     add_log("Ultimate Scraper V2 Web Interface Ready", "success")
-    add_log(f"EC2 Instance: {EC2_HOST}", "info")
+    add_log(f"EC2 Instances: {', '.join(EC2_HOSTS)} ({MAX_PARALLEL_JOBS} parallel jobs)", "info")
     
     print("=" * 80)
     print("🚀 ULTIMATE SCRAPER V2 - WEB INTERFACE")
     print("=" * 80)
     print(f"🌐 Open your browser and go to: http://localhost:5000")
-    print(f"☁️  EC2 Instance: {EC2_HOST}")
+    print(f"☁️  EC2 Instances: {', '.join(EC2_HOSTS)}")
+    print(f"⚙️  Parallel jobs: {MAX_PARALLEL_JOBS}")
     print(f"📁 Default Output: scraped_results/")
     print("=" * 80)
     
@@ -443,7 +1086,9 @@ if __name__ == '__main__':
         app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
     except KeyboardInterrupt:
         print("\n\n🛑 Server stopped by user")
-        if current_job and scraping_active:
-            current_job.stop()
+        for job in job_manager.list():
+            if job.state in ('queued', 'running'):
+                job.stop()
+        ssh_pool.close_all()
     except Exception as e:
         print(f"\n❌ Server error: {e}")